@@ -3,29 +3,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import partial
 
 import aiohttp
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_WEBHOOK_ID, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_API_KEY,
+    CONF_API_SECRET,
     CONF_API_TOKEN,
     CONF_BOARDS,
+    CONF_CARD_ATTRIBUTES,
+    CONF_CARD_DETAILS,
+    CONF_DETAIL_LABEL,
+    CONF_FULL_REFRESH_CYCLES,
+    CONF_PARALLEL_FETCHES,
+    CONF_PUSH_UPDATES,
+    CONF_REFRESH_COOLDOWN,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_CARD_ATTRIBUTES,
+    DEFAULT_FULL_REFRESH_CYCLES,
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REFRESH_COOLDOWN,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
-    TRELLO_API_BASE,
+    PUSH_RECONCILE_INTERVAL,
 )
+from .api import (
+    TrelloApiClient,
+    TrelloApiError,
+    TrelloAuthError,
+    async_get_client,
+    async_release_client,
+)
+from .details import CardDetailTier
+from .flow import FlowTracker
+from .hub import TrelloFetchHub, async_get_fetch_hub
+from .index import CardSearchIndex, TrelloIndex, build_index, build_search_index
+from .metrics import PhaseTimer
+from .model import (
+    ACTIONS_PAGE_LIMIT,
+    LIST_FIELDS,
+    BoardSyncState,
+    TrelloBoard,
+    board_sync_state,
+    collect_changes,
+    copy_board,
+    normalize_board,
+    patch_card,
+    remove_card,
+    replace_lists,
+    snapshot_from_storage,
+    snapshot_to_storage,
+    upsert_card,
+)
+from .push import TrelloPushManager
+from .schedule import PollScheduler
+from .services import async_setup_services, async_unload_services
+from .writes import TrelloWriteQueue
 
 _LOGGER = logging.getLogger(__name__)
 
+# Allows for rate limit waits and retries inside the API client
+BOARD_FETCH_TIMEOUT = 120
+
+# Boards are refreshed from their actions feed between full snapshots
+FULL_RESYNC_INTERVAL = timedelta(hours=1)
+
+# The last snapshot is kept on disk so sensors are available at startup
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+
+# Card positions and the card move history are kept in a store of their own
+FLOW_STORAGE_VERSION = 1
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 # Try to use asyncio.timeout (Python 3.11+) or fall back to async_timeout
@@ -51,93 +115,200 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Trello from a config entry."""
     api_key = entry.data[CONF_API_KEY]
     api_token = entry.data[CONF_API_TOKEN]
-    boards = entry.data.get(CONF_BOARDS, [])
+    boards = _entry_boards(entry)
     update_interval = entry.options.get(
         CONF_UPDATE_INTERVAL, 
         entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     )
+    parallel_fetches = entry.options.get(CONF_PARALLEL_FETCHES, DEFAULT_PARALLEL_FETCHES)
+    full_refresh_cycles = entry.options.get(
+        CONF_FULL_REFRESH_CYCLES, DEFAULT_FULL_REFRESH_CYCLES
+    )
+    refresh_cooldown = entry.options.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN)
 
-    session = async_get_clientsession(hass)
-    
-    # Test the connection
-    try:
-        async with async_timeout(10):
-            url = f"{TRELLO_API_BASE}/members/me"
-            params = {"key": api_key, "token": api_token}
-            async with session.get(url, params=params) as response:
-                if response.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid API key or token")
-                elif response.status != 200:
-                    raise ConfigEntryNotReady(f"Trello API returned status {response.status}")
-                await response.json()
-    except aiohttp.ClientError as err:
-        raise ConfigEntryNotReady(f"Unable to connect to Trello: {err}") from err
-    except (TimeoutError, asyncio.TimeoutError) as err:
-        raise ConfigEntryNotReady(f"Timeout connecting to Trello: {err}") from err
+    client = async_get_client(hass, api_key, api_token)
+    # Also runs when setup fails, so a client is never left behind
+    entry.async_on_unload(partial(_async_release_client, hass, entry, client))
+    detail_tier = None
+    if entry.options.get(CONF_CARD_DETAILS, False):
+        detail_tier = CardDetailTier(client, entry.options.get(CONF_DETAIL_LABEL) or None)
 
     coordinator = TrelloDataUpdateCoordinator(
         hass,
-        session=session,
-        api_key=api_key,
-        api_token=api_token,
+        client=client,
         boards=boards,
         update_interval=timedelta(minutes=update_interval),
+        parallel_fetches=parallel_fetches,
+        full_refresh_cycles=full_refresh_cycles,
+        refresh_cooldown=refresh_cooldown,
+        hub=async_get_fetch_hub(hass),
+        detail_tier=detail_tier,
+        store=Store(hass, STORAGE_VERSION, _storage_key(entry)),
+        flow_store=Store(hass, FLOW_STORAGE_VERSION, _flow_storage_key(entry)),
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
+    await coordinator.async_load_flow()
+    if await coordinator.async_load_snapshot():
+        # Sensors start from the stored snapshot while Trello is refreshed
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_initial_refresh_{entry.entry_id}"
+        )
+    else:
+        # Test the connection
+        try:
+            async with async_timeout(10):
+                await client.get("/members/me")
+        except TrelloAuthError as err:
+            raise ConfigEntryAuthFailed("Invalid API key or token") from err
+        except TrelloApiError as err:
+            raise ConfigEntryNotReady(str(err)) from err
+        except aiohttp.ClientError as err:
+            raise ConfigEntryNotReady(f"Unable to connect to Trello: {err}") from err
+        except (TimeoutError, asyncio.TimeoutError) as err:
+            raise ConfigEntryNotReady(f"Timeout connecting to Trello: {err}") from err
+
+        await coordinator.async_config_entry_first_refresh()
+
+    coordinator.other_options = _entry_settings(entry)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if entry.options.get(CONF_PUSH_UPDATES, False):
+        await _async_setup_push(hass, entry, coordinator)
 
-    # Register services
-    async def handle_refresh(call):
-        """Handle the refresh service call."""
-        config_entry_id = call.data.get("config_entry_id")
-        
-        if config_entry_id:
-            # Refresh specific entry
-            if config_entry_id in hass.data[DOMAIN]:
-                _LOGGER.info("Refreshing Trello data for config entry: %s", config_entry_id)
-                await hass.data[DOMAIN][config_entry_id].async_refresh()
-            else:
-                _LOGGER.error("Config entry ID not found: %s", config_entry_id)
-        else:
-            # Refresh all entries
-            _LOGGER.info("Refreshing all Trello integrations")
-            for coordinator in hass.data[DOMAIN].values():
-                if isinstance(coordinator, TrelloDataUpdateCoordinator):
-                    await coordinator.async_refresh()
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    # Only register the service once (first entry)
-    if not hass.services.has_service(DOMAIN, "refresh"):
-        hass.services.async_register(DOMAIN, "refresh", handle_refresh)
-        _LOGGER.info("Registered Trello refresh service")
+    async_setup_services(hass)
 
     return True
 
 
+async def _async_setup_push(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: TrelloDataUpdateCoordinator
+) -> None:
+    """Switch an entry to webhook push updates with a slow reconciliation poll."""
+    api_secret = entry.options.get(CONF_API_SECRET)
+    if not api_secret:
+        _LOGGER.warning("Trello push updates need the API secret, falling back to polling")
+        return
+
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id is None:
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+
+    manager = TrelloPushManager(hass, entry, coordinator, webhook_id, api_secret)
+    if not await manager.async_setup():
+        return
+
+    entry.async_on_unload(manager.async_unload)
+    coordinator.push_manager = manager
+    coordinator.update_interval = max(coordinator.update_interval, PUSH_RECONCILE_INTERVAL)
+    _LOGGER.info(
+        "Trello push updates enabled, reconciling every %s", coordinator.update_interval
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
         
-        # Unregister service if this was the last entry
+        # Unregister services if this was the last entry
         if not hass.data[DOMAIN]:
-            if hass.services.has_service(DOMAIN, "refresh"):
-                hass.services.async_remove(DOMAIN, "refresh")
-                _LOGGER.info("Unregistered Trello refresh service")
+            async_unload_services(hass)
 
     return unload_ok
 
 
+@callback
+def _async_release_client(hass: HomeAssistant, entry: ConfigEntry, client: TrelloApiClient) -> None:
+    """Release an unloaded entry's client unless another loaded entry shares it."""
+    # Unloading the platforms runs this before the entry's coordinator is removed
+    if not any(
+        coordinator.client is client
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if entry_id != entry.entry_id
+    ):
+        async_release_client(hass, client)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot and card flow history of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry)).async_remove()
+    await Store(hass, FLOW_STORAGE_VERSION, _flow_storage_key(entry)).async_remove()
+
+
+def _storage_key(entry: ConfigEntry) -> str:
+    """Return the storage key for an entry's snapshot."""
+    return f"{DOMAIN}.{entry.entry_id}"
+
+
+def _flow_storage_key(entry: ConfigEntry) -> str:
+    """Return the storage key for an entry's card flow history."""
+    return f"{DOMAIN}.{entry.entry_id}.flow"
+
+
+def _entry_boards(entry: ConfigEntry) -> list[str]:
+    """Return the monitored boards, as changed in the options or chosen at setup."""
+    return list(entry.options.get(CONF_BOARDS, entry.data.get(CONF_BOARDS, [])))
+
+
+def _entry_settings(entry: ConfigEntry) -> dict:
+    """Return the options other than the boards as the entry uses them, defaults included.
+
+    Options are empty until they are first saved, and then hold every
+    field of the form, so only values with defaults applied compare equal.
+    """
+    return {
+        **{key: value for key, value in entry.options.items() if key != CONF_BOARDS},
+        CONF_UPDATE_INTERVAL: entry.options.get(
+            CONF_UPDATE_INTERVAL, entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        ),
+        CONF_PARALLEL_FETCHES: entry.options.get(CONF_PARALLEL_FETCHES, DEFAULT_PARALLEL_FETCHES),
+        CONF_FULL_REFRESH_CYCLES: entry.options.get(
+            CONF_FULL_REFRESH_CYCLES, DEFAULT_FULL_REFRESH_CYCLES
+        ),
+        CONF_REFRESH_COOLDOWN: entry.options.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN),
+        CONF_PUSH_UPDATES: entry.options.get(CONF_PUSH_UPDATES, False),
+        CONF_API_SECRET: entry.options.get(CONF_API_SECRET) or None,
+        CONF_CARD_ATTRIBUTES: entry.options.get(CONF_CARD_ATTRIBUTES, DEFAULT_CARD_ATTRIBUTES),
+        CONF_CARD_DETAILS: entry.options.get(CONF_CARD_DETAILS, False),
+        CONF_DETAIL_LABEL: entry.options.get(CONF_DETAIL_LABEL) or None,
+    }
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Apply changed options, reloading the entry unless only the boards changed."""
+    coordinator: TrelloDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is None or _entry_settings(entry) != coordinator.other_options:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    boards = _entry_boards(entry)
+    removed = set(coordinator.board_ids) - set(boards)
+    await coordinator.async_set_boards(boards)
+
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if any(
+            entity.unique_id == f"{entry.entry_id}_{board_id}"
+            or entity.unique_id.startswith(f"{entry.entry_id}_{board_id}_")
+            for board_id in removed
+        ):
+            registry.async_remove(entity.entity_id)
+
+    if coordinator.push_manager is not None:
+        try:
+            await coordinator.push_manager.async_sync_webhooks()
+        except TrelloApiError as err:
+            _LOGGER.error("Unable to update Trello webhooks: %s", err)
 
 
 class TrelloDataUpdateCoordinator(DataUpdateCoordinator):
@@ -146,159 +317,564 @@ class TrelloDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
         hass: HomeAssistant,
-        session: aiohttp.ClientSession,
-        api_key: str,
-        api_token: str,
+        client: TrelloApiClient,
         boards: list[str],
         update_interval: timedelta,
+        parallel_fetches: int = DEFAULT_PARALLEL_FETCHES,
+        full_refresh_cycles: int = DEFAULT_FULL_REFRESH_CYCLES,
+        refresh_cooldown: float = DEFAULT_REFRESH_COOLDOWN,
+        hub: TrelloFetchHub | None = None,
+        detail_tier: CardDetailTier | None = None,
+        store: Store | None = None,
+        flow_store: Store | None = None,
     ) -> None:
         """Initialize."""
-        self.session = session
-        self.api_key = api_key
-        self.api_token = api_token
+        self.client = client
+        self.hub = hub or TrelloFetchHub()
+        self.detail_tier = detail_tier
+        self.store = store
+        self.flow_store = flow_store
+        self.flow = FlowTracker()
+        self.writes = TrelloWriteQueue(client)
         self.board_ids = boards
+        self._fetch_semaphore = asyncio.Semaphore(parallel_fetches)
+        self._sync_states: dict[str, BoardSyncState] = {}
+        self.scheduler = PollScheduler(boards)
+        self.full_refresh_cycles = full_refresh_cycles
+        self._cycles_since_full = 0
+        self._board_activity: dict[str, str] = {}
+        self._board_refreshes: dict[str, asyncio.Task] = {}
+        # Bumped whenever a push or write publishes a board outside a refresh
+        self._board_versions: dict[str, int] = {}
+        self.push_manager: TrelloPushManager | None = None
+        # Options other than the boards with defaults applied, to tell whether
+        # a change needs a reload
+        self.other_options: dict = {}
+        self.index = TrelloIndex()
+        self._search_index: tuple[dict | None, CardSearchIndex] | None = None
+        self.timings = PhaseTimer()
+        self.last_refreshed: datetime | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Calls arriving while a refresh runs share it, and calls during
+            # the cooldown after it are folded into one follow-up refresh
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=refresh_cooldown, immediate=True
+            ),
         )
 
+    async def async_load_snapshot(self) -> bool:
+        """Load the last stored snapshot as the current data, if there is one."""
+        if self.store is None:
+            return False
+        try:
+            stored = await self.store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Unable to load stored Trello snapshot: %s", err)
+            return False
+        if not stored:
+            return False
+
+        self.data = snapshot_from_storage(stored, self.board_ids)
+        with self.timings.time("index"):
+            self.index = build_index(self.data, self.board_ids)
+        _LOGGER.debug("Loaded stored snapshot with %d boards", len(self.data["boards"]))
+        return True
+
+    async def async_load_flow(self) -> None:
+        """Load the stored card positions and move history."""
+        if self.flow_store is None:
+            return
+        try:
+            stored = await self.flow_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Unable to load stored Trello card flow: %s", err)
+            return
+        if stored:
+            self.flow = FlowTracker.from_storage(stored, self.board_ids)
+
+    def _track_flow(self, data: dict) -> None:
+        """Record the card moves of the boards that changed since the current data."""
+        previous = self.data.get("boards", {}) if self.data else {}
+        now = dt_util.utcnow().timestamp()
+        changed = [
+            board
+            for board_id, board in data.get("boards", {}).items()
+            if board is not previous.get(board_id) or board_id not in self.flow.boards
+        ]
+        if not changed:
+            return
+        with self.timings.time("flow"):
+            moves = sum(self.flow.update_board(board, now) for board in changed)
+        if moves:
+            _LOGGER.debug("Recorded %d card moves on %d boards", moves, len(changed))
+        if self.flow_store is not None:
+            self.flow_store.async_delay_save(self.flow.to_storage, STORAGE_SAVE_DELAY)
+
+    def _schedule_save(self, data: dict) -> None:
+        """Write the snapshot to disk after a short delay."""
+        if self.store is not None:
+            self.store.async_delay_save(lambda: snapshot_to_storage(data), STORAGE_SAVE_DELAY)
+
     async def _async_update_data(self) -> dict:
         """Fetch data from Trello."""
         try:
-            return await self._fetch_data()
-        except aiohttp.ClientResponseError as err:
-            if err.status == 401:
-                raise ConfigEntryAuthFailed("Authentication failed") from err
-            raise UpdateFailed(f"Error communicating with Trello: {err}") from err
+            with self.timings.time("refresh"):
+                versions: dict[str, int] = {}
+                data = await self._fetch_data(versions)
+                await self._async_update_details(data)
+                self._keep_published_boards(data, versions)
+                self._track_flow(data)
+                with self.timings.time("index"):
+                    self.index = build_index(data, self.board_ids)
+            self.last_refreshed = dt_util.utcnow()
+            self._schedule_save(data)
+            return data
+        except TrelloAuthError as err:
+            raise ConfigEntryAuthFailed("Authentication failed") from err
         except Exception as err:
             raise UpdateFailed(f"Error communicating with Trello: {err}") from err
 
-    async def _fetch_data(self) -> dict:
-        """Fetch data from Trello API."""
+    async def _async_update_details(self, data: dict) -> None:
+        """Attach card details to the data, fetching them when a pass is due."""
+        if self.detail_tier is None:
+            return
+        if self.detail_tier.due:
+            try:
+                with self.timings.time("details"):
+                    await self.detail_tier.async_refresh(data["boards"], dt_util.utcnow())
+            except TrelloAuthError:
+                raise
+            except Exception as err:
+                # Details are optional, so keep the last ones rather than fail the refresh
+                _LOGGER.warning("Unable to fetch Trello card details: %s", err)
+        data["card_details"] = self.detail_tier.details
+
+    async def _fetch_data(self, versions: dict[str, int]) -> dict:
+        """Fetch data from Trello API.
+
+        versions receives the version of each board when this refresh read
+        it, so boards published while it ran can be told apart afterwards.
+        """
         _LOGGER.info("Starting Trello data fetch for %d monitored boards", len(self.board_ids))
+        started = time.monotonic()
         data = {"boards": {}, "all_boards": []}
-        params = {"key": self.api_key, "token": self.api_token}
+        activity: dict[str, str] = {}
 
-        # First, fetch all available boards for the account sensor
+        # First, fetch all available boards for the account sensor. The same
+        # call returns each board's last activity, which tells which monitored
+        # boards can be skipped because nothing happened on them.
         try:
-            async with async_timeout(15):
-                boards_url = f"{TRELLO_API_BASE}/members/me/boards"
-                boards_params = {**params, "filter": "all", "fields": "id,name,url,closed"}
-                _LOGGER.debug("Fetching all boards from Trello account")
-                async with self.session.get(boards_url, params=boards_params) as response:
-                    if response.status == 200:
-                        all_boards_data = await response.json()
-                        _LOGGER.debug("Retrieved %d total boards from Trello", len(all_boards_data))
-                        data["all_boards"] = [
-                            {
-                                "id": board["id"],
-                                "name": board["name"],
-                                "url": board.get("url", ""),
-                                "closed": board.get("closed", False),
-                            }
-                            for board in all_boards_data
-                        ]
-                    else:
-                        _LOGGER.warning("Failed to fetch all boards, status: %s", response.status)
+            _LOGGER.debug("Fetching all boards from Trello account")
+            with self.timings.time("account_boards"):
+                all_boards_data = await self.client.get(
+                    "/members/me/boards",
+                    {"filter": "all", "fields": "id,name,url,closed,dateLastActivity"},
+                )
+            _LOGGER.debug("Retrieved %d total boards from Trello", len(all_boards_data))
+            data["all_boards"] = [
+                {
+                    "id": board["id"],
+                    "name": board["name"],
+                    "url": board.get("url", ""),
+                    "closed": board.get("closed", False),
+                }
+                for board in all_boards_data
+            ]
+            activity = {
+                board["id"]: board["dateLastActivity"]
+                for board in all_boards_data
+                if board.get("dateLastActivity")
+            }
+        except TrelloAuthError:
+            raise
+        except TrelloApiError as err:
+            _LOGGER.warning("Failed to fetch all boards: %s", err)
         except (TimeoutError, asyncio.TimeoutError):
             _LOGGER.error("Timeout fetching all boards list")
         except Exception as err:
             _LOGGER.error("Error fetching all boards list: %s", err, exc_info=True)
 
-        # Now fetch detailed data for selected boards
+        # Now fetch detailed data for the boards that are due concurrently.
+        # Each board handles its own errors so one failure never cancels the
+        # others. Boards that are not due keep their last snapshot.
+        now = dt_util.utcnow()
+        previous_boards = self.data.get("boards", {}) if self.data else {}
+        due = self.scheduler.due_boards(now, self.update_interval)
+        polled = [
+            board_id
+            for board_id in self.board_ids
+            if board_id in due or board_id not in previous_boards
+        ]
+
+        self._cycles_since_full += 1
+        if self._cycles_since_full >= self.full_refresh_cycles:
+            self._cycles_since_full = 0
+        else:
+            idle = [
+                board_id
+                for board_id in polled
+                if board_id in previous_boards
+                and board_id in activity
+                and activity[board_id] == self._board_activity.get(board_id)
+            ]
+            for board_id in idle:
+                self.scheduler.record_poll(board_id, now, self.update_interval, changed=False)
+            polled = [board_id for board_id in polled if board_id not in idle]
+
+        results = await asyncio.gather(
+            *(self._fetch_board(board_id, versions) for board_id in polled),
+            return_exceptions=True,
+        )
+        fetched = dict(zip(polled, results))
+        # The options flow can change the boards while this refresh waits, and
+        # pushes and writes can publish boards, so assemble the boards from the
+        # current data. A board added meanwhile was fetched by async_set_boards.
+        latest_boards = self.data.get("boards", {}) if self.data else {}
         for board_id in self.board_ids:
-            try:
-                async with async_timeout(30):
-                    # Fetch board info
-                    board_url = f"{TRELLO_API_BASE}/boards/{board_id}"
-                    async with self.session.get(board_url, params=params) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching board %s: status %s", board_id, response.status)
-                            continue
-                        board_data = await response.json()
-
-                    # Fetch lists
-                    lists_url = f"{TRELLO_API_BASE}/boards/{board_id}/lists"
-                    async with self.session.get(lists_url, params=params) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching lists for board %s: status %s", board_id, response.status)
-                            continue
-                        lists_data = await response.json()
-
-                    board_info = {
-                        "id": board_data["id"],
-                        "name": board_data["name"],
-                        "url": board_data.get("url", ""),
-                        "closed": board_data.get("closed", False),
-                        "lists": {},
-                    }
-
-                    # Fetch cards for each list
-                    for trello_list in lists_data:
-                        list_id = trello_list["id"]
-                        
-                        # Fetch cards for this list
-                        cards_url = f"{TRELLO_API_BASE}/lists/{list_id}/cards"
-                        cards_params = {
-                            **params,
-                            "fields": "id,name,url,closed,due,dueComplete,desc,labels,idMembers,badges",
-                            "filter": "open",
-                            "members": "true",
-                            "member_fields": "fullName,username",
-                        }
-                        
-                        async with self.session.get(cards_url, params=cards_params) as response:
-                            if response.status != 200:
-                                _LOGGER.warning("Error fetching cards for list %s: status %s", list_id, response.status)
-                                cards_data = []
-                            else:
-                                cards_data = await response.json()
-
-                        card_list = []
-                        for card in cards_data:
-                            card_info = {
-                                "id": card["id"],
-                                "name": card["name"],
-                                "url": card.get("url", ""),
-                                "closed": card.get("closed", False),
-                                "due": card.get("due"),
-                                "due_complete": card.get("dueComplete", False),
-                                "description": card.get("desc", "")[:512],
-                                "labels": [label["name"] for label in card.get("labels", []) if label.get("name")],
-                                "members": [member.get("fullName", member.get("username", "Unknown")) 
-                                           for member in card.get("members", [])],
-                                "checklist_items": card.get("badges", {}).get("checkItems", 0),
-                                "checklist_items_checked": card.get("badges", {}).get("checkItemsChecked", 0),
-                                "attachments": card.get("badges", {}).get("attachments", 0),
-                                "comments": card.get("badges", {}).get("comments", 0),
-                            }
-                            card_list.append(card_info)
-
-                        board_info["lists"][list_id] = {
-                            "id": list_id,
-                            "name": trello_list["name"],
-                            "closed": trello_list.get("closed", False),
-                            "cards": card_list,
-                            "card_count": len(card_list),
-                        }
-
-                    board_info["list_count"] = len([l for l in board_info["lists"].values() if not l["closed"]])
-                    data["boards"][board_id] = board_info
-
-            except TimeoutError:
-                _LOGGER.error("Timeout fetching board %s", board_id)
-                continue
-            except Exception as err:
-                _LOGGER.error("Error fetching board %s: %s", board_id, err)
+            if board_id not in fetched:
+                board = latest_boards.get(board_id)
+                if board is not None:
+                    data["boards"][board_id] = board
+                    versions[board_id] = self._board_versions.get(board_id, 0)
                 continue
+            result = fetched[board_id]
+            if isinstance(result, BaseException):
+                _LOGGER.error("Error fetching board %s: %s", board_id, result)
+            elif result is not None:
+                data["boards"][board_id] = result
+                if board_id in activity:
+                    self._board_activity[board_id] = activity[board_id]
+                previous = previous_boards.get(board_id)
+                self.scheduler.record_poll(
+                    board_id,
+                    now,
+                    self.update_interval,
+                    changed=result is not previous and result != previous,
+                )
+        # Boards removed meanwhile may have been synced again by this refresh
+        for board_id in set(self._sync_states) - set(self.board_ids):
+            del self._sync_states[board_id]
 
         _LOGGER.info(
-            "Trello data fetch complete: %d total boards in account, %d monitored boards with data",
+            "Trello data fetch complete: %d total boards in account, %d monitored boards with data, %d polled in %.2fs",
             len(data.get("all_boards", [])),
-            len(data.get("boards", {}))
+            len(data.get("boards", {})),
+            len(polled),
+            time.monotonic() - started,
         )
+        _LOGGER.debug("Trello API client stats: %s", self.client.stats)
         return data
 
+    async def _fetch_board(
+        self, board_id: str, versions: dict[str, int] | None = None
+    ) -> TrelloBoard | None:
+        """Fetch a single board, waiting for a free fetch slot first.
+
+        When versions is given, the board's version as the fetch starts goes into it.
+        """
+        async with self._fetch_semaphore:
+            if versions is not None:
+                versions[board_id] = self._board_versions.get(board_id, 0)
+            started = time.monotonic()
+            try:
+                async with async_timeout(BOARD_FETCH_TIMEOUT):
+                    board = await self._sync_board(board_id)
+            except TrelloApiError as err:
+                _LOGGER.error("Error fetching board %s: %s", board_id, err)
+                return None
+            except (TimeoutError, asyncio.TimeoutError):
+                _LOGGER.error("Timeout fetching board %s", board_id)
+                return None
+            except Exception as err:
+                _LOGGER.error("Error fetching board %s: %s", board_id, err)
+                return None
+
+            elapsed = time.monotonic() - started
+            self.timings.record("board", elapsed)
+            _LOGGER.debug("Fetched board %s in %.2fs", board_id, elapsed)
+            return board
+
+    async def async_set_boards(self, board_ids: list[str]) -> None:
+        """Change the monitored boards, fetching only the added ones."""
+        added = [board_id for board_id in board_ids if board_id not in self.board_ids]
+        for board_id in set(self.board_ids) - set(board_ids):
+            self._sync_states.pop(board_id, None)
+            self._board_activity.pop(board_id, None)
+            self._board_versions.pop(board_id, None)
+            self.scheduler.schedules.pop(board_id, None)
+            self.flow.remove_board(board_id)
+        self.board_ids = list(board_ids)
+        self.scheduler.board_ids = self.board_ids
+        _LOGGER.info("Monitoring %d Trello boards, %d added", len(board_ids), len(added))
+
+        results = await asyncio.gather(*(self._fetch_board(board_id) for board_id in added))
+        current = (self.data or {}).get("boards", {})
+        fetched = dict(zip(added, results))
+        boards = {}
+        for board_id in self.board_ids:
+            board = fetched.get(board_id) or current.get(board_id)
+            if board is not None:
+                boards[board_id] = board
+
+        data = {**(self.data or {}), "boards": boards}
+        self._schedule_save(data)
+        self.async_set_updated_data(data)
+
+    async def async_request_full_refresh(self) -> None:
+        """Request a debounced refresh that syncs every board, whatever its schedule or activity."""
+        self.scheduler.poll_all()
+        self._cycles_since_full = self.full_refresh_cycles
+        if self.detail_tier is not None:
+            self.detail_tier.force()
+        await self.async_request_refresh()
+
+    async def async_refresh_board(self, board_id: str) -> None:
+        """Refresh a single board, sharing a refresh of it that is already running."""
+        task = self._board_refreshes.get(board_id)
+        if task is None:
+            task = self.hass.async_create_task(self._async_refresh_board(board_id))
+            self._board_refreshes[board_id] = task
+            task.add_done_callback(lambda _: self._board_refreshes.pop(board_id, None))
+        await asyncio.shield(task)
+
+    async def _async_refresh_board(self, board_id: str) -> None:
+        """Sync one board and publish it if it changed."""
+        previous = self.data.get("boards", {}).get(board_id) if self.data else None
+        board = await self._fetch_board(board_id)
+        if board is None or board is previous or not self.data:
+            return
+        self._publish_board(board_id, board)
+
+    @callback
+    def _publish_board(self, board_id: str, board: TrelloBoard, confirmed: bool = True) -> None:
+        """Replace one board in the current data and publish the result.
+
+        Unlike async_set_updated_data this leaves the refresh timer alone, so
+        a steady stream of pushes and writes does not keep postponing the
+        reconciliation poll. A board that is not confirmed by Trello yet is
+        left out of the card flow history.
+        """
+        data = {**self.data, "boards": {**self.data.get("boards", {}), board_id: board}}
+        self._board_versions[board_id] = self._board_versions.get(board_id, 0) + 1
+        self._schedule_save(data)
+        self._index_data(data, track_flow=confirmed)
+        self.data = data
+        self.async_update_listeners()
+
+    async def async_create_card(self, board_id: str, changes: dict) -> dict:
+        """Create a card and add it to the data without refreshing the board."""
+        payload = await self.writes.async_create_card(changes)
+        await self._async_apply_card_payload(board_id, payload)
+        return payload
+
+    async def async_update_card(self, board_id: str, card_id: str, changes: dict) -> dict:
+        """Update a card, publishing the expected result before Trello confirms it.
+
+        Once Trello answers, its copy of the card replaces the expected one.
+        If the write fails, a full snapshot of the board replaces the change.
+        """
+        self._patch_card(board_id, card_id, changes)
+        try:
+            payload = await self.writes.async_update_card(card_id, changes)
+        except Exception:
+            await self._async_resync_board(board_id)
+            raise
+        await self._async_apply_card_payload(board_id, payload)
+        return payload
+
+    async def _async_resync_board(self, board_id: str) -> None:
+        """Replace a board with a full snapshot, dropping unconfirmed changes.
+
+        A failed write leaves no action behind, so syncing from the actions
+        feed would keep the optimistic change. Without sync state the board
+        is fetched in full.
+        """
+        self._sync_states.pop(board_id, None)
+        board = await self._fetch_board(board_id)
+        if board is None or not self.data or board_id not in self.board_ids:
+            return
+        self._publish_board(board_id, board)
+
+    @callback
+    def _patch_card(self, board_id: str, card_id: str, changes: dict) -> None:
+        """Publish the expected result of a card update."""
+        previous = self.data.get("boards", {}).get(board_id) if self.data else None
+        if previous is None:
+            return
+        board = copy_board(previous)
+        if patch_card(board, card_id, changes):
+            # A rejected move would otherwise leave a move and its reversal in the history
+            self._publish_board(board_id, board, confirmed=False)
+
+    async def _async_apply_card_payload(self, board_id: str, payload: dict) -> None:
+        """Put a card returned by a write into the board it belongs to."""
+        previous = self.data.get("boards", {}).get(board_id) if self.data else None
+        state = self._sync_states.get(board_id)
+        if previous is None or state is None:
+            # Member names are only known once the board was synced
+            await self.async_refresh_board(board_id)
+            return
+
+        board = copy_board(previous)
+        new_state = replace(state, card_positions=dict(state.card_positions))
+        upsert_card(board, payload, new_state)
+        self._sync_states[board_id] = new_state
+        self._publish_board(board_id, board)
+
+    @callback
+    def _keep_published_boards(self, data: dict, versions: dict[str, int]) -> None:
+        """Keep the boards a push or write published after this refresh read them.
+
+        Such a board is newer than the refresh's copy. The sync state may
+        have been advanced by either, so the board is fetched in full on the
+        next refresh rather than trusted to the actions feed.
+        """
+        current = self.data.get("boards", {}) if self.data else {}
+        for board_id, version in versions.items():
+            if (
+                board_id not in data["boards"]
+                or board_id not in current
+                or self._board_versions.get(board_id, 0) == version
+            ):
+                continue
+            _LOGGER.debug("Keeping board %s as published during the refresh", board_id)
+            data["boards"][board_id] = current[board_id]
+            self._sync_states.pop(board_id, None)
+            self._board_activity.pop(board_id, None)
+            self.scheduler.schedules.pop(board_id, None)
+
+    @callback
+    def async_set_updated_data(self, data: dict) -> None:
+        """Rebuild the sensor index, then publish data set outside a refresh."""
+        self._index_data(data)
+        super().async_set_updated_data(data)
+
+    def card_search_index(self) -> CardSearchIndex:
+        """Return the card search index of the current data, building it if needed."""
+        if self._search_index is None or self._search_index[0] is not self.data:
+            data = self.data or {}
+            with self.timings.time("search_index"):
+                search_index = build_search_index(
+                    data.get("boards", {}), data.get("card_details", {})
+                )
+            # Every update replaces the data dict, so its identity tells if it changed
+            self._search_index = (self.data, search_index)
+        return self._search_index[1]
+
+    @callback
+    def _index_data(self, data: dict, track_flow: bool = True) -> None:
+        """Record card moves, unless told not to, and rebuild the sensor index for new data."""
+        if track_flow:
+            self._track_flow(data)
+        with self.timings.time("index"):
+            self.index = build_index(data, self.board_ids)
+        self.last_refreshed = dt_util.utcnow()
+
+    async def async_apply_pushed_action(self, board_id: str, action: dict) -> None:
+        """Patch the current data with an action pushed by a Trello webhook."""
+        if board_id not in self.board_ids or not self.data:
+            return
+
+        previous = self.data.get("boards", {}).get(board_id)
+        state = self._sync_states.get(board_id)
+        board = None
+        if previous is not None and state is not None:
+            # Leave the high-water mark alone: deliveries can arrive out of
+            # order, and the reconciliation poll must still see every action.
+            board = await self._apply_board_actions(
+                board_id, previous, state, [action], advance=False
+            )
+        if board is None:
+            board = await self._fetch_board(board_id)
+        if board is None or board is previous:
+            return
+        self._publish_board(board_id, board)
+
+    async def _sync_board(self, board_id: str) -> TrelloBoard:
+        """Bring a board up to date, from its actions feed when possible."""
+        previous = self.data.get("boards", {}).get(board_id) if self.data else None
+        state = self._sync_states.get(board_id)
+        if (
+            previous is not None
+            and state is not None
+            and time.monotonic() - state.synced_at < FULL_RESYNC_INTERVAL.total_seconds()
+        ):
+            params = {"limit": ACTIONS_PAGE_LIMIT, "fields": "id,type,data"}
+            if state.last_action_id:
+                params["since"] = state.last_action_id
+            with self.timings.time("actions"):
+                actions = await self.client.get(
+                    f"/boards/{board_id}/actions", params, cache=False
+                )
+            board = await self._apply_board_actions(board_id, previous, state, actions)
+            if board is not None:
+                return board
+
+        _LOGGER.debug("Fetching full snapshot of board %s", board_id)
+        with self.timings.time("board_snapshot"):
+            board_data = await self.hub.async_get_board_snapshot(self.client, board_id)
+        with self.timings.time("normalize"):
+            self._sync_states[board_id] = board_sync_state(board_data)
+            return normalize_board(board_data)
+
+    async def _apply_board_actions(
+        self,
+        board_id: str,
+        previous: TrelloBoard,
+        state: BoardSyncState,
+        actions: list[dict],
+        advance: bool = True,
+    ) -> TrelloBoard | None:
+        """Apply board actions, newest first, to the last snapshot.
+
+        Returns None when the board needs a full resync instead. When advance
+        is False the high-water mark is left alone, so the actions are seen
+        again by the next poll of the actions feed.
+        """
+        changes = collect_changes(actions)
+        if changes.needs_full_sync:
+            _LOGGER.debug("Board %s needs a full resync after %d actions", board_id, len(actions))
+            return None
+        if changes.empty:
+            if advance:
+                state.last_action_id = changes.last_action_id or state.last_action_id
+            return previous
+
+        # Patch copies so a failure part way through leaves the snapshot intact
+        board = copy_board(previous)
+        new_state = replace(state, card_positions=dict(state.card_positions))
+
+        if changes.refresh_lists:
+            with self.timings.time("lists"):
+                lists = await self.client.get(
+                    f"/boards/{board_id}/lists", {"filter": "open", "fields": LIST_FIELDS}
+                )
+            replace_lists(board, lists, new_state)
+
+        for card_id in changes.remove_cards:
+            remove_card(board, card_id, new_state)
+
+        card_ids = sorted(changes.refresh_cards)
+        with self.timings.time("cards"):
+            results = await self.client.batch([f"/cards/{card_id}" for card_id in card_ids])
+        for card_id, (status, card) in zip(card_ids, results):
+            if status == 200:
+                upsert_card(board, card, new_state)
+            elif status == 404:
+                remove_card(board, card_id, new_state)
+            else:
+                return None
+
+        if advance:
+            new_state.last_action_id = changes.last_action_id
+        self._sync_states[board_id] = new_state
+        _LOGGER.debug(
+            "Applied %d actions to board %s (%d cards refreshed, %d removed)",
+            len(actions), board_id, len(card_ids), len(changes.remove_cards),
+        )
+        return board
@@ -0,0 +1,445 @@
+"""Rate limited Trello REST API client."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import random
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import DATA_CLIENTS, TRELLO_API_BASE
+from .metrics import ApiMetrics, redact_path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Try to use asyncio.timeout (Python 3.11+) or fall back to async_timeout
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:
+    try:
+        from async_timeout import timeout as async_timeout
+    except ImportError:
+        # Last resort - create a simple timeout wrapper
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def async_timeout(seconds):
+            """Simple timeout context manager."""
+            try:
+                yield
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Timeout after {seconds} seconds")
+
+# Trello allows roughly 100 requests per 10 seconds for each token
+RATE_LIMIT_REQUESTS = 100
+RATE_LIMIT_PERIOD = 10
+
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# A POST that failed part way may already have been applied, so it is only
+# retried when Trello rejected it outright for exceeding the rate limit
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+
+# Trello accepts at most ten URLs per /batch request
+BATCH_SIZE = 10
+
+# Bounds for the conditional request cache. Only small, repeated GETs are
+# cached, see TrelloApiClient.get, so the bounds count response body bytes.
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Bodies larger than this are decoded in the executor so a big board
+# snapshot does not hold up the event loop while it is parsed
+PARSE_INLINE_MAX_BYTES = 256 * 1024
+
+
+def _keep_object(value: dict[str, Any]) -> dict[str, Any]:
+    """Return a decoded JSON object unchanged."""
+    return value
+
+
+def _decode_in_executor(body: bytes) -> Any:
+    """Decode a large JSON body in a worker thread.
+
+    orjson and the C decoder of the json module hold the GIL for the whole
+    document, so the event loop would wait just as long as for an inline
+    decode. Calling back into Python for every object lets the interpreter
+    hand the GIL to the loop between objects, at the cost of a slower decode.
+    """
+    return json.loads(body, object_hook=_keep_object)
+
+
+class TrelloApiError(Exception):
+    """Error returned by the Trello API."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
+
+
+class TrelloAuthError(TrelloApiError):
+    """Trello rejected the API key or token."""
+
+
+class TokenBucket:
+    """Token bucket limiting how fast requests are sent."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        """Initialize a full bucket that refills over period seconds."""
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token and return how long the caller was held back."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+    def block(self, seconds: float) -> None:
+        """Empty the bucket and hold every caller back for the given time."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+@dataclass
+class CachedResponse:
+    """A parsed response body and the validators needed to revalidate it."""
+
+    etag: str | None
+    last_modified: str | None
+    value: Any
+    size: int
+
+
+class ResponseCache:
+    """LRU cache of GET responses keyed by request, bounded in entries and bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        """Return a cached response and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, entry: CachedResponse) -> None:
+        """Store a response, evicting the least recently used ones if needed."""
+        self.pop(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.size += entry.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def pop(self, key: tuple) -> None:
+        """Drop a cached response."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+
+class TrelloApiClient:
+    """Trello API client shared by everything using the same token."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        api_token: str,
+        base_url: str = TRELLO_API_BASE,
+    ) -> None:
+        """Initialize the client."""
+        self.session = session
+        self.api_key = api_key
+        self.api_token = api_token
+        self.base_url = base_url
+        self.bucket = TokenBucket(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+        self.cache = ResponseCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES)
+        self.metrics = ApiMetrics()
+        self.stats = {
+            "requests_sent": 0,
+            "requests_throttled": 0,
+            "requests_retried": 0,
+            "rate_limited": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "executor_parses": 0,
+            "requests_coalesced": 0,
+        }
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    async def get(
+        self, path: str, params: dict[str, Any] | None = None, cache: bool = True
+    ) -> Any:
+        """Return the decoded JSON body of a GET request.
+
+        Identical GETs issued while one is already in flight wait for its
+        response instead of sending another request. The value may be shared
+        with the response cache and other callers and must not be modified.
+
+        Pass cache=False for large responses that are not asked for again
+        unchanged, such as board snapshots, or whose parameters change every
+        time, such as actions pages. Their parsed values would only hold
+        memory until they were evicted.
+        """
+        key = _request_key(path, params)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["requests_coalesced"] += 1
+        else:
+            task = asyncio.get_running_loop().create_task(
+                self.request("GET", path, params, cache=cache)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        # Shielded so one caller timing out does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple, task: asyncio.Task) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller gave up waiting
+            task.exception()
+
+    async def post(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the decoded JSON body of a POST request."""
+        return await self.request("POST", path, params)
+
+    async def put(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the decoded JSON body of a PUT request."""
+        return await self.request("PUT", path, params)
+
+    async def delete(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Return the decoded JSON body of a DELETE request."""
+        return await self.request("DELETE", path, params)
+
+    async def batch(self, paths: list[str]) -> list[tuple[int, Any]]:
+        """Return (status, body) for each path, packing ten GETs per request."""
+        results: list[tuple[int, Any]] = []
+        for start in range(0, len(paths), BATCH_SIZE):
+            chunk = paths[start:start + BATCH_SIZE]
+            # The URLs differ from one batch to the next, so nothing is cached
+            for entry in await self.get("/batch", {"urls": ",".join(chunk)}, cache=False):
+                results.append(_batch_entry(entry))
+        return results
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        cache: bool = True,
+    ) -> Any:
+        """Send a request, retrying rate limited and failed attempts.
+
+        Unless cache is False, GET responses carrying an ETag or Last-Modified
+        header are cached and revalidated on the next request; a 304 reuses
+        the parsed body.
+        """
+        url = f"{self.base_url}{path}"
+        query = {**(params or {}), "key": self.api_key, "token": self.api_token}
+        idempotent = method in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else {429}
+
+        cache_key: tuple | None = None
+        cached: CachedResponse | None = None
+        headers: dict[str, str] = {}
+        if method == "GET" and cache:
+            cache_key = _request_key(path, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+        attempt = 0
+        while True:
+            if await self.bucket.acquire():
+                self.stats["requests_throttled"] += 1
+
+            self.stats["requests_sent"] += 1
+            retry_after: float | None = None
+            status: int | None = None
+            size = 0
+            sent = time.monotonic()
+            try:
+                async with async_timeout(REQUEST_TIMEOUT):
+                    async with self.session.request(
+                        method, url, params=query, headers=headers
+                    ) as response:
+                        status = response.status
+                        if response.status == 401:
+                            raise TrelloAuthError("Invalid API key or token", response.status)
+                        if response.status == 304 and cached is not None:
+                            self.stats["cache_hits"] += 1
+                            return cached.value
+                        if response.status < 400:
+                            body = await response.read()
+                            size = len(body)
+                            value = await self._decode(body)
+                            if cache_key is not None:
+                                self.stats["cache_misses"] += 1
+                                self._store(cache_key, response, value, len(body))
+                            return value
+                        if response.status not in retry_statuses or attempt >= MAX_RETRIES:
+                            raise TrelloApiError(
+                                f"Trello API returned status {response.status}"
+                                f" for {redact_path(path)}",
+                                response.status,
+                            )
+                        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            except (aiohttp.ClientError, TimeoutError, asyncio.TimeoutError):
+                status = None
+                if not idempotent or attempt >= MAX_RETRIES:
+                    raise
+            finally:
+                self.metrics.record(path, time.monotonic() - sent, status, size)
+
+            delay = _backoff(attempt, retry_after)
+            if status == 429:
+                # Every caller on this token is over budget, so pause them all
+                self.stats["rate_limited"] += 1
+                self.bucket.block(delay)
+            attempt += 1
+            self.stats["requests_retried"] += 1
+            _LOGGER.debug(
+                "Retrying %s %s in %.1fs (attempt %d, status %s)",
+                method, redact_path(path), delay, attempt, status,
+            )
+            await asyncio.sleep(delay)
+
+    async def _decode(self, body: bytes) -> Any:
+        """Decode a JSON body, off the event loop if it is large."""
+        if not body:
+            return None
+        if len(body) <= PARSE_INLINE_MAX_BYTES:
+            return json_loads(body)
+        self.stats["executor_parses"] += 1
+        return await asyncio.get_running_loop().run_in_executor(None, _decode_in_executor, body)
+
+    def _store(
+        self, key: tuple, response: aiohttp.ClientResponse, value: Any, size: int
+    ) -> None:
+        """Cache a GET response if Trello sent validators for it."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.cache.put(key, CachedResponse(etag, last_modified, value, size))
+        else:
+            self.cache.pop(key)
+
+
+def _request_key(path: str, params: dict[str, Any] | None) -> tuple:
+    """Return a hashable key identifying a request."""
+    return (path, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the Retry-After header in seconds, if it is numeric."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _batch_entry(entry: dict[str, Any]) -> tuple[int, Any]:
+    """Split a /batch response entry into its status code and body."""
+    if "statusCode" in entry:
+        return int(entry["statusCode"]), entry
+    status, body = next(iter(entry.items()))
+    return int(status), body
+
+
+def _backoff(attempt: int, retry_after: float | None) -> float:
+    """Return an exponential backoff delay with full jitter."""
+    if retry_after is not None:
+        return retry_after + random.uniform(0, BACKOFF_BASE)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+@callback
+def async_get_client(hass: HomeAssistant, api_key: str, api_token: str) -> TrelloApiClient:
+    """Return the client shared by config entries with a key and token, creating it if needed."""
+    clients: dict[tuple[str, str], TrelloApiClient] = hass.data.setdefault(DATA_CLIENTS, {})
+    client = clients.get((api_key, api_token))
+    if client is None:
+        client = TrelloApiClient(async_get_clientsession(hass), api_key, api_token)
+        clients[(api_key, api_token)] = client
+    return client
+
+
+@callback
+def async_get_flow_client(hass: HomeAssistant, api_key: str, api_token: str) -> TrelloApiClient:
+    """Return the shared client for a key and token if an entry uses it, or a new one.
+
+    A client created for a flow is not cached, as nothing would release it
+    once the flow ends.
+    """
+    client = hass.data.get(DATA_CLIENTS, {}).get((api_key, api_token))
+    if client is None:
+        client = TrelloApiClient(async_get_clientsession(hass), api_key, api_token)
+    return client
+
+
+@callback
+def async_release_client(hass: HomeAssistant, client: TrelloApiClient) -> None:
+    """Drop a shared client once no config entry uses it any more."""
+    clients: dict[tuple[str, str], TrelloApiClient] = hass.data.get(DATA_CLIENTS, {})
+    if clients.get((client.api_key, client.api_token)) is client:
+        del clients[(client.api_key, client.api_token)]
+    if not clients:
+        hass.data.pop(DATA_CLIENTS, None)
@@ -11,20 +11,43 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .const import (
+    CARD_ATTRIBUTE_POLICIES,
     CONF_API_KEY,
+    CONF_API_SECRET,
     CONF_API_TOKEN,
     CONF_BOARDS,
+    CONF_CARD_ATTRIBUTES,
+    CONF_CARD_DETAILS,
+    CONF_DETAIL_LABEL,
+    CONF_FULL_REFRESH_CYCLES,
+    CONF_PARALLEL_FETCHES,
+    CONF_PUSH_UPDATES,
+    CONF_REFRESH_COOLDOWN,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_CARD_ATTRIBUTES,
+    DEFAULT_FULL_REFRESH_CYCLES,
+    DEFAULT_PARALLEL_FETCHES,
+    DEFAULT_REFRESH_COOLDOWN,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    MAX_FULL_REFRESH_CYCLES,
+    MAX_PARALLEL_FETCHES,
+    MAX_REFRESH_COOLDOWN,
     MAX_UPDATE_INTERVAL,
+    MIN_FULL_REFRESH_CYCLES,
+    MIN_PARALLEL_FETCHES,
+    MIN_REFRESH_COOLDOWN,
     MIN_UPDATE_INTERVAL,
-    TRELLO_API_BASE,
 )
+from .api import TrelloApiClient, TrelloApiError, TrelloAuthError, async_get_flow_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +69,56 @@ except ImportError:
             except asyncio.TimeoutError:
                 raise TimeoutError(f"Timeout after {seconds} seconds")
 
+# Only what the board picker shows, instead of full board objects with prefs
+BOARD_LIST_PARAMS = {
+    "filter": "open",
+    "fields": "id,name,idOrganization",
+    "organization": "true",
+    "organization_fields": "displayName",
+}
+
+PERSONAL_BOARDS = "Personal"
+
+
+async def _async_fetch_boards(client: TrelloApiClient) -> list[dict[str, str]]:
+    """Return the id, name and workspace name of the account's open boards."""
+    async with async_timeout(10):
+        boards_data = await client.get("/members/me/boards", BOARD_LIST_PARAMS)
+    return [
+        {
+            "id": board["id"],
+            "name": board["name"],
+            "organization": (board.get("organization") or {}).get("displayName")
+            or PERSONAL_BOARDS,
+        }
+        for board in boards_data
+    ]
+
+
+def _board_selector(boards: list[dict[str, str]]) -> SelectSelector:
+    """Return a searchable board picker, grouped by workspace."""
+    ordered = sorted(
+        boards,
+        key=lambda board: (
+            board["organization"] == PERSONAL_BOARDS,
+            board["organization"].lower(),
+            board["name"].lower(),
+        ),
+    )
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=[
+                SelectOptionDict(
+                    value=board["id"], label=f"{board['organization']} / {board['name']}"
+                )
+                for board in ordered
+            ],
+            multiple=True,
+            mode=SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
 class TrelloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Trello."""
 
@@ -69,49 +142,29 @@ class TrelloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._api_token = user_input[CONF_API_TOKEN]
 
             try:
-                session = async_get_clientsession(self.hass)
-                params = {"key": self._api_key, "token": self._api_token}
-                
+                client = async_get_flow_client(self.hass, self._api_key, self._api_token)
+
                 # Test the credentials and get member info
                 _LOGGER.debug("Testing Trello credentials")
                 async with async_timeout(10):
-                    member_url = f"{TRELLO_API_BASE}/members/me"
-                    async with session.get(member_url, params=params) as response:
-                        if response.status == 401:
-                            errors["base"] = "invalid_auth"
-                        elif response.status != 200:
-                            _LOGGER.error("Trello API returned status %s", response.status)
-                            errors["base"] = "cannot_connect"
-                        else:
-                            member_data = await response.json()
-                            self._member_name = (
-                                member_data.get("username") 
-                                or member_data.get("fullName") 
-                                or "Trello Account"
-                            )
-                            _LOGGER.debug("Member name: %s", self._member_name)
-                
-                if not errors:
-                    # Fetch boards
-                    _LOGGER.debug("Fetching boards list")
-                    async with async_timeout(10):
-                        boards_url = f"{TRELLO_API_BASE}/members/me/boards"
-                        boards_params = {**params, "filter": "open"}
-                        async with session.get(boards_url, params=boards_params) as response:
-                            if response.status != 200:
-                                _LOGGER.error("Failed to fetch boards: status %s", response.status)
-                                errors["base"] = "cannot_connect"
-                            else:
-                                boards_data = await response.json()
-                                self._boards = [
-                                    {"id": board["id"], "name": board["name"]}
-                                    for board in boards_data
-                                ]
-                                _LOGGER.debug("Found %d boards", len(self._boards))
-
-                if not errors:
-                    return await self.async_step_boards()
-
+                    member_data = await client.get("/members/me")
+                self._member_name = (
+                    member_data.get("username")
+                    or member_data.get("fullName")
+                    or "Trello Account"
+                )
+                _LOGGER.debug("Member name: %s", self._member_name)
+
+                # Fetch boards once; the list is kept for the rest of the flow
+                _LOGGER.debug("Fetching boards list")
+                self._boards = await _async_fetch_boards(client)
+                _LOGGER.debug("Found %d boards", len(self._boards))
+
+            except TrelloAuthError:
+                errors["base"] = "invalid_auth"
+            except TrelloApiError as err:
+                _LOGGER.error("Trello API error: %s", err)
+                errors["base"] = "cannot_connect"
             except aiohttp.ClientError as err:
                 _LOGGER.error("Connection error: %s", err)
                 errors["base"] = "cannot_connect"
@@ -122,6 +175,9 @@ class TrelloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception: %s", err)
                 errors["base"] = "cannot_connect"
 
+            if not errors:
+                return await self.async_step_boards()
+
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_API_KEY): str,
@@ -165,11 +221,9 @@ class TrelloConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not self._boards:
             return self.async_abort(reason="no_boards")
 
-        board_options = {board["id"]: board["name"] for board in self._boards}
-
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_BOARDS): cv.multi_select(board_options),
+                vol.Required(CONF_BOARDS): _board_selector(self._boards),
                 vol.Optional(
                     CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
                 ): vol.All(
@@ -203,6 +257,7 @@ class TrelloOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        self._boards: list[dict[str, str]] | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -210,16 +265,65 @@ class TrelloOptionsFlow(config_entries.OptionsFlow):
         """Manage the options."""
         errors = {}
 
+        current_boards = self.config_entry.options.get(
+            CONF_BOARDS, self.config_entry.data.get(CONF_BOARDS, [])
+        )
+
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if not user_input.get(CONF_BOARDS):
+                errors[CONF_BOARDS] = "no_boards_selected"
+            elif user_input.get(CONF_PUSH_UPDATES) and not user_input.get(CONF_API_SECRET):
+                errors["base"] = "secret_required"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        fetched = self._boards
+        if fetched is None:
+            # Fetched once per flow, so a form shown again after an error is
+            # instant. A failed fetch is not kept and is tried again next time.
+            client = async_get_flow_client(
+                self.hass,
+                self.config_entry.data[CONF_API_KEY],
+                self.config_entry.data[CONF_API_TOKEN],
+            )
+            try:
+                fetched = self._boards = await _async_fetch_boards(client)
+            except (TrelloApiError, aiohttp.ClientError, TimeoutError, asyncio.TimeoutError) as err:
+                _LOGGER.warning("Unable to fetch Trello boards: %s", err)
+                errors["base"] = "cannot_connect"
+                fetched = []
+        # Keep selected boards that are no longer open selectable, so they can be removed
+        known = {board["id"] for board in fetched}
+        boards = fetched + [
+            {"id": board_id, "name": board_id, "organization": PERSONAL_BOARDS}
+            for board_id in current_boards
+            if board_id not in known
+        ]
 
         current_interval = self.config_entry.options.get(
             CONF_UPDATE_INTERVAL,
             self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
         )
+        current_parallel = self.config_entry.options.get(
+            CONF_PARALLEL_FETCHES, DEFAULT_PARALLEL_FETCHES
+        )
+        current_full_refresh_cycles = self.config_entry.options.get(
+            CONF_FULL_REFRESH_CYCLES, DEFAULT_FULL_REFRESH_CYCLES
+        )
+        current_refresh_cooldown = self.config_entry.options.get(
+            CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN
+        )
+        current_push = self.config_entry.options.get(CONF_PUSH_UPDATES, False)
+        current_secret = self.config_entry.options.get(CONF_API_SECRET, "")
+        current_card_attributes = self.config_entry.options.get(
+            CONF_CARD_ATTRIBUTES, DEFAULT_CARD_ATTRIBUTES
+        )
+        current_card_details = self.config_entry.options.get(CONF_CARD_DETAILS, False)
+        current_detail_label = self.config_entry.options.get(CONF_DETAIL_LABEL, "")
 
         options_schema = vol.Schema(
             {
+                vol.Required(CONF_BOARDS, default=current_boards): _board_selector(boards),
                 vol.Optional(
                     CONF_UPDATE_INTERVAL,
                     default=current_interval,
@@ -227,6 +331,47 @@ class TrelloOptionsFlow(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
                 ),
+                vol.Optional(
+                    CONF_PARALLEL_FETCHES,
+                    default=current_parallel,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_PARALLEL_FETCHES, max=MAX_PARALLEL_FETCHES),
+                ),
+                vol.Optional(
+                    CONF_FULL_REFRESH_CYCLES,
+                    default=current_full_refresh_cycles,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_FULL_REFRESH_CYCLES, max=MAX_FULL_REFRESH_CYCLES),
+                ),
+                vol.Optional(
+                    CONF_REFRESH_COOLDOWN,
+                    default=current_refresh_cooldown,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_REFRESH_COOLDOWN, max=MAX_REFRESH_COOLDOWN),
+                ),
+                vol.Optional(CONF_PUSH_UPDATES, default=current_push): bool,
+                vol.Optional(
+                    CONF_API_SECRET,
+                    description={"suggested_value": current_secret},
+                ): str,
+                vol.Optional(
+                    CONF_CARD_ATTRIBUTES,
+                    default=current_card_attributes,
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=CARD_ATTRIBUTE_POLICIES,
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_CARD_ATTRIBUTES,
+                    )
+                ),
+                vol.Optional(CONF_CARD_DETAILS, default=current_card_details): bool,
+                vol.Optional(
+                    CONF_DETAIL_LABEL,
+                    description={"suggested_value": current_detail_label},
+                ): str,
             }
         )
 
@@ -1,7 +1,14 @@
 """Constants for the Trello integration."""
+from datetime import timedelta
 
 DOMAIN = "trello"
 
+# hass.data key for the API clients shared between config entries
+DATA_CLIENTS = f"{DOMAIN}_clients"
+
+# hass.data key for the board fetch hub shared by all config entries
+DATA_FETCH_HUB = f"{DOMAIN}_fetch_hub"
+
 # Trello API
 TRELLO_API_BASE = "https://api.trello.com/1"
 
@@ -10,8 +17,71 @@ CONF_API_KEY = "api_key"
 CONF_API_TOKEN = "api_token"
 CONF_BOARDS = "boards"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_PARALLEL_FETCHES = "parallel_fetches"
+CONF_FULL_REFRESH_CYCLES = "full_refresh_cycles"
+CONF_REFRESH_COOLDOWN = "refresh_cooldown"
+CONF_CARD_DETAILS = "card_details"
+CONF_DETAIL_LABEL = "detail_label"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_API_SECRET = "api_secret"
+CONF_CARD_ATTRIBUTES = "card_attributes"
+
+# Service attributes
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_BOARD_ID = "board_id"
+ATTR_LIST_ID = "list_id"
+ATTR_MEMBER = "member"
+ATTR_LABEL = "label"
+ATTR_LIST_NAME = "list_name"
+ATTR_DUE = "due"
+ATTR_CARD_ID = "card_id"
+ATTR_NAME = "name"
+ATTR_DESCRIPTION = "description"
+ATTR_DUE_COMPLETE = "due_complete"
+ATTR_POSITION = "position"
+
+# Where created and moved cards are placed in their list
+POSITION_TOP = "top"
+POSITION_BOTTOM = "bottom"
+POSITIONS = [POSITION_TOP, POSITION_BOTTOM]
+
+# Cards due within this window count as due soon
+DUE_SOON_WINDOW = timedelta(days=7)
+
+# Due date filters of the search_cards service
+DUE_FILTER_OVERDUE = "overdue"
+DUE_FILTER_DUE_SOON = "due_soon"
+DUE_FILTERS = [DUE_FILTER_OVERDUE, DUE_FILTER_DUE_SOON]
+
+# How much card detail list sensors put in their state attributes
+CARD_ATTRIBUTES_COUNT = "count"
+CARD_ATTRIBUTES_SUMMARY = "summary"
+CARD_ATTRIBUTES_FULL = "full"
+CARD_ATTRIBUTE_POLICIES = [CARD_ATTRIBUTES_COUNT, CARD_ATTRIBUTES_SUMMARY, CARD_ATTRIBUTES_FULL]
 
 # Defaults
 DEFAULT_UPDATE_INTERVAL = 5
 MIN_UPDATE_INTERVAL = 1
 MAX_UPDATE_INTERVAL = 1440  # 24 hours
+
+# With webhook push updates, polling only reconciles missed deliveries
+PUSH_RECONCILE_INTERVAL = timedelta(minutes=30)
+
+DEFAULT_CARD_ATTRIBUTES = CARD_ATTRIBUTES_FULL
+
+DEFAULT_PARALLEL_FETCHES = 4
+MIN_PARALLEL_FETCHES = 1
+MAX_PARALLEL_FETCHES = 10
+
+# Boards whose last activity has not moved are skipped, except on every
+# Nth refresh, which syncs every due board to catch changes Trello does
+# not count as activity
+DEFAULT_FULL_REFRESH_CYCLES = 12
+MIN_FULL_REFRESH_CYCLES = 1
+MAX_FULL_REFRESH_CYCLES = 100
+
+# Seconds after a trello.refresh during which further calls are folded into
+# one follow-up refresh
+DEFAULT_REFRESH_COOLDOWN = 10
+MIN_REFRESH_COOLDOWN = 0
+MAX_REFRESH_COOLDOWN = 300
@@ -0,0 +1,244 @@
+"""Checklist, custom field and comment details of selected Trello cards."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import time
+from types import MappingProxyType
+from typing import Any
+
+from .api import TrelloApiClient
+from .const import DUE_SOON_WINDOW
+from .model import TrelloBoard, TrelloCard
+
+_LOGGER = logging.getLogger(__name__)
+
+# Details change less often than card positions, so they are fetched on
+# their own, slower cadence
+DETAIL_REFRESH_INTERVAL = timedelta(minutes=30)
+
+# Upper bound on the cards with details, soonest due first
+MAX_DETAIL_CARDS = 50
+
+# Newest comments kept per card
+RECENT_COMMENTS = 3
+
+# Query of a card detail fetch. Batched URLs cannot contain commas, so only
+# the id is requested besides the nested resources.
+DETAIL_QUERY = (
+    "fields=id&checklists=all&checklist_fields=name&customFieldItems=true"
+    f"&actions=commentCard&actions_limit={RECENT_COMMENTS}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Checklist:
+    """A checklist and its items, as (name, complete) pairs in order."""
+
+    name: str
+    items: tuple[tuple[str, bool], ...] = ()
+
+    @property
+    def checked(self) -> int:
+        """Return the number of completed items."""
+        return sum(1 for _, complete in self.items if complete)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the checklist with its progress."""
+        return {
+            "name": self.name,
+            "checked": self.checked,
+            "total": len(self.items),
+            "items": [{"name": name, "complete": complete} for name, complete in self.items],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CardDetails:
+    """Checklists, custom field values and recent comments of a card."""
+
+    checklists: tuple[Checklist, ...] = ()
+    custom_fields: tuple[tuple[str, Any], ...] = ()
+    # (author, text, date) of the newest comments, newest first
+    recent_comments: tuple[tuple[str, str, str], ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the details as the dict merged into card attributes."""
+        return {
+            "checklists": [checklist.as_dict() for checklist in self.checklists],
+            "custom_fields": dict(self.custom_fields),
+            "recent_comments": [
+                {"author": author, "text": text, "date": date}
+                for author, text, date in self.recent_comments
+            ],
+        }
+
+
+def custom_field_definitions(payload: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Map custom field ids to their name and the text of their list options."""
+    return {
+        definition["id"]: {
+            "name": definition.get("name", ""),
+            "options": {
+                option["id"]: (option.get("value") or {}).get("text", "")
+                for option in definition.get("options") or []
+            },
+        }
+        for definition in payload
+    }
+
+
+def _custom_field_value(item: dict[str, Any], definition: dict[str, Any]) -> Any:
+    """Return the value of a custom field item."""
+    if item.get("idValue"):
+        return definition["options"].get(item["idValue"])
+    value = item.get("value") or {}
+    if "checked" in value:
+        return value["checked"] == "true"
+    if "number" in value:
+        try:
+            return float(value["number"])
+        except ValueError:
+            return value["number"]
+    return value.get("text", value.get("date"))
+
+
+def parse_card_details(
+    payload: dict[str, Any], definitions: dict[str, dict[str, Any]]
+) -> CardDetails:
+    """Convert a card detail payload into CardDetails."""
+    checklists = tuple(
+        Checklist(
+            name=checklist.get("name", ""),
+            items=tuple(
+                (item.get("name", ""), item.get("state") == "complete")
+                for item in sorted(checklist.get("checkItems", []), key=lambda i: i.get("pos", 0))
+            ),
+        )
+        for checklist in sorted(payload.get("checklists", []), key=lambda c: c.get("pos", 0))
+    )
+    custom_fields = []
+    for item in payload.get("customFieldItems", []):
+        definition = definitions.get(item.get("idCustomField"))
+        if definition is not None:
+            custom_fields.append((definition["name"], _custom_field_value(item, definition)))
+    recent_comments = tuple(
+        (
+            (action.get("memberCreator") or {}).get("fullName", ""),
+            (action.get("data") or {}).get("text", ""),
+            action.get("date", ""),
+        )
+        for action in payload.get("actions", [])[:RECENT_COMMENTS]
+        if action.get("type") == "commentCard"
+    )
+    return CardDetails(checklists, tuple(custom_fields), recent_comments)
+
+
+class CardDetailTier:
+    """Lazily fetched details of the cards worth a closer look.
+
+    Only incomplete cards that are overdue or due soon, and cards carrying
+    the configured label, get details. They are cached per card along with
+    the card's last activity, so a pass only fetches cards that are new to
+    the tier or changed since their details were fetched. Passes run on
+    their own interval rather than on every poll.
+    """
+
+    def __init__(
+        self,
+        client: TrelloApiClient,
+        detail_label: str | None = None,
+        refresh_interval: timedelta = DETAIL_REFRESH_INTERVAL,
+    ) -> None:
+        """Initialize an empty tier."""
+        self.client = client
+        self.detail_label = detail_label.casefold() if detail_label else None
+        self.refresh_interval = refresh_interval.total_seconds()
+        self._cache: dict[str, tuple[str | None, CardDetails]] = {}
+        self._last_pass: float | None = None
+        self.details: Mapping[str, CardDetails] = MappingProxyType({})
+        self.stats = {"passes": 0, "cards_fetched": 0, "cards_cached": 0}
+
+    @property
+    def due(self) -> bool:
+        """Return whether the next pass is due."""
+        return (
+            self._last_pass is None
+            or time.monotonic() - self._last_pass >= self.refresh_interval
+        )
+
+    def force(self) -> None:
+        """Make the next pass due whatever the interval."""
+        self._last_pass = None
+
+    def eligible_cards(
+        self, boards: Mapping[str, TrelloBoard], now: datetime
+    ) -> list[tuple[str, TrelloCard]]:
+        """Return (board id, card) of the cards to hold details for, soonest due first."""
+        horizon = now + DUE_SOON_WINDOW
+        eligible = []
+        for board_id, board in boards.items():
+            for trello_list in board.lists.values():
+                if trello_list.closed:
+                    continue
+                for card in trello_list.cards:
+                    if card.closed:
+                        continue
+                    due_soon = (
+                        card.due_at is not None
+                        and not card.due_complete
+                        and card.due_at <= horizon
+                    )
+                    flagged = self.detail_label is not None and any(
+                        label.casefold() == self.detail_label for label in card.labels
+                    )
+                    if due_soon or flagged:
+                        eligible.append((board_id, card))
+        eligible.sort(key=lambda entry: (entry[1].due_at is None, entry[1].due_at or now))
+        return eligible[:MAX_DETAIL_CARDS]
+
+    async def async_refresh(
+        self, boards: Mapping[str, TrelloBoard], now: datetime
+    ) -> Mapping[str, CardDetails]:
+        """Fetch details of eligible cards that are missing or outdated."""
+        eligible = self.eligible_cards(boards, now)
+        stale = [
+            (board_id, card)
+            for board_id, card in eligible
+            if card.id not in self._cache or self._cache[card.id][0] != card.last_activity
+        ]
+
+        if stale:
+            board_ids = sorted({board_id for board_id, _ in stale})
+            paths = [f"/boards/{board_id}/customFields" for board_id in board_ids]
+            paths.extend(f"/cards/{card.id}?{DETAIL_QUERY}" for _, card in stale)
+            results = await self.client.batch(paths)
+
+            definitions: dict[str, dict[str, Any]] = {}
+            for status, payload in results[:len(board_ids)]:
+                if status == 200:
+                    definitions.update(custom_field_definitions(payload))
+            for (_, card), (status, payload) in zip(stale, results[len(board_ids):]):
+                if status == 200:
+                    self._cache[card.id] = (card.last_activity, parse_card_details(payload, definitions))
+                else:
+                    _LOGGER.debug("Unable to fetch details of card %s (status %s)", card.id, status)
+
+        # Cards that left the tier drop their details
+        eligible_ids = {card.id for _, card in eligible}
+        for card_id in set(self._cache) - eligible_ids:
+            del self._cache[card_id]
+
+        self._last_pass = time.monotonic()
+        self.stats["passes"] += 1
+        self.stats["cards_fetched"] += len(stale)
+        self.stats["cards_cached"] = len(self._cache)
+        self.details = MappingProxyType(
+            {card_id: details for card_id, (_, details) in self._cache.items()}
+        )
+        _LOGGER.debug(
+            "Card details pass: %d eligible cards, %d fetched", len(eligible), len(stale)
+        )
+        return self.details
@@ -0,0 +1,51 @@
+"""Diagnostics support for the Trello integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from . import TrelloDataUpdateCoordinator
+from .const import CONF_API_KEY, CONF_API_SECRET, CONF_API_TOKEN, DOMAIN
+
+TO_REDACT = {CONF_API_KEY, CONF_API_TOKEN, CONF_API_SECRET, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TrelloDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "update_interval_seconds": coordinator.update_interval.total_seconds(),
+        "last_refreshed": (
+            coordinator.last_refreshed.isoformat() if coordinator.last_refreshed else None
+        ),
+        "poll_schedule": coordinator.scheduler.as_dict(),
+        "refresh_phases": coordinator.timings.as_dict(),
+        "api": {
+            "stats": dict(coordinator.client.stats),
+            "cache_entries": len(coordinator.client.cache),
+            "cache_bytes": coordinator.client.cache.size,
+            "endpoints": coordinator.client.metrics.as_dict(),
+        },
+        "fetch_hub": dict(coordinator.hub.stats),
+        "writes": dict(coordinator.writes.stats),
+        "card_flow": {
+            "moves": len(coordinator.flow.moves),
+            "tracked_cards": {
+                board_id: len(flow.cards) for board_id, flow in coordinator.flow.boards.items()
+            },
+        },
+        "card_details": (
+            dict(coordinator.detail_tier.stats) if coordinator.detail_tier else None
+        ),
+    }
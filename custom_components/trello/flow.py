@@ -0,0 +1,291 @@
+"""Card flow history of the monitored Trello boards."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from .model import TrelloBoard
+
+# Card moves kept in the rolling history, across all boards of an entry
+FLOW_HISTORY_SIZE = 2000
+
+# Throughput counts the cards that reached the done list within this window
+THROUGHPUT_WINDOW = timedelta(days=7)
+
+
+@dataclass(frozen=True, slots=True)
+class CardMove:
+    """A card seen in a different list than on the previous refresh.
+
+    Times are in seconds since the epoch. cycle is set when the card moved
+    into the done list and holds the time since the card was first seen.
+    """
+
+    time: float
+    board_id: str
+    card_id: str
+    from_list: str
+    to_list: str
+    dwell: float
+    cycle: float | None = None
+
+    def to_storage(self) -> list[Any]:
+        """Return the move as a compact JSON serializable row."""
+        return [
+            round(self.time),
+            self.board_id,
+            self.card_id,
+            self.from_list,
+            self.to_list,
+            round(self.dwell),
+            None if self.cycle is None else round(self.cycle),
+        ]
+
+
+@dataclass(slots=True)
+class CardPosition:
+    """The list a card sits in, since when, and when it was first seen."""
+
+    list_id: str
+    entered: float
+    started: float
+
+
+@dataclass(slots=True)
+class RunningMean:
+    """A sum and count that values are added to and removed from."""
+
+    total: float = 0.0
+    count: int = 0
+
+    def add(self, value: float) -> None:
+        """Add a value."""
+        self.total += value
+        self.count += 1
+
+    def remove(self, value: float) -> None:
+        """Remove a value added before."""
+        self.total -= value
+        self.count -= 1
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean, or None without values."""
+        return self.total / self.count if self.count else None
+
+
+@dataclass(slots=True)
+class BoardFlow:
+    """Card positions and running aggregates of one board.
+
+    The done list is the last open list of the board. Cards in any other
+    list are work in progress, and wip holds the sum and count of the times
+    they entered their list, so their mean age is read in constant time.
+    """
+
+    done_list: str | None = None
+    cards: dict[str, CardPosition] = field(default_factory=dict)
+    wip: RunningMean = field(default_factory=RunningMean)
+    dwell: dict[str, RunningMean] = field(default_factory=dict)
+    cycle: RunningMean = field(default_factory=RunningMean)
+    completions: deque[float] = field(default_factory=deque)
+
+    def recount_wip(self) -> None:
+        """Rebuild the work in progress totals from the card positions."""
+        self.wip = RunningMean()
+        for position in self.cards.values():
+            if position.list_id != self.done_list:
+                self.wip.add(position.entered)
+
+
+class FlowTracker:
+    """Track card moves between lists across refreshes.
+
+    Moves go into a bounded ring buffer. Throughput, cycle time and time
+    per list are running aggregates that each move adds to and each move
+    leaving the buffer subtracts from, so no refresh replays the history.
+    Finding the moves still takes one pass over the cards of each changed
+    board, as snapshots do not say which cards moved.
+    """
+
+    def __init__(self, history_size: int = FLOW_HISTORY_SIZE) -> None:
+        """Initialize an empty history."""
+        self.history_size = history_size
+        self.moves: deque[CardMove] = deque()
+        self.boards: dict[str, BoardFlow] = {}
+
+    def update_board(self, board: TrelloBoard, now: float) -> int:
+        """Record the moves since the board was last seen and return how many.
+
+        Every card of the board is compared with its last known list, so the
+        cost grows with the cards on the board, not with the moves.
+        """
+        flow = self.boards.get(board.id)
+        if flow is None:
+            flow = self.boards[board.id] = BoardFlow()
+        # Pruned here rather than when read, so reading throughput changes nothing
+        start = now - THROUGHPUT_WINDOW.total_seconds()
+        while flow.completions and flow.completions[0] < start:
+            flow.completions.popleft()
+
+        open_lists = [
+            list_id for list_id, trello_list in board.lists.items() if not trello_list.closed
+        ]
+        done_list = open_lists[-1] if open_lists else None
+        recount = done_list != flow.done_list
+        flow.done_list = done_list
+
+        moves = 0
+        seen: set[str] = set()
+        for list_id, trello_list in board.lists.items():
+            for card in trello_list.cards:
+                if card.closed:
+                    continue
+                seen.add(card.id)
+                position = flow.cards.get(card.id)
+                if position is None:
+                    flow.cards[card.id] = CardPosition(list_id, now, now)
+                    if list_id != done_list:
+                        flow.wip.add(now)
+                    continue
+                if position.list_id == list_id:
+                    continue
+
+                moves += 1
+                self._add_move(
+                    flow,
+                    CardMove(
+                        time=now,
+                        board_id=board.id,
+                        card_id=card.id,
+                        from_list=position.list_id,
+                        to_list=list_id,
+                        dwell=now - position.entered,
+                        cycle=now - position.started if list_id == done_list else None,
+                    ),
+                )
+                if position.list_id != done_list:
+                    flow.wip.remove(position.entered)
+                if list_id != done_list:
+                    flow.wip.add(now)
+                position.list_id = list_id
+                position.entered = now
+
+        for card_id in flow.cards.keys() - seen:
+            position = flow.cards.pop(card_id)
+            if position.list_id != done_list:
+                flow.wip.remove(position.entered)
+
+        if recount:
+            flow.recount_wip()
+        return moves
+
+    def remove_board(self, board_id: str) -> None:
+        """Forget a board that is no longer monitored."""
+        if self.boards.pop(board_id, None) is not None:
+            self.moves = deque(move for move in self.moves if move.board_id != board_id)
+
+    def _add_move(self, flow: BoardFlow, move: CardMove) -> None:
+        """Append a move to the history, evicting the oldest when full."""
+        self.moves.append(move)
+        flow.dwell.setdefault(move.from_list, RunningMean()).add(move.dwell)
+        if move.cycle is not None:
+            flow.cycle.add(move.cycle)
+            flow.completions.append(move.time)
+
+        if len(self.moves) > self.history_size:
+            oldest = self.moves.popleft()
+            oldest_flow = self.boards.get(oldest.board_id)
+            if oldest_flow is None:
+                return
+            oldest_flow.dwell[oldest.from_list].remove(oldest.dwell)
+            if oldest.cycle is not None:
+                oldest_flow.cycle.remove(oldest.cycle)
+                # Completions may already have left the throughput window
+                if oldest_flow.completions and oldest_flow.completions[0] <= oldest.time:
+                    oldest_flow.completions.popleft()
+
+    def throughput(self, board_id: str, now: float) -> int:
+        """Return the number of cards that reached the done list within the window."""
+        flow = self.boards.get(board_id)
+        if flow is None:
+            return 0
+        # Completions older than the window stay until the board next changes
+        start = now - THROUGHPUT_WINDOW.total_seconds()
+        return len(flow.completions) - bisect_left(flow.completions, start)
+
+    def cycle_time(self, board_id: str) -> float | None:
+        """Return the mean seconds from first seen to done of the kept completions."""
+        flow = self.boards.get(board_id)
+        return flow.cycle.mean if flow else None
+
+    def list_times(self, board_id: str) -> dict[str, float]:
+        """Return the mean seconds cards spent in each list before leaving it."""
+        flow = self.boards.get(board_id)
+        if flow is None:
+            return {}
+        return {
+            list_id: mean.mean for list_id, mean in flow.dwell.items() if mean.count
+        }
+
+    def wip_age(self, board_id: str, now: float) -> float | None:
+        """Return the mean seconds cards in progress have been in their list."""
+        flow = self.boards.get(board_id)
+        if flow is None or not flow.wip.count:
+            return None
+        return now - flow.wip.total / flow.wip.count
+
+    def wip_count(self, board_id: str) -> int:
+        """Return the number of cards in progress."""
+        flow = self.boards.get(board_id)
+        return flow.wip.count if flow else 0
+
+    def done_list(self, board_id: str) -> str | None:
+        """Return the id of the list counted as done."""
+        flow = self.boards.get(board_id)
+        return flow.done_list if flow else None
+
+    def to_storage(self) -> dict[str, Any]:
+        """Return the positions and history in a compact, JSON serializable form."""
+        return {
+            "boards": {
+                board_id: {
+                    "done_list": flow.done_list,
+                    "cards": {
+                        card_id: [
+                            position.list_id, round(position.entered), round(position.started)
+                        ]
+                        for card_id, position in flow.cards.items()
+                    },
+                }
+                for board_id, flow in self.boards.items()
+            },
+            "moves": [move.to_storage() for move in self.moves],
+        }
+
+    @classmethod
+    def from_storage(
+        cls, stored: dict[str, Any], board_ids: list[str], history_size: int = FLOW_HISTORY_SIZE
+    ) -> FlowTracker:
+        """Rebuild a tracker for the monitored boards from its stored form."""
+        tracker = cls(history_size)
+        for board_id, board in stored.get("boards", {}).items():
+            if board_id not in board_ids:
+                continue
+            flow = tracker.boards[board_id] = BoardFlow(
+                done_list=board.get("done_list"),
+                cards={
+                    card_id: CardPosition(list_id, entered, started)
+                    for card_id, (list_id, entered, started) in board.get("cards", {}).items()
+                },
+            )
+            flow.recount_wip()
+        for row in stored.get("moves", [])[-history_size:]:
+            move = CardMove(*row)
+            flow = tracker.boards.get(move.board_id)
+            if flow is not None:
+                tracker._add_move(flow, move)
+        return tracker
@@ -0,0 +1,69 @@
+"""Board fetches shared between the Trello config entries."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import TrelloApiClient
+from .const import DATA_FETCH_HUB
+from .model import BOARD_SNAPSHOT_PARAMS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TrelloFetchHub:
+    """Coalesce board snapshot fetches across config entries.
+
+    Entries using the same token already share one API client, which merges
+    identical requests. Entries with different tokens can still monitor the
+    same shared board, so snapshot fetches are also merged here by board id:
+    while one entry is fetching a board, every other entry asking for it
+    waits for that response instead of sending its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.stats = {"snapshots_fetched": 0, "snapshots_shared": 0}
+
+    async def async_get_board_snapshot(self, client: TrelloApiClient, board_id: str) -> Any:
+        """Return the nested snapshot of a board, sharing an in-flight fetch."""
+        task = self._inflight.get(board_id)
+        if task is not None:
+            try:
+                snapshot = await asyncio.shield(task)
+            except Exception as err:
+                # The fetch used another entry's token, which may lack access
+                # this one has, so try again with our own client
+                _LOGGER.debug("Shared fetch of board %s failed (%s), fetching directly", board_id, err)
+            else:
+                self.stats["snapshots_shared"] += 1
+                return snapshot
+
+        task = asyncio.get_running_loop().create_task(
+            client.get(f"/boards/{board_id}", BOARD_SNAPSHOT_PARAMS, cache=False)
+        )
+        self._inflight[board_id] = task
+        task.add_done_callback(lambda done: self._fetch_done(board_id, done))
+        self.stats["snapshots_fetched"] += 1
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, board_id: str, task: asyncio.Task) -> None:
+        """Forget a finished snapshot fetch."""
+        if self._inflight.get(board_id) is task:
+            del self._inflight[board_id]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller gave up waiting
+            task.exception()
+
+
+@callback
+def async_get_fetch_hub(hass: HomeAssistant) -> TrelloFetchHub:
+    """Return the fetch hub shared by all config entries, creating it if needed."""
+    hub: TrelloFetchHub | None = hass.data.get(DATA_FETCH_HUB)
+    if hub is None:
+        hub = hass.data[DATA_FETCH_HUB] = TrelloFetchHub()
+    return hub
@@ -0,0 +1,369 @@
+"""Aggregates precomputed once per refresh for the Trello sensors."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from homeassistant.helpers.json import json_bytes
+
+from .const import DUE_FILTER_DUE_SOON, DUE_FILTER_OVERDUE, DUE_SOON_WINDOW
+from .details import CardDetails
+from .model import TrelloBoard, TrelloCard
+
+
+@dataclass(frozen=True, slots=True)
+class ListSummary:
+    """Open cards of a single list."""
+
+    open_cards: tuple[TrelloCard, ...] = ()
+    # Fetched details of the open cards that have them, by card id
+    details: Mapping[str, CardDetails] = field(default_factory=lambda: MappingProxyType({}))
+    fingerprint: int = 0
+
+    @property
+    def open_count(self) -> int:
+        """Return the number of open cards."""
+        return len(self.open_cards)
+
+    def card_dicts(self) -> list[dict[str, Any]]:
+        """Return the open cards as attribute dicts, with their details if fetched."""
+        return [_card_dict(card, self.details.get(card.id)) for card in self.open_cards]
+
+    def card_summaries(self) -> list[dict[str, Any]]:
+        """Return the id, name and due date of each open card."""
+        return [{"id": card.id, "name": card.name, "due": card.due} for card in self.open_cards]
+
+
+@dataclass(frozen=True, slots=True)
+class BoardSummary:
+    """Card totals and sorted due dates of a single board.
+
+    Overdue and due-soon counts depend on the current time, so they are
+    looked up in the sorted due dates when read rather than stored.
+    """
+
+    total_cards: int = 0
+    due_dates: tuple[datetime, ...] = ()
+    lists: tuple[dict[str, Any], ...] = ()
+    list_summaries: Mapping[str, ListSummary] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    fingerprint: int = 0
+
+    def overdue_count(self, now: datetime) -> int:
+        """Return the number of open cards past their due date."""
+        return bisect_left(self.due_dates, now)
+
+    def due_soon_count(self, now: datetime) -> int:
+        """Return the number of open cards due within the due-soon window."""
+        return bisect_right(self.due_dates, now + DUE_SOON_WINDOW) - bisect_left(
+            self.due_dates, now
+        )
+
+    def next_due_change(self, now: datetime) -> datetime | None:
+        """Return when the overdue or due-soon count next changes, if ever."""
+        candidates = []
+        # The next card to become overdue
+        index = bisect_left(self.due_dates, now)
+        if index < len(self.due_dates):
+            candidates.append(self.due_dates[index])
+        # The next card to enter the due-soon window
+        index = bisect_right(self.due_dates, now + DUE_SOON_WINDOW)
+        if index < len(self.due_dates):
+            candidates.append(self.due_dates[index] - DUE_SOON_WINDOW)
+        return min(candidates, default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedCard:
+    """An open card with the board and list it sits on."""
+
+    board_id: str
+    board_name: str
+    list_id: str
+    list_name: str
+    card: TrelloCard
+    details: CardDetails | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the card with its board and list, as returned by services."""
+        return {
+            **_card_dict(self.card, self.details),
+            "board_id": self.board_id,
+            "board_name": self.board_name,
+            "list_id": self.list_id,
+            "list_name": self.list_name,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CardSearchIndex:
+    """Inverted indexes over the open cards of every monitored board.
+
+    Each index maps a casefolded key to the positions of matching cards in
+    cards, so a query intersects a few small position sets instead of
+    scanning every card.
+    """
+
+    cards: tuple[IndexedCard, ...] = ()
+    by_board: Mapping[str, tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    by_member: Mapping[str, tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    by_label: Mapping[str, tuple[int, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    by_list_name: Mapping[str, tuple[int, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # Due dates of incomplete cards, sorted, and the card position of each
+    due_dates: tuple[datetime, ...] = ()
+    due_positions: tuple[int, ...] = ()
+
+    def search(
+        self,
+        now: datetime,
+        board_id: str | None = None,
+        member: str | None = None,
+        label: str | None = None,
+        list_name: str | None = None,
+        due: str | None = None,
+    ) -> list[IndexedCard]:
+        """Return the cards matching every given filter.
+
+        Cards are returned in board order, or by due date when filtering on it.
+        """
+        selections: list[tuple[int, ...]] = []
+        if board_id is not None:
+            selections.append(self.by_board.get(board_id, ()))
+        if member is not None:
+            selections.append(self.by_member.get(member.casefold(), ()))
+        if label is not None:
+            selections.append(self.by_label.get(label.casefold(), ()))
+        if list_name is not None:
+            selections.append(self.by_list_name.get(list_name.casefold(), ()))
+
+        due_order: tuple[int, ...] | None = None
+        if due == DUE_FILTER_OVERDUE:
+            due_order = self.due_positions[:bisect_left(self.due_dates, now)]
+        elif due == DUE_FILTER_DUE_SOON:
+            due_order = self.due_positions[
+                bisect_left(self.due_dates, now):bisect_right(self.due_dates, now + DUE_SOON_WINDOW)
+            ]
+
+        if not selections:
+            order = range(len(self.cards)) if due_order is None else due_order
+            return [self.cards[position] for position in order]
+
+        selections.sort(key=len)
+        matches = set(selections[0])
+        for selection in selections[1:]:
+            if not matches:
+                break
+            matches.intersection_update(selection)
+        if due_order is None:
+            return [self.cards[position] for position in sorted(matches)]
+        return [self.cards[position] for position in due_order if position in matches]
+
+
+@dataclass(frozen=True, slots=True)
+class TrelloIndex:
+    """Everything the sensors read, computed from one coordinator snapshot."""
+
+    boards: Mapping[str, BoardSummary] = field(default_factory=lambda: MappingProxyType({}))
+    open_boards: int = 0
+    account_attributes: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    account_fingerprint: int = 0
+
+    def board_summary(self, board_id: str) -> BoardSummary:
+        """Return the summary of a board, empty if it has no data."""
+        return self.boards.get(board_id, EMPTY_BOARD)
+
+    def list_summary(self, board_id: str, list_id: str) -> ListSummary:
+        """Return the summary of a list, empty if it has no data."""
+        return self.board_summary(board_id).list_summaries.get(list_id, EMPTY_LIST)
+
+
+EMPTY_LIST = ListSummary()
+EMPTY_BOARD = BoardSummary()
+
+
+def fingerprint(value: Any) -> int:
+    """Return a content hash used to tell whether a slice of data changed."""
+    return hash(json_bytes(value))
+
+
+def _card_dict(card: TrelloCard, details: CardDetails | None) -> dict[str, Any]:
+    """Return the attribute dict of a card, merged with its details if any."""
+    if details is None:
+        return card.as_dict()
+    return {**card.as_dict(), **details.as_dict()}
+
+
+def _summarize_board(
+    board: TrelloBoard, card_details: Mapping[str, CardDetails]
+) -> BoardSummary:
+    """Summarize the open lists and cards of a board."""
+    total_cards = 0
+    due_dates: list[datetime] = []
+    list_rows = []
+    list_summaries: dict[str, ListSummary] = {}
+
+    for list_id, trello_list in board.lists.items():
+        open_cards = tuple(card for card in trello_list.cards if not card.closed)
+        details = {
+            card.id: card_details[card.id] for card in open_cards if card.id in card_details
+        }
+        list_summaries[list_id] = ListSummary(
+            open_cards=open_cards,
+            details=MappingProxyType(details),
+            # Cards and details are frozen dataclasses, so both hash by content
+            fingerprint=hash(
+                (
+                    board.name,
+                    trello_list.name,
+                    trello_list.closed,
+                    open_cards,
+                    tuple(details.items()),
+                )
+            ),
+        )
+        if trello_list.closed:
+            continue
+
+        total_cards += len(open_cards)
+        list_rows.append({"id": list_id, "name": trello_list.name, "card_count": len(open_cards)})
+        due_dates.extend(
+            card.due_at for card in open_cards if card.due_at and not card.due_complete
+        )
+
+    due_dates.sort()
+    return BoardSummary(
+        total_cards=total_cards,
+        due_dates=tuple(due_dates),
+        lists=tuple(list_rows),
+        list_summaries=MappingProxyType(list_summaries),
+        fingerprint=fingerprint(
+            (
+                board.name,
+                board.url,
+                board.closed,
+                board.list_count,
+                total_cards,
+                due_dates,
+                list_rows,
+            )
+        ),
+    )
+
+
+def build_search_index(
+    boards: Mapping[str, TrelloBoard], card_details: Mapping[str, CardDetails]
+) -> CardSearchIndex:
+    """Index the open cards of the open lists of every board.
+
+    This costs several times more than the sensor summaries, so it is built
+    on the first search after the data changed rather than on every refresh.
+    """
+    cards: list[IndexedCard] = []
+    by_board: dict[str, list[int]] = {}
+    by_member: dict[str, list[int]] = {}
+    by_label: dict[str, list[int]] = {}
+    by_list_name: dict[str, list[int]] = {}
+    due: list[tuple[datetime, int]] = []
+
+    for board_id, board in boards.items():
+        for list_id, trello_list in board.lists.items():
+            if trello_list.closed:
+                continue
+            list_key = trello_list.name.casefold()
+            for card in trello_list.cards:
+                if card.closed:
+                    continue
+                position = len(cards)
+                cards.append(
+                    IndexedCard(
+                        board_id,
+                        board.name,
+                        list_id,
+                        trello_list.name,
+                        card,
+                        card_details.get(card.id),
+                    )
+                )
+                by_board.setdefault(board_id, []).append(position)
+                by_list_name.setdefault(list_key, []).append(position)
+                for member in card.members:
+                    by_member.setdefault(member.casefold(), []).append(position)
+                for label in card.labels:
+                    by_label.setdefault(label.casefold(), []).append(position)
+                if card.due_at and not card.due_complete:
+                    due.append((card.due_at, position))
+
+    due.sort()
+
+    def freeze(index: dict[str, list[int]]) -> Mapping[str, tuple[int, ...]]:
+        return MappingProxyType({key: tuple(positions) for key, positions in index.items()})
+
+    return CardSearchIndex(
+        cards=tuple(cards),
+        by_board=freeze(by_board),
+        by_member=freeze(by_member),
+        by_label=freeze(by_label),
+        by_list_name=freeze(by_list_name),
+        due_dates=tuple(due_date for due_date, _ in due),
+        due_positions=tuple(position for _, position in due),
+    )
+
+
+def build_index(data: dict[str, Any], monitored_board_ids: list[str]) -> TrelloIndex:
+    """Build the sensor index for a coordinator snapshot."""
+    card_details = data.get("card_details", {})
+    boards = {
+        board_id: _summarize_board(board, card_details)
+        for board_id, board in data.get("boards", {}).items()
+    }
+
+    all_boards = data.get("all_boards", [])
+    monitored = set(monitored_board_ids)
+    boards_list = []
+    for board in all_boards:
+        board_id = board["id"]
+        is_monitored = board_id in monitored
+        board_info = {
+            "id": board_id,
+            "name": board["name"],
+            "url": board.get("url", ""),
+            "closed": board.get("closed", False),
+            "monitored": is_monitored,
+        }
+        if is_monitored and board_id in boards:
+            board_info.update({
+                "lists": data["boards"][board_id].list_count,
+                "total_cards": boards[board_id].total_cards,
+            })
+        boards_list.append(board_info)
+
+    boards_list.sort(key=lambda x: x["name"].lower())
+    open_boards = [b for b in boards_list if not b["closed"]]
+    closed_boards = [b for b in boards_list if b["closed"]]
+    monitored_count = len([b for b in boards_list if b["monitored"]])
+
+    account_attributes = {
+        "all_boards": boards_list,
+        "open_boards": open_boards,
+        "closed_boards": closed_boards,
+        "total_boards": len(all_boards),
+        "total_open": len(open_boards),
+        "total_closed": len(closed_boards),
+        "total_monitored": monitored_count,
+        "total_unmonitored": len(boards_list) - monitored_count,
+    }
+
+    return TrelloIndex(
+        boards=MappingProxyType(boards),
+        open_boards=len(open_boards),
+        account_attributes=MappingProxyType(account_attributes),
+        account_fingerprint=fingerprint(account_attributes),
+    )
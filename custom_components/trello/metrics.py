@@ -0,0 +1,189 @@
+"""Request and refresh instrumentation for the Trello integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import re
+import time
+from typing import Any
+
+# Upper bounds, in milliseconds, of the latency histogram buckets. The last
+# bucket holds everything slower.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Trello object ids, replaced in endpoint names so requests group by route
+_OBJECT_ID = re.compile(r"^[0-9a-f]{24}$")
+
+
+def endpoint_name(path: str) -> str:
+    """Return the route of a request path, with ids and tokens replaced."""
+    segments = path.strip("/").split("/")
+    for index, segment in enumerate(segments):
+        if index > 0 and segments[index - 1] == "tokens":
+            segments[index] = "{token}"
+        elif _OBJECT_ID.match(segment):
+            segments[index] = "{id}"
+    return "/" + "/".join(segments)
+
+
+def redact_path(path: str) -> str:
+    """Return a request path with tokens replaced, for messages and logs."""
+    segments = path.split("/")
+    for index in range(1, len(segments)):
+        if segments[index - 1] == "tokens":
+            segments[index] = "{token}"
+    return "/".join(segments)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Bucketed request latencies."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Add one latency."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with labelled buckets."""
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters for the requests sent to one route."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class ApiMetrics:
+    """Per-endpoint request metrics of an API client."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def record(
+        self,
+        path: str,
+        duration: float,
+        status: int | None,
+        size: int = 0,
+    ) -> None:
+        """Record one request attempt.
+
+        A status of None means the attempt failed without a response.
+        """
+        name = endpoint_name(path)
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        metrics.requests += 1
+        metrics.bytes_received += size
+        metrics.latency.record(duration * 1000)
+        if status is None or status >= 400:
+            metrics.errors += 1
+        if status == 429:
+            metrics.rate_limited += 1
+
+    @property
+    def requests(self) -> int:
+        """Return the number of request attempts."""
+        return sum(metrics.requests for metrics in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed request attempts."""
+        return sum(metrics.errors for metrics in self.endpoints.values())
+
+    @property
+    def bytes_received(self) -> int:
+        """Return the number of response body bytes received."""
+        return sum(metrics.bytes_received for metrics in self.endpoints.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of every endpoint for diagnostics."""
+        return {
+            name: {
+                "requests": metrics.requests,
+                "errors": metrics.errors,
+                "rate_limited": metrics.rate_limited,
+                "bytes_received": metrics.bytes_received,
+                "latency": metrics.latency.as_dict(),
+            }
+            for name, metrics in sorted(self.endpoints.items())
+        }
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Durations of one refresh phase."""
+
+    count: int = 0
+    total: float = 0.0
+    last: float = 0.0
+    max: float = 0.0
+
+
+class PhaseTimer:
+    """Time the phases of a coordinator refresh."""
+
+    def __init__(self) -> None:
+        """Initialize with no timings."""
+        self.phases: dict[str, PhaseTiming] = {}
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as one run of a phase."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(phase, time.monotonic() - started)
+
+    def record(self, phase: str, duration: float) -> None:
+        """Record one run of a phase."""
+        timing = self.phases.get(phase)
+        if timing is None:
+            timing = self.phases[phase] = PhaseTiming()
+        timing.count += 1
+        timing.total += duration
+        timing.last = duration
+        timing.max = max(timing.max, duration)
+
+    def last(self, phase: str) -> float | None:
+        """Return the duration of the latest run of a phase."""
+        timing = self.phases.get(phase)
+        return timing.last if timing else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings of every phase, in seconds, for diagnostics."""
+        return {
+            phase: {
+                "count": timing.count,
+                "last": round(timing.last, 3),
+                "mean": round(timing.total / timing.count, 3),
+                "max": round(timing.max, 3),
+            }
+            for phase, timing in sorted(self.phases.items())
+        }
@@ -0,0 +1,443 @@
+"""Data model and normalization of Trello API payloads for the Trello integration."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+import sys
+import time
+from typing import Any
+
+CARD_FIELDS = (
+    "id,name,url,closed,due,dueComplete,desc,labels,idMembers,badges,idList,idBoard,pos,"
+    "dateLastActivity"
+)
+LIST_FIELDS = "id,name,closed,pos"
+
+# Query parameters for a nested board snapshot. Trello returns the board, its
+# open lists, their open cards, the board members and the newest action in one
+# response, which replaces the separate board, lists and per-list cards requests.
+BOARD_SNAPSHOT_PARAMS = {
+    "fields": "id,name,url,closed",
+    "lists": "open",
+    "list_fields": LIST_FIELDS,
+    "cards": "open",
+    "card_fields": CARD_FIELDS,
+    "members": "all",
+    "member_fields": "fullName,username",
+    "actions": "all",
+    "actions_limit": 1,
+    "action_fields": "id",
+}
+
+# Trello returns at most this many actions per request. A full page means
+# older actions may have been cut off, so the board needs a full resync.
+ACTIONS_PAGE_LIMIT = 1000
+
+DESCRIPTION_MAX_LENGTH = 512
+
+# Actions that remove a card from the board
+CARD_REMOVE_ACTIONS = frozenset({"deleteCard", "moveCardFromBoard"})
+
+# List actions that can be applied by re-reading the board's open lists
+LIST_REFRESH_ACTIONS = frozenset({"createList", "updateList", "moveListFromBoard"})
+
+
+@dataclass
+class BoardSyncState:
+    """Bookkeeping needed to apply action deltas to a board snapshot."""
+
+    last_action_id: str | None
+    member_names: dict[str, str]
+    card_positions: dict[str, float]
+    synced_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class BoardChanges:
+    """Changes to a board collected from its actions feed."""
+
+    last_action_id: str | None = None
+    refresh_cards: set[str] = field(default_factory=set)
+    remove_cards: set[str] = field(default_factory=set)
+    refresh_lists: bool = False
+    needs_full_sync: bool = False
+
+    @property
+    def empty(self) -> bool:
+        """Return True if nothing on the board changed."""
+        return not (self.refresh_cards or self.remove_cards or self.refresh_lists)
+
+
+@dataclass(frozen=True, slots=True)
+class TrelloCard:
+    """An open Trello card."""
+
+    id: str
+    name: str
+    url: str = ""
+    closed: bool = False
+    due: str | None = None
+    due_complete: bool = False
+    description: str = ""
+    labels: tuple[str, ...] = ()
+    members: tuple[str, ...] = ()
+    checklist_items: int = 0
+    checklist_items_checked: int = 0
+    attachments: int = 0
+    comments: int = 0
+    # Parsed once from due, so due date counts never reparse the string
+    due_at: datetime | None = field(default=None, compare=False, repr=False)
+    # Used to tell whether cached card details are still current
+    last_activity: str | None = field(default=None, compare=False, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the card as the dict exposed in attributes and services."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "url": self.url,
+            "closed": self.closed,
+            "due": self.due,
+            "due_complete": self.due_complete,
+            "description": self.description,
+            "labels": list(self.labels),
+            "members": list(self.members),
+            "checklist_items": self.checklist_items,
+            "checklist_items_checked": self.checklist_items_checked,
+            "attachments": self.attachments,
+            "comments": self.comments,
+        }
+
+
+@dataclass(slots=True)
+class TrelloList:
+    """An open list and its cards, in board order."""
+
+    id: str
+    name: str
+    closed: bool = False
+    cards: list[TrelloCard] = field(default_factory=list)
+
+    @property
+    def card_count(self) -> int:
+        """Return the number of cards in the list."""
+        return len(self.cards)
+
+
+@dataclass(slots=True)
+class TrelloBoard:
+    """A monitored board and its open lists, in board order."""
+
+    id: str
+    name: str
+    url: str = ""
+    closed: bool = False
+    lists: dict[str, TrelloList] = field(default_factory=dict)
+
+    @property
+    def list_count(self) -> int:
+        """Return the number of open lists on the board."""
+        return len([l for l in self.lists.values() if not l.closed])
+
+
+def parse_due(value: str | None) -> datetime | None:
+    """Parse a Trello due date, returning None if it is missing or malformed."""
+    if not value:
+        return None
+    try:
+        due_at = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # Trello always sends UTC, but a naive value cannot be compared at all
+    return due_at if due_at.tzinfo is not None else None
+
+
+def member_names(members: list[dict[str, Any]]) -> dict[str, str]:
+    """Map member ids to display names."""
+    return {
+        member["id"]: sys.intern(member.get("fullName") or member.get("username") or "Unknown")
+        for member in members
+        if "id" in member
+    }
+
+
+def normalize_card(card: dict[str, Any], names: dict[str, str]) -> TrelloCard:
+    """Convert a Trello card payload into a TrelloCard.
+
+    Label and member names repeat across most cards of a board, so they are
+    interned to share one string object per name.
+    """
+    badges = card.get("badges") or {}
+    return TrelloCard(
+        id=card["id"],
+        name=card["name"],
+        url=card.get("url", ""),
+        closed=card.get("closed", False),
+        due=card.get("due"),
+        due_complete=card.get("dueComplete", False),
+        description=(card.get("desc") or "")[:DESCRIPTION_MAX_LENGTH],
+        labels=tuple(
+            sys.intern(label["name"]) for label in card.get("labels", []) if label.get("name")
+        ),
+        members=tuple(
+            names[member_id] for member_id in card.get("idMembers", []) if member_id in names
+        ),
+        checklist_items=badges.get("checkItems", 0),
+        checklist_items_checked=badges.get("checkItemsChecked", 0),
+        attachments=badges.get("attachments", 0),
+        comments=badges.get("comments", 0),
+        due_at=parse_due(card.get("due")),
+        last_activity=card.get("dateLastActivity"),
+    )
+
+
+def normalize_board(payload: dict[str, Any]) -> TrelloBoard:
+    """Convert a nested board snapshot into a TrelloBoard."""
+    names = member_names(payload.get("members", []))
+
+    board = TrelloBoard(
+        id=payload["id"],
+        name=payload["name"],
+        url=payload.get("url", ""),
+        closed=payload.get("closed", False),
+    )
+
+    cards_by_list: dict[str, list[dict[str, Any]]] = {}
+    for card in sorted(payload.get("cards", []), key=lambda c: c.get("pos", 0)):
+        cards_by_list.setdefault(card.get("idList"), []).append(card)
+
+    for trello_list in sorted(payload.get("lists", []), key=lambda l: l.get("pos", 0)):
+        list_id = trello_list["id"]
+        board.lists[list_id] = TrelloList(
+            id=list_id,
+            name=trello_list["name"],
+            closed=trello_list.get("closed", False),
+            cards=[normalize_card(card, names) for card in cards_by_list.get(list_id, [])],
+        )
+
+    return board
+
+
+def board_sync_state(payload: dict[str, Any]) -> BoardSyncState:
+    """Return the sync bookkeeping for a freshly fetched board snapshot."""
+    actions = payload.get("actions") or []
+    return BoardSyncState(
+        last_action_id=actions[0]["id"] if actions else None,
+        member_names=member_names(payload.get("members", [])),
+        card_positions={card["id"]: card.get("pos", 0) for card in payload.get("cards", [])},
+    )
+
+
+def collect_changes(actions: list[dict[str, Any]]) -> BoardChanges:
+    """Reduce a page of board actions, newest first, to the changes to apply."""
+    changes = BoardChanges()
+    if not actions:
+        return changes
+
+    changes.last_action_id = actions[0]["id"]
+    if len(actions) >= ACTIONS_PAGE_LIMIT:
+        changes.needs_full_sync = True
+        return changes
+
+    # Walk oldest to newest so the last action on a card decides its fate
+    for action in reversed(actions):
+        action_type = action.get("type", "")
+        action_data = action.get("data") or {}
+
+        if action_type in LIST_REFRESH_ACTIONS:
+            old = action_data.get("old") or {}
+            if action_type == "updateList" and old.get("closed") is True:
+                # A restored list brings back cards the snapshot never had
+                changes.needs_full_sync = True
+                return changes
+            changes.refresh_lists = True
+        elif "card" in action_data and action_data["card"].get("id"):
+            card_id = action_data["card"]["id"]
+            if action_type in CARD_REMOVE_ACTIONS:
+                changes.refresh_cards.discard(card_id)
+                changes.remove_cards.add(card_id)
+            else:
+                changes.remove_cards.discard(card_id)
+                changes.refresh_cards.add(card_id)
+        else:
+            # Board, label and membership changes can touch every card
+            changes.needs_full_sync = True
+            return changes
+
+    return changes
+
+
+def copy_board(board: TrelloBoard) -> TrelloBoard:
+    """Return a copy of a board that can be patched without touching the original."""
+    return replace(
+        board,
+        lists={
+            list_id: replace(trello_list, cards=list(trello_list.cards))
+            for list_id, trello_list in board.lists.items()
+        },
+    )
+
+
+def remove_card(board: TrelloBoard, card_id: str, state: BoardSyncState) -> None:
+    """Remove a card from whichever list holds it."""
+    state.card_positions.pop(card_id, None)
+    for trello_list in board.lists.values():
+        for index, card in enumerate(trello_list.cards):
+            if card.id == card_id:
+                del trello_list.cards[index]
+                return
+
+
+def upsert_card(board: TrelloBoard, card: dict[str, Any], state: BoardSyncState) -> None:
+    """Insert or replace a card using a full card payload."""
+    remove_card(board, card["id"], state)
+
+    trello_list = board.lists.get(card.get("idList"))
+    if card.get("closed") or card.get("idBoard", board.id) != board.id or trello_list is None:
+        return
+
+    position = card.get("pos", 0)
+    state.card_positions[card["id"]] = position
+    positions = [state.card_positions.get(c.id, 0) for c in trello_list.cards]
+    trello_list.cards.insert(
+        bisect_right(positions, position), normalize_card(card, state.member_names)
+    )
+
+
+def patch_card(board: TrelloBoard, card_id: str, changes: dict[str, Any]) -> bool:
+    """Apply the expected result of a card update, returning False if the card is not on the board.
+
+    changes uses Trello card parameter names. An archived card is removed,
+    as snapshots only hold open cards, and a moved card goes to the top or
+    bottom of its new list until Trello returns its exact position.
+    """
+    for trello_list in board.lists.values():
+        for index, card in enumerate(trello_list.cards):
+            if card.id == card_id:
+                break
+        else:
+            continue
+        break
+    else:
+        return False
+
+    del trello_list.cards[index]
+    if changes.get("closed"):
+        return True
+
+    updates: dict[str, Any] = {}
+    if "name" in changes:
+        updates["name"] = changes["name"]
+    if "desc" in changes:
+        updates["description"] = changes["desc"][:DESCRIPTION_MAX_LENGTH]
+    if "due" in changes:
+        updates["due"] = changes["due"]
+        updates["due_at"] = parse_due(changes["due"])
+    if "dueComplete" in changes:
+        updates["due_complete"] = changes["dueComplete"]
+    card = replace(card, **updates)
+
+    target = board.lists.get(changes.get("idList"), trello_list)
+    if target is trello_list and "pos" not in changes:
+        target.cards.insert(index, card)
+    elif changes.get("pos") == "top":
+        target.cards.insert(0, card)
+    else:
+        target.cards.append(card)
+    return True
+
+
+def replace_lists(board: TrelloBoard, lists: list[dict[str, Any]], state: BoardSyncState) -> None:
+    """Replace the board's lists with a fresh set of open lists, keeping their cards."""
+    previous = board.lists
+    board.lists = {}
+    for trello_list in sorted(lists, key=lambda l: l.get("pos", 0)):
+        if trello_list.get("closed"):
+            continue
+        list_id = trello_list["id"]
+        board.lists[list_id] = TrelloList(
+            id=list_id,
+            name=trello_list["name"],
+            cards=previous[list_id].cards if list_id in previous else [],
+        )
+
+    for list_id, old_list in previous.items():
+        if list_id not in board.lists:
+            for card in old_list.cards:
+                state.card_positions.pop(card.id, None)
+
+
+# Card fields left out of stored snapshots when they hold their default
+_CARD_DEFAULTS = TrelloCard(id="", name="").as_dict()
+
+
+def snapshot_to_storage(data: dict[str, Any]) -> dict[str, Any]:
+    """Return a compact, JSON serializable copy of the coordinator data.
+
+    Card fields holding their default value are left out.
+    """
+    return {
+        "all_boards": data.get("all_boards", []),
+        "boards": {
+            board_id: {
+                "id": board.id,
+                "name": board.name,
+                "url": board.url,
+                "closed": board.closed,
+                "lists": [
+                    {
+                        "id": trello_list.id,
+                        "name": trello_list.name,
+                        "closed": trello_list.closed,
+                        "cards": [
+                            {
+                                key: value
+                                for key, value in card.as_dict().items()
+                                if key in ("id", "name") or value != _CARD_DEFAULTS[key]
+                            }
+                            for card in trello_list.cards
+                        ],
+                    }
+                    for trello_list in board.lists.values()
+                ],
+            }
+            for board_id, board in data.get("boards", {}).items()
+        },
+    }
+
+
+def _card_from_storage(stored: dict[str, Any]) -> TrelloCard:
+    """Rebuild a card from its stored form."""
+    return TrelloCard(
+        **{
+            **stored,
+            "labels": tuple(sys.intern(label) for label in stored.get("labels", ())),
+            "members": tuple(sys.intern(member) for member in stored.get("members", ())),
+            "due_at": parse_due(stored.get("due")),
+        }
+    )
+
+
+def snapshot_from_storage(stored: dict[str, Any], board_ids: list[str]) -> dict[str, Any]:
+    """Rebuild coordinator data for the monitored boards from a stored snapshot."""
+    boards: dict[str, TrelloBoard] = {}
+    for board_id, board in stored.get("boards", {}).items():
+        if board_id not in board_ids:
+            continue
+        boards[board_id] = TrelloBoard(
+            id=board["id"],
+            name=board["name"],
+            url=board["url"],
+            closed=board["closed"],
+            lists={
+                trello_list["id"]: TrelloList(
+                    id=trello_list["id"],
+                    name=trello_list["name"],
+                    closed=trello_list["closed"],
+                    cards=[_card_from_storage(card) for card in trello_list["cards"]],
+                )
+                for trello_list in board["lists"]
+            },
+        )
+    return {"boards": boards, "all_boards": stored.get("all_boards", [])}
@@ -0,0 +1,154 @@
+"""Trello webhook push updates for the Trello integration."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+
+from .api import TrelloApiError
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import TrelloDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Trello-Webhook"
+
+
+def compute_signature(secret: str, body: bytes, callback_url: str) -> str:
+    """Return the signature Trello sends for a webhook delivery.
+
+    Trello signs the raw request body followed by the callback URL with
+    HMAC-SHA1, keyed with the application's API secret, and base64 encodes
+    the digest.
+    """
+    digest = hmac.new(
+        secret.encode(), body + callback_url.encode(), hashlib.sha1
+    ).digest()
+    return base64.b64encode(digest).decode()
+
+
+class TrelloPushManager:
+    """Keep Trello webhooks registered for the boards of one config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: TrelloDataUpdateCoordinator,
+        webhook_id: str,
+        api_secret: str,
+    ) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.webhook_id = webhook_id
+        self.api_secret = api_secret
+        self.callback_url: str | None = None
+        self.trello_webhooks: dict[str, str] = {}
+
+    async def async_setup(self) -> bool:
+        """Register the HA endpoint and one Trello webhook per board."""
+        try:
+            # Trello must reach the callback, so an internal URL will not do
+            base_url = get_url(self.hass, allow_internal=False, prefer_external=True)
+        except NoURLAvailableError:
+            _LOGGER.error("Trello push updates need an external URL")
+            return False
+        self.callback_url = f"{base_url}{webhook.async_generate_path(self.webhook_id)}"
+
+        webhook.async_register(
+            self.hass,
+            DOMAIN,
+            self.entry.title,
+            self.webhook_id,
+            self._async_handle_webhook,
+            allowed_methods=["HEAD", "POST"],
+        )
+
+        try:
+            await self.async_sync_webhooks()
+        except TrelloApiError as err:
+            _LOGGER.error("Unable to create Trello webhooks: %s", err)
+            await self.async_unload()
+            return False
+
+        _LOGGER.info("Registered Trello webhooks for %d boards", len(self.trello_webhooks))
+        return True
+
+    async def async_sync_webhooks(self) -> None:
+        """Create webhooks for monitored boards and delete the ones no longer needed."""
+        client = self.coordinator.client
+        board_ids = set(self.coordinator.board_ids)
+        existing = await client.get(f"/tokens/{client.api_token}/webhooks")
+        for hook in existing:
+            if hook.get("callbackURL") != self.callback_url:
+                continue
+            if hook["idModel"] in board_ids:
+                self.trello_webhooks[hook["idModel"]] = hook["id"]
+            else:
+                await client.delete(f"/webhooks/{hook['id']}")
+                self.trello_webhooks.pop(hook["idModel"], None)
+
+        for board_id in self.coordinator.board_ids:
+            if board_id in self.trello_webhooks:
+                continue
+            hook = await client.post(
+                "/webhooks",
+                {
+                    "callbackURL": self.callback_url,
+                    "idModel": board_id,
+                    "description": f"Home Assistant ({self.entry.title})",
+                },
+            )
+            self.trello_webhooks[board_id] = hook["id"]
+
+    async def async_unload(self) -> None:
+        """Remove the Trello webhooks and the HA endpoint."""
+        webhook.async_unregister(self.hass, self.webhook_id)
+        client = self.coordinator.client
+        for board_id, hook_id in list(self.trello_webhooks.items()):
+            try:
+                await client.delete(f"/webhooks/{hook_id}")
+            except TrelloApiError as err:
+                _LOGGER.warning("Unable to delete Trello webhook for board %s: %s", board_id, err)
+            self.trello_webhooks.pop(board_id, None)
+
+    async def _async_handle_webhook(
+        self, hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Verify a Trello delivery and apply its action."""
+        # Trello checks the callback URL with a HEAD request before creating a webhook
+        if request.method == "HEAD":
+            return web.Response(status=200)
+
+        body = await request.read()
+        signature = request.headers.get(SIGNATURE_HEADER, "")
+        expected = compute_signature(self.api_secret, body, self.callback_url or "")
+        if not hmac.compare_digest(signature, expected):
+            _LOGGER.warning("Rejected Trello webhook delivery with an invalid signature")
+            return web.Response(status=401)
+
+        try:
+            payload = json.loads(body)
+            board_id = payload["model"]["id"]
+            action = payload["action"]
+        except (ValueError, KeyError, TypeError):
+            _LOGGER.warning("Ignoring malformed Trello webhook delivery")
+            return web.Response(status=400)
+
+        _LOGGER.debug("Received Trello %s action for board %s", action.get("type"), board_id)
+        hass.async_create_task(self.coordinator.async_apply_pushed_action(board_id, action))
+        return web.Response(status=200)
@@ -0,0 +1,104 @@
+"""Per-board adaptive poll scheduling for the Trello integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+# Quiet boards back off by this factor after each poll that found no change,
+# up to the ceiling. A change brings the board back to the base interval.
+POLL_BACKOFF_FACTOR = 2
+MAX_BOARD_POLL_INTERVAL = timedelta(hours=1)
+
+# Board polls allowed per hour for one config entry. With many boards the
+# shortest interval is stretched so polling stays within this budget.
+POLL_BUDGET_PER_HOUR = 1800
+
+
+@dataclass
+class BoardSchedule:
+    """When a board is next polled and how often it has been changing."""
+
+    interval: timedelta
+    next_poll: datetime
+    last_polled: datetime | None = None
+    last_changed: datetime | None = None
+    quiet_polls: int = 0
+
+
+class PollScheduler:
+    """Decide which boards are due on each coordinator refresh.
+
+    The coordinator still refreshes at its update interval, which is the
+    shortest interval any board can have. Boards that are not due keep their
+    last snapshot for that refresh.
+    """
+
+    def __init__(self, board_ids: list[str]) -> None:
+        """Initialize with every board due on the first refresh."""
+        self.board_ids = board_ids
+        self.schedules: dict[str, BoardSchedule] = {}
+        self._poll_all = False
+
+    def min_interval(self, base_interval: timedelta) -> timedelta:
+        """Return the shortest interval allowed by the base interval and the budget."""
+        budget_interval = timedelta(hours=1) * len(self.board_ids) / POLL_BUDGET_PER_HOUR
+        return max(base_interval, budget_interval)
+
+    def due_boards(self, now: datetime, base_interval: timedelta) -> set[str]:
+        """Return the boards to poll on a refresh running at now."""
+        if self._poll_all:
+            self._poll_all = False
+            return set(self.board_ids)
+        # Refreshes drift slightly, so anything due before the next one runs now
+        horizon = now + base_interval / 2
+        return {
+            board_id
+            for board_id in self.board_ids
+            if board_id not in self.schedules
+            or self.schedules[board_id].next_poll <= horizon
+        }
+
+    def record_poll(
+        self, board_id: str, now: datetime, base_interval: timedelta, changed: bool
+    ) -> None:
+        """Schedule the next poll of a board after a successful one."""
+        min_interval = self.min_interval(base_interval)
+        schedule = self.schedules.get(board_id)
+        if schedule is None or changed:
+            interval = min_interval
+            quiet_polls = 0
+            last_changed = now if schedule is not None else None
+        else:
+            interval = min(
+                schedule.interval * POLL_BACKOFF_FACTOR,
+                max(min_interval, MAX_BOARD_POLL_INTERVAL),
+            )
+            interval = max(interval, min_interval)
+            quiet_polls = schedule.quiet_polls + 1
+            last_changed = schedule.last_changed
+
+        self.schedules[board_id] = BoardSchedule(
+            interval=interval,
+            next_poll=now + interval,
+            last_polled=now,
+            last_changed=last_changed,
+            quiet_polls=quiet_polls,
+        )
+
+    def poll_all(self) -> None:
+        """Make every board due on the next refresh."""
+        self._poll_all = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the schedule of every board for diagnostics."""
+        return {
+            board_id: {
+                "interval_seconds": schedule.interval.total_seconds(),
+                "next_poll": schedule.next_poll.isoformat(),
+                "last_polled": schedule.last_polled.isoformat() if schedule.last_polled else None,
+                "last_changed": schedule.last_changed.isoformat() if schedule.last_changed else None,
+                "quiet_polls": schedule.quiet_polls,
+            }
+            for board_id, schedule in self.schedules.items()
+        }
@@ -1,19 +1,36 @@
 """Sensor platform for Trello integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
+from datetime import datetime
 import logging
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from . import TrelloDataUpdateCoordinator
-from .const import DOMAIN
+from .const import (
+    CARD_ATTRIBUTES_COUNT,
+    CARD_ATTRIBUTES_SUMMARY,
+    CONF_CARD_ATTRIBUTES,
+    DEFAULT_CARD_ATTRIBUTES,
+    DOMAIN,
+)
+from .flow import THROUGHPUT_WINDOW
+from .index import BoardSummary, ListSummary, fingerprint
+from .model import TrelloBoard, TrelloList
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,16 +42,57 @@ async def async_setup_entry(
 ) -> None:
     """Set up Trello sensors based on a config entry."""
     coordinator: TrelloDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities = []
-    entities.append(TrelloAccountSensor(coordinator, entry))
-
-    for board_id, board_data in coordinator.data.get("boards", {}).items():
-        entities.append(TrelloBoardSensor(coordinator, entry, board_id))
-        for list_id in board_data.get("lists", {}).keys():
-            entities.append(TrelloListSensor(coordinator, entry, board_id, list_id))
-
-    async_add_entities(entities)
+    card_attributes = entry.options.get(CONF_CARD_ATTRIBUTES, DEFAULT_CARD_ATTRIBUTES)
+    known_boards: set[str] = set()
+    known_lists: set[tuple[str, str]] = set()
+
+    @callback
+    def _async_add_new_entities() -> None:
+        """Add sensors for boards and lists that have no sensor yet.
+
+        Sensors of lists that were archived or deleted are kept and report
+        unavailable, so they come back if the list is restored.
+        """
+        # Forget removed boards, so their sensors are created again if re-added
+        monitored = set(coordinator.board_ids)
+        known_boards.intersection_update(monitored)
+        known_lists.difference_update(
+            [key for key in known_lists if key[0] not in monitored]
+        )
+
+        entities: list[TrelloSensor] = []
+        for board_id, board in (coordinator.data or {}).get("boards", {}).items():
+            if board_id not in known_boards:
+                known_boards.add(board_id)
+                entities.extend(
+                    [
+                        TrelloBoardSensor(coordinator, entry, board_id),
+                        TrelloThroughputSensor(coordinator, entry, board_id),
+                        TrelloCycleTimeSensor(coordinator, entry, board_id),
+                        TrelloWipAgeSensor(coordinator, entry, board_id),
+                    ]
+                )
+            for list_id in board.lists:
+                if (board_id, list_id) in known_lists:
+                    continue
+                known_lists.add((board_id, list_id))
+                entities.append(
+                    TrelloListSensor(coordinator, entry, board_id, list_id, card_attributes)
+                )
+        if entities:
+            _LOGGER.debug("Adding %d Trello sensors", len(entities))
+            async_add_entities(entities)
+
+    async_add_entities(
+        [
+            TrelloAccountSensor(coordinator, entry),
+            TrelloLastRefreshSensor(coordinator, entry),
+            TrelloRefreshDurationSensor(coordinator, entry),
+            TrelloApiRequestsSensor(coordinator, entry),
+        ]
+    )
+    _async_add_new_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
 
 
 def _make_device_info(entry: ConfigEntry) -> DeviceInfo:
@@ -48,13 +106,51 @@ def _make_device_info(entry: ConfigEntry) -> DeviceInfo:
     )
 
 
-class TrelloAccountSensor(CoordinatorEntity, SensorEntity):
+class TrelloSensor(CoordinatorEntity, SensorEntity):
+    """Base for Trello sensors that only write state when their data changed.
+
+    Every coordinator update reaches every sensor, but most refreshes leave
+    most boards and lists untouched. Each sensor fingerprints its own slice of
+    the data and skips the state write when the fingerprint is unchanged.
+    """
+
+    _last_fingerprint: tuple | None = None
+    _last_changed: datetime | None = None
+
+    @abstractmethod
+    def _data_fingerprint(self) -> int:
+        """Return the content hash of the data this sensor shows."""
+
+    async def async_added_to_hass(self) -> None:
+        """Record the fingerprint of the initial state."""
+        await super().async_added_to_hass()
+        self._last_fingerprint = (self.available, self._data_fingerprint())
+        self._last_changed = dt_util.now()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability or the sensor's data changed."""
+        current = (self.available, self._data_fingerprint())
+        if current == self._last_fingerprint:
+            return
+        self._last_fingerprint = current
+        self._last_changed = dt_util.now()
+        self.async_write_ha_state()
+
+    @property
+    def last_changed(self) -> datetime:
+        """Return when the sensor's data last changed."""
+        return self._last_changed or dt_util.now()
+
+
+class TrelloAccountSensor(TrelloSensor):
     """Representation of a Trello Account sensor showing all available boards."""
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:view-dashboard"
     _attr_native_unit_of_measurement = "boards"
+    _unrecorded_attributes = frozenset({"all_boards", "open_boards", "closed_boards"})
 
     def __init__(
         self,
@@ -72,65 +168,37 @@ class TrelloAccountSensor(CoordinatorEntity, SensorEntity):
         """Return the name of the sensor."""
         return "Account Boards"
 
+    def _data_fingerprint(self) -> int:
+        """Return the content hash of the account's boards."""
+        return self.coordinator.index.account_fingerprint
+
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        all_boards = self.coordinator.data.get("all_boards", [])
-        return len([b for b in all_boards if not b.get("closed", False)])
+        return self.coordinator.index.open_boards
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
-        all_boards = self.coordinator.data.get("all_boards", [])
-        monitored_board_ids = set(self.coordinator.board_ids)
-
-        boards_list = []
-        for board in all_boards:
-            board_id = board["id"]
-            is_monitored = board_id in monitored_board_ids
-            board_info = {
-                "id": board_id,
-                "name": board["name"],
-                "url": board.get("url", ""),
-                "closed": board.get("closed", False),
-                "monitored": is_monitored,
-            }
-            if is_monitored and board_id in self.coordinator.data.get("boards", {}):
-                detailed = self.coordinator.data["boards"][board_id]
-                board_info.update({
-                    "lists": detailed.get("list_count", 0),
-                    "total_cards": sum(
-                        list_data.get("card_count", 0)
-                        for list_data in detailed.get("lists", {}).values()
-                        if not list_data.get("closed", False)
-                    ),
-                })
-            boards_list.append(board_info)
-
-        boards_list.sort(key=lambda x: x["name"].lower())
-        open_boards = [b for b in boards_list if not b["closed"]]
-        closed_boards = [b for b in boards_list if b["closed"]]
-
         return {
-            "all_boards": boards_list,
-            "open_boards": open_boards,
-            "closed_boards": closed_boards,
-            "total_boards": len(all_boards),
-            "total_open": len(open_boards),
-            "total_closed": len(closed_boards),
-            "total_monitored": len([b for b in boards_list if b["monitored"]]),
-            "total_unmonitored": len([b for b in boards_list if not b["monitored"]]),
-            "last_updated": dt_util.now(),
+            **self.coordinator.index.account_attributes,
+            "last_updated": self.last_changed,
         }
 
 
-class TrelloBoardSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Trello Board sensor."""
+class TrelloBoardSensor(TrelloSensor):
+    """Representation of a Trello Board sensor.
+
+    Overdue and due-soon counts also change as time passes, so the sensor
+    sets a timer for the moment the next card crosses either boundary.
+    """
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:trello"
     _attr_native_unit_of_measurement = "lists"
+    _unrecorded_attributes = frozenset({"lists"})
+    _unsub_due_timer: CALLBACK_TYPE | None = None
 
     def __init__(
         self,
@@ -146,78 +214,260 @@ class TrelloBoardSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = _make_device_info(entry)
 
     @property
-    def board_data(self) -> dict:
+    def board(self) -> TrelloBoard | None:
         """Return the board data."""
-        return self.coordinator.data.get("boards", {}).get(self._board_id, {})
+        return self.coordinator.data.get("boards", {}).get(self._board_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last refresh returned data for the board."""
+        return super().available and self.board is not None
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return self.board_data.get("name", "Unknown Board")
+        return self.board.name if self.board else "Unknown Board"
+
+    @property
+    def board_summary(self) -> BoardSummary:
+        """Return the precomputed summary of the board."""
+        return self.coordinator.index.board_summary(self._board_id)
+
+    def _data_fingerprint(self) -> int:
+        """Return the content hash of the board and its current due counts."""
+        summary = self.board_summary
+        now = dt_util.utcnow()
+        return hash(
+            (summary.fingerprint, summary.overdue_count(now), summary.due_soon_count(now))
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start the due date timer."""
+        await super().async_added_to_hass()
+        self._schedule_due_timer()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the due date timer."""
+        self._cancel_due_timer()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if needed and reschedule the due date timer for the new data."""
+        super()._handle_coordinator_update()
+        self._schedule_due_timer()
+
+    @callback
+    def _schedule_due_timer(self) -> None:
+        """Wake up when the next card becomes overdue or due soon."""
+        self._cancel_due_timer()
+        next_change = self.board_summary.next_due_change(dt_util.utcnow())
+        if next_change is not None:
+            self._unsub_due_timer = async_track_point_in_utc_time(
+                self.hass, self._async_due_change, next_change
+            )
+
+    @callback
+    def _cancel_due_timer(self) -> None:
+        """Cancel a pending due date timer."""
+        if self._unsub_due_timer is not None:
+            self._unsub_due_timer()
+            self._unsub_due_timer = None
+
+    @callback
+    def _async_due_change(self, _now: datetime) -> None:
+        """Update the due counts when a card crossed a boundary."""
+        self._unsub_due_timer = None
+        self._handle_coordinator_update()
 
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self.board_data.get("list_count", 0)
+        return self.board.list_count if self.board else 0
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
-        board = self.board_data
-        now = dt_util.now()
-
-        total_cards = 0
-        overdue_cards = 0
-        due_soon_cards = 0
-
-        for list_data in board.get("lists", {}).values():
-            if list_data.get("closed", False):
-                continue
-            open_cards = [c for c in list_data.get("cards", []) if not c.get("closed", False)]
-            total_cards += len(open_cards)
-
-            for card in open_cards:
-                if card.get("due") and not card.get("due_complete"):
-                    try:
-                        due_date = dt_util.parse_datetime(card["due"])
-                        if due_date is not None:
-                            if due_date < now:
-                                overdue_cards += 1
-                            elif (due_date - now).total_seconds() <= 7 * 86400:
-                                due_soon_cards += 1
-                    except (ValueError, TypeError):
-                        pass
+        board = self.board
+        summary = self.board_summary
+        now = dt_util.utcnow()
 
         return {
-            "board_id": board.get("id"),
-            "board_url": board.get("url"),
-            "closed": board.get("closed", False),
-            "total_cards": total_cards,
-            "overdue_cards": overdue_cards,
-            "due_soon_cards": due_soon_cards,
-            "lists": [
-                {
-                    "id": list_id,
-                    "name": list_data.get("name"),
-                    "card_count": len([
-                        c for c in list_data.get("cards", [])
-                        if not c.get("closed", False)
-                    ]),
-                }
-                for list_id, list_data in board.get("lists", {}).items()
-                if not list_data.get("closed", False)
-            ],
-            "last_updated": dt_util.now(),
+            "board_id": board.id if board else None,
+            "board_url": board.url if board else None,
+            "closed": board.closed if board else False,
+            "total_cards": summary.total_cards,
+            "overdue_cards": summary.overdue_count(now),
+            "due_soon_cards": summary.due_soon_count(now),
+            "lists": summary.lists,
+            "last_updated": self.last_changed,
         }
 
 
-class TrelloListSensor(CoordinatorEntity, SensorEntity):
+class TrelloBoardFlowSensor(TrelloSensor):
+    """Base for sensors reading the card flow history of a board.
+
+    The last open list of the board counts as done. Values that change with
+    time are rounded, so the state is written at most once per refresh in
+    which they moved.
+    """
+
+    _attr_has_entity_name = True
+    _flow_name = ""
+
+    def __init__(
+        self,
+        coordinator: TrelloDataUpdateCoordinator,
+        entry: ConfigEntry,
+        board_id: str,
+        key: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._board_id = board_id
+        self._attr_unique_id = f"{entry.entry_id}_{board_id}_{key}"
+        self._attr_device_info = _make_device_info(entry)
+
+    @property
+    def board(self) -> TrelloBoard | None:
+        """Return the board data."""
+        return self.coordinator.data.get("boards", {}).get(self._board_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last refresh returned data for the board."""
+        return super().available and self.board is not None
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        board_name = self.board.name if self.board else "Unknown Board"
+        return f"{board_name} {self._flow_name}"
+
+    def _data_fingerprint(self) -> int:
+        """Return the content hash of the value and attributes."""
+        return fingerprint((self.native_value, self._flow_attributes()))
+
+    def _flow_attributes(self) -> dict:
+        """Return the attributes derived from the flow history."""
+        board = self.board
+        done_list = self.coordinator.flow.done_list(self._board_id)
+        return {
+            "board_id": self._board_id,
+            "done_list": (
+                board.lists[done_list].name if board and done_list in board.lists else None
+            ),
+        }
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return additional state attributes."""
+        return {**self._flow_attributes(), "last_updated": self.last_changed}
+
+
+def _days(seconds: float | None) -> float | None:
+    """Convert seconds to days rounded for display."""
+    return None if seconds is None else round(seconds / 86400, 2)
+
+
+class TrelloThroughputSensor(TrelloBoardFlowSensor):
+    """Cards of a board that reached the done list within the last week."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "cards"
+    _attr_icon = "mdi:check-all"
+    _flow_name = "Throughput"
+
+    def __init__(
+        self, coordinator: TrelloDataUpdateCoordinator, entry: ConfigEntry, board_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, board_id, "throughput")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of cards done within the window."""
+        return self.coordinator.flow.throughput(self._board_id, dt_util.utcnow().timestamp())
+
+    def _flow_attributes(self) -> dict:
+        """Return the window the throughput covers."""
+        return {**super()._flow_attributes(), "window_days": THROUGHPUT_WINDOW.days}
+
+
+class TrelloCycleTimeSensor(TrelloBoardFlowSensor):
+    """Mean time from a card first being seen to it reaching the done list."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_suggested_display_precision = 1
+    _attr_icon = "mdi:timer-sand-complete"
+    _flow_name = "Cycle Time"
+
+    def __init__(
+        self, coordinator: TrelloDataUpdateCoordinator, entry: ConfigEntry, board_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, board_id, "cycle_time")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean cycle time of the cards done in the kept history."""
+        return _days(self.coordinator.flow.cycle_time(self._board_id))
+
+    def _flow_attributes(self) -> dict:
+        """Return the mean days cards spent in each open list before leaving it."""
+        board = self.board
+        list_times = self.coordinator.flow.list_times(self._board_id)
+        return {
+            **super()._flow_attributes(),
+            "list_days": {
+                trello_list.name: _days(list_times[list_id])
+                for list_id, trello_list in (board.lists.items() if board else ())
+                if list_id in list_times and not trello_list.closed
+            },
+        }
+
+
+class TrelloWipAgeSensor(TrelloBoardFlowSensor):
+    """Mean time the cards in progress on a board have sat in their list."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_suggested_display_precision = 1
+    _attr_icon = "mdi:progress-clock"
+    _flow_name = "WIP Age"
+
+    def __init__(
+        self, coordinator: TrelloDataUpdateCoordinator, entry: ConfigEntry, board_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry, board_id, "wip_age")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean age of the cards in progress."""
+        return _days(
+            self.coordinator.flow.wip_age(self._board_id, dt_util.utcnow().timestamp())
+        )
+
+    def _flow_attributes(self) -> dict:
+        """Return the number of cards in progress."""
+        return {
+            **super()._flow_attributes(),
+            "wip_cards": self.coordinator.flow.wip_count(self._board_id),
+        }
+
+
+class TrelloListSensor(TrelloSensor):
     """Representation of a Trello List sensor."""
 
     _attr_has_entity_name = True
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:format-list-bulleted"
     _attr_native_unit_of_measurement = "cards"
+    _unrecorded_attributes = frozenset({"cards"})
 
     def __init__(
         self,
@@ -225,47 +475,187 @@ class TrelloListSensor(CoordinatorEntity, SensorEntity):
         entry: ConfigEntry,
         board_id: str,
         list_id: str,
+        card_attributes: str = DEFAULT_CARD_ATTRIBUTES,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._board_id = board_id
         self._list_id = list_id
+        self._card_attributes = card_attributes
         self._attr_unique_id = f"{entry.entry_id}_{board_id}_{list_id}"
         self._attr_device_info = _make_device_info(entry)
 
     @property
-    def board_data(self) -> dict:
+    def board(self) -> TrelloBoard | None:
         """Return the board data."""
-        return self.coordinator.data.get("boards", {}).get(self._board_id, {})
+        return self.coordinator.data.get("boards", {}).get(self._board_id)
 
     @property
-    def list_data(self) -> dict:
+    def trello_list(self) -> TrelloList | None:
         """Return the list data."""
-        return self.board_data.get("lists", {}).get(self._list_id, {})
+        return self.board.lists.get(self._list_id) if self.board else None
+
+    @property
+    def available(self) -> bool:
+        """Return True while the list is open on the board."""
+        trello_list = self.trello_list
+        return super().available and trello_list is not None and not trello_list.closed
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        board_name = self.board_data.get("name", "Unknown")
-        list_name = self.list_data.get("name", "Unknown List")
+        board_name = self.board.name if self.board else "Unknown"
+        list_name = self.trello_list.name if self.trello_list else "Unknown List"
         return f"{board_name} - {list_name}"
 
+    @property
+    def list_summary(self) -> ListSummary:
+        """Return the precomputed summary of the list."""
+        return self.coordinator.index.list_summary(self._board_id, self._list_id)
+
+    def _data_fingerprint(self) -> int:
+        """Return the content hash of the list."""
+        return self.list_summary.fingerprint
+
     @property
     def native_value(self) -> int:
         """Return the state of the sensor (open cards only)."""
-        return len([c for c in self.list_data.get("cards", []) if not c.get("closed", False)])
+        return self.list_summary.open_count
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
-        list_data = self.list_data
-        open_cards = [c for c in list_data.get("cards", []) if not c.get("closed", False)]
+        trello_list = self.trello_list
+        attributes = {
+            "board_id": self._board_id,
+            "board_name": self.board.name if self.board else None,
+            "list_id": trello_list.id if trello_list else None,
+            "closed": trello_list.closed if trello_list else False,
+            "last_updated": self.last_changed,
+        }
+        if self._card_attributes == CARD_ATTRIBUTES_COUNT:
+            return attributes
+
+        summary = self.list_summary
+        if self._card_attributes == CARD_ATTRIBUTES_SUMMARY:
+            attributes["cards"] = summary.card_summaries()
+        else:
+            attributes["cards"] = summary.card_dicts()
+        return attributes
+
+
+class TrelloLastRefreshSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor with the time Trello data was last refreshed."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:update"
+
+    def __init__(
+        self,
+        coordinator: TrelloDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_last_refresh"
+        self._attr_device_info = _make_device_info(entry)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "Last Refresh"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the time of the last successful refresh."""
+        return self.coordinator.last_refreshed
+
+
+class TrelloRefreshDurationSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor with how long the last refresh took."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self,
+        coordinator: TrelloDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_refresh_duration"
+        self._attr_device_info = _make_device_info(entry)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "Refresh Duration"
 
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last refresh."""
+        return self.coordinator.timings.last("refresh")
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the latest duration of each refresh phase."""
         return {
-            "board_id": self._board_id,
-            "board_name": self.board_data.get("name"),
-            "list_id": list_data.get("id"),
-            "closed": list_data.get("closed", False),
-            "cards": open_cards,
-            "last_updated": dt_util.now(),
+            phase: round(timing.last, 3)
+            for phase, timing in self.coordinator.timings.phases.items()
+            if phase != "refresh"
+        }
+
+
+class TrelloApiRequestsSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor counting the requests sent with the entry's token.
+
+    Entries sharing a token share one API client, so they report the same
+    totals.
+    """
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = "requests"
+    _attr_icon = "mdi:swap-horizontal"
+
+    def __init__(
+        self,
+        coordinator: TrelloDataUpdateCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_api_requests"
+        self._attr_device_info = _make_device_info(entry)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return "API Requests"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests sent."""
+        return self.coordinator.client.metrics.requests
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return error, rate limit, traffic and cache totals."""
+        client = self.coordinator.client
+        return {
+            "errors": client.metrics.errors,
+            "rate_limited": client.stats["rate_limited"],
+            "retried": client.stats["requests_retried"],
+            "bytes_received": client.metrics.bytes_received,
+            "cache_hits": client.stats["cache_hits"],
+            "coalesced": client.stats["requests_coalesced"],
         }
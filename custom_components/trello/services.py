@@ -0,0 +1,373 @@
+"""Services for the Trello integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import TrelloApiError
+from .const import (
+    ATTR_BOARD_ID,
+    ATTR_CARD_ID,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DESCRIPTION,
+    ATTR_DUE,
+    ATTR_DUE_COMPLETE,
+    ATTR_LABEL,
+    ATTR_LIST_ID,
+    ATTR_LIST_NAME,
+    ATTR_MEMBER,
+    ATTR_NAME,
+    ATTR_POSITION,
+    DOMAIN,
+    DUE_FILTERS,
+    POSITION_BOTTOM,
+    POSITIONS,
+)
+
+if TYPE_CHECKING:
+    from . import TrelloDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_REFRESH = "refresh"
+SERVICE_GET_CARDS = "get_cards"
+SERVICE_SEARCH_CARDS = "search_cards"
+SERVICE_CREATE_CARD = "create_card"
+SERVICE_MOVE_CARD = "move_card"
+SERVICE_UPDATE_CARD = "update_card"
+SERVICE_ARCHIVE_CARD = "archive_card"
+
+SERVICES = (
+    SERVICE_REFRESH,
+    SERVICE_GET_CARDS,
+    SERVICE_SEARCH_CARDS,
+    SERVICE_CREATE_CARD,
+    SERVICE_MOVE_CARD,
+    SERVICE_UPDATE_CARD,
+    SERVICE_ARCHIVE_CARD,
+)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_BOARD_ID): cv.string,
+    }
+)
+
+GET_CARDS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_BOARD_ID): cv.string,
+        vol.Optional(ATTR_LIST_ID): cv.string,
+    }
+)
+
+
+SEARCH_CARDS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_BOARD_ID): cv.string,
+        vol.Optional(ATTR_MEMBER): cv.string,
+        vol.Optional(ATTR_LABEL): cv.string,
+        vol.Optional(ATTR_LIST_NAME): cv.string,
+        vol.Optional(ATTR_DUE): vol.In(DUE_FILTERS),
+    }
+)
+
+CREATE_CARD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_LIST_ID): cv.string,
+        vol.Required(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_DESCRIPTION): cv.string,
+        vol.Optional(ATTR_DUE): cv.datetime,
+        vol.Optional(ATTR_POSITION, default=POSITION_BOTTOM): vol.In(POSITIONS),
+    }
+)
+
+MOVE_CARD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_CARD_ID): cv.string,
+        vol.Required(ATTR_LIST_ID): cv.string,
+        vol.Optional(ATTR_POSITION, default=POSITION_BOTTOM): vol.In(POSITIONS),
+    }
+)
+
+UPDATE_CARD_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Required(ATTR_CARD_ID): cv.string,
+            vol.Optional(ATTR_NAME): cv.string,
+            vol.Optional(ATTR_DESCRIPTION): cv.string,
+            vol.Optional(ATTR_DUE): cv.datetime,
+            vol.Optional(ATTR_DUE_COMPLETE): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_NAME, ATTR_DESCRIPTION, ATTR_DUE, ATTR_DUE_COMPLETE),
+)
+
+ARCHIVE_CARD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_CARD_ID): cv.string,
+    }
+)
+
+
+def _coordinators(
+    hass: HomeAssistant, config_entry_id: str | None
+) -> list[TrelloDataUpdateCoordinator]:
+    """Return the coordinators a service call applies to."""
+    coordinators = hass.data.get(DOMAIN, {})
+    if config_entry_id is None:
+        return list(coordinators.values())
+    if config_entry_id not in coordinators:
+        raise ServiceValidationError(f"Config entry ID not found: {config_entry_id}")
+    return [coordinators[config_entry_id]]
+
+
+def _find_card(
+    hass: HomeAssistant, config_entry_id: str | None, card_id: str
+) -> tuple[TrelloDataUpdateCoordinator, str]:
+    """Return the coordinator and board holding an open card."""
+    for coordinator in _coordinators(hass, config_entry_id):
+        for board_id, board in (coordinator.data or {}).get("boards", {}).items():
+            for trello_list in board.lists.values():
+                if any(card.id == card_id for card in trello_list.cards):
+                    return coordinator, board_id
+    raise ServiceValidationError(f"Card not found on a monitored board: {card_id}")
+
+
+def _find_list(
+    hass: HomeAssistant, config_entry_id: str | None, list_id: str
+) -> tuple[TrelloDataUpdateCoordinator, str]:
+    """Return the coordinator and board holding a list."""
+    for coordinator in _coordinators(hass, config_entry_id):
+        for board_id, board in (coordinator.data or {}).get("boards", {}).items():
+            if list_id in board.lists:
+                return coordinator, board_id
+    raise ServiceValidationError(f"List not found on a monitored board: {list_id}")
+
+
+def _trello_date(value: datetime) -> str:
+    """Format a date the way Trello returns it, treating naive values as local time."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return dt_util.as_utc(value).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _card_changes(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert service call data to Trello card parameters."""
+    changes: dict[str, Any] = {}
+    if ATTR_NAME in data:
+        changes["name"] = data[ATTR_NAME]
+    if ATTR_DESCRIPTION in data:
+        changes["desc"] = data[ATTR_DESCRIPTION]
+    if ATTR_DUE in data:
+        changes["due"] = _trello_date(data[ATTR_DUE])
+    if ATTR_DUE_COMPLETE in data:
+        changes["dueComplete"] = data[ATTR_DUE_COMPLETE]
+    if ATTR_LIST_ID in data:
+        changes["idList"] = data[ATTR_LIST_ID]
+    if ATTR_POSITION in data:
+        changes["pos"] = data[ATTR_POSITION]
+    return changes
+
+
+def _card_response(payload: dict[str, Any]) -> ServiceResponse:
+    """Return the fields of a written card that service responses include."""
+    return {
+        "card": {
+            "id": payload["id"],
+            "name": payload.get("name"),
+            "url": payload.get("url"),
+            "closed": payload.get("closed", False),
+            "board_id": payload.get("idBoard"),
+            "list_id": payload.get("idList"),
+        }
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Trello services once, for the first config entry."""
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    async def handle_refresh(call: ServiceCall) -> None:
+        """Handle the refresh service call.
+
+        Calls are debounced per entry: a call made while a refresh is running
+        shares it, and calls during the cooldown after it are folded into a
+        single follow-up refresh.
+        """
+        config_entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        board_id = call.data.get(ATTR_BOARD_ID)
+
+        if config_entry_id:
+            # Refresh specific entry
+            if config_entry_id not in hass.data[DOMAIN]:
+                _LOGGER.error("Config entry ID not found: %s", config_entry_id)
+                return
+            _LOGGER.info("Refreshing Trello data for config entry: %s", config_entry_id)
+            coordinators = [hass.data[DOMAIN][config_entry_id]]
+        else:
+            _LOGGER.info("Refreshing all Trello integrations")
+            coordinators = list(hass.data[DOMAIN].values())
+
+        if board_id:
+            coordinators = [c for c in coordinators if board_id in c.board_ids]
+            if not coordinators:
+                _LOGGER.error("Board ID not monitored: %s", board_id)
+                return
+            await asyncio.gather(*(c.async_refresh_board(board_id) for c in coordinators))
+        else:
+            # Refresh all entries at once so boards they share are fetched once
+            await asyncio.gather(*(c.async_request_full_refresh() for c in coordinators))
+
+    @callback
+    def handle_get_cards(call: ServiceCall) -> ServiceResponse:
+        """Return the open cards of the matching boards and lists."""
+        board_id = call.data.get(ATTR_BOARD_ID)
+        list_id = call.data.get(ATTR_LIST_ID)
+
+        cards = []
+        for coordinator in _coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY_ID)):
+            for current_board_id, board in (coordinator.data or {}).get("boards", {}).items():
+                if board_id and current_board_id != board_id:
+                    continue
+                for current_list_id, trello_list in board.lists.items():
+                    if list_id and current_list_id != list_id:
+                        continue
+                    summary = coordinator.index.list_summary(current_board_id, current_list_id)
+                    cards.extend(
+                        {
+                            **card,
+                            "board_id": current_board_id,
+                            "board_name": board.name,
+                            "list_id": current_list_id,
+                            "list_name": trello_list.name,
+                        }
+                        for card in summary.card_dicts()
+                    )
+
+        return {"cards": cards}
+
+    @callback
+    def handle_search_cards(call: ServiceCall) -> ServiceResponse:
+        """Return the open cards matching every given filter, from the card index."""
+        now = dt_util.utcnow()
+        cards = []
+        for coordinator in _coordinators(hass, call.data.get(ATTR_CONFIG_ENTRY_ID)):
+            cards.extend(
+                indexed.as_dict()
+                for indexed in coordinator.card_search_index().search(
+                    now,
+                    board_id=call.data.get(ATTR_BOARD_ID),
+                    member=call.data.get(ATTR_MEMBER),
+                    label=call.data.get(ATTR_LABEL),
+                    list_name=call.data.get(ATTR_LIST_NAME),
+                    due=call.data.get(ATTR_DUE),
+                )
+            )
+
+        return {"cards": cards}
+
+    async def handle_create_card(call: ServiceCall) -> ServiceResponse:
+        """Create a card in a list of a monitored board."""
+        coordinator, board_id = _find_list(
+            hass, call.data.get(ATTR_CONFIG_ENTRY_ID), call.data[ATTR_LIST_ID]
+        )
+        try:
+            payload = await coordinator.async_create_card(board_id, _card_changes(call.data))
+        except (TrelloApiError, aiohttp.ClientError, TimeoutError, asyncio.TimeoutError) as err:
+            raise HomeAssistantError(f"Unable to create Trello card: {err}") from err
+        return _card_response(payload)
+
+    async def _async_update_card(
+        call: ServiceCall, changes: dict[str, Any], list_id: str | None = None
+    ) -> ServiceResponse:
+        """Queue changes to a card, optionally checking the target list is on its board."""
+        card_id = call.data[ATTR_CARD_ID]
+        coordinator, board_id = _find_card(hass, call.data.get(ATTR_CONFIG_ENTRY_ID), card_id)
+        if list_id is not None and list_id not in coordinator.data["boards"][board_id].lists:
+            raise ServiceValidationError(
+                f"List {list_id} is not on the board of card {card_id}"
+            )
+        try:
+            payload = await coordinator.async_update_card(board_id, card_id, changes)
+        except (TrelloApiError, aiohttp.ClientError, TimeoutError, asyncio.TimeoutError) as err:
+            raise HomeAssistantError(f"Unable to update Trello card {card_id}: {err}") from err
+        return _card_response(payload)
+
+    async def handle_move_card(call: ServiceCall) -> ServiceResponse:
+        """Move a card to another list of its board."""
+        return await _async_update_card(
+            call, _card_changes(call.data), list_id=call.data[ATTR_LIST_ID]
+        )
+
+    async def handle_update_card(call: ServiceCall) -> ServiceResponse:
+        """Change the name, description or due date of a card."""
+        return await _async_update_card(call, _card_changes(call.data))
+
+    async def handle_archive_card(call: ServiceCall) -> ServiceResponse:
+        """Archive a card."""
+        return await _async_update_card(call, {"closed": True})
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, handle_refresh, schema=REFRESH_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CARDS,
+        handle_get_cards,
+        schema=GET_CARDS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_CARDS,
+        handle_search_cards,
+        schema=SEARCH_CARDS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    for service, handler, schema in (
+        (SERVICE_CREATE_CARD, handle_create_card, CREATE_CARD_SCHEMA),
+        (SERVICE_MOVE_CARD, handle_move_card, MOVE_CARD_SCHEMA),
+        (SERVICE_UPDATE_CARD, handle_update_card, UPDATE_CARD_SCHEMA),
+        (SERVICE_ARCHIVE_CARD, handle_archive_card, ARCHIVE_CARD_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+    _LOGGER.info("Registered Trello services")
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the Trello services once the last config entry is unloaded."""
+    for service in SERVICES:
+        if hass.services.has_service(DOMAIN, service):
+            hass.services.async_remove(DOMAIN, service)
+    _LOGGER.info("Unregistered Trello services")
@@ -0,0 +1,108 @@
+"""Queued card writes for the Trello integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from .api import TrelloApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Updates to the same card arriving within this many seconds of each other
+# are merged into one request
+WRITE_BATCH_DELAY = 0.5
+
+# Writes sent at once, so a burst of service calls leaves room for polling
+WRITE_CONCURRENCY = 4
+
+
+def write_params(changes: dict[str, Any]) -> dict[str, str]:
+    """Convert card changes to query parameters."""
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else str(value)
+        for key, value in changes.items()
+    }
+
+
+@dataclass(slots=True)
+class PendingWrite:
+    """Updates to one card waiting to be sent, and the callers waiting on them."""
+
+    changes: dict[str, Any] = field(default_factory=dict)
+    waiters: list[asyncio.Future] = field(default_factory=list)
+
+
+class TrelloWriteQueue:
+    """Send card writes in order, merging queued updates of the same card.
+
+    Each card has at most one update in flight. Updates queued for a card
+    while it waits or while its previous update is being sent are merged in
+    call order, later values winning, and go out as the next single PUT.
+    Every caller whose changes went into a request gets its response. All
+    requests go through the API client, so they share its rate limit.
+    """
+
+    def __init__(self, client: TrelloApiClient) -> None:
+        """Initialize an empty queue."""
+        self.client = client
+        self._pending: dict[str, PendingWrite] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(WRITE_CONCURRENCY)
+        self.stats = {"writes_queued": 0, "writes_sent": 0, "writes_merged": 0}
+
+    async def async_create_card(self, changes: dict[str, Any]) -> dict[str, Any]:
+        """Create a card and return its payload."""
+        self.stats["writes_queued"] += 1
+        async with self._semaphore:
+            self.stats["writes_sent"] += 1
+            return await self.client.post("/cards", write_params(changes))
+
+    async def async_update_card(self, card_id: str, changes: dict[str, Any]) -> dict[str, Any]:
+        """Queue changes to a card and return its payload once they were sent."""
+        self.stats["writes_queued"] += 1
+        pending = self._pending.get(card_id)
+        if pending is None:
+            pending = self._pending[card_id] = PendingWrite()
+        else:
+            self.stats["writes_merged"] += 1
+        pending.changes.update(changes)
+        waiter = asyncio.get_running_loop().create_future()
+        pending.waiters.append(waiter)
+
+        if card_id not in self._workers:
+            worker = asyncio.get_running_loop().create_task(self._async_send(card_id))
+            self._workers[card_id] = worker
+        return await waiter
+
+    async def _async_send(self, card_id: str) -> None:
+        """Send the queued updates of a card until none are left."""
+        try:
+            await asyncio.sleep(WRITE_BATCH_DELAY)
+            while (pending := self._pending.pop(card_id, None)) is not None:
+                try:
+                    async with self._semaphore:
+                        self.stats["writes_sent"] += 1
+                        payload = await self.client.put(
+                            f"/cards/{card_id}", write_params(pending.changes)
+                        )
+                except asyncio.CancelledError:
+                    for waiter in pending.waiters:
+                        waiter.cancel()
+                    raise
+                except Exception as err:
+                    _LOGGER.debug("Update of card %s failed: %s", card_id, err)
+                    for waiter in pending.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(err)
+                else:
+                    for waiter in pending.waiters:
+                        if not waiter.done():
+                            waiter.set_result(payload)
+        finally:
+            del self._workers[card_id]
+            # Only left behind when the worker was cancelled
+            if (pending := self._pending.pop(card_id, None)) is not None:
+                for waiter in pending.waiters:
+                    waiter.cancel()
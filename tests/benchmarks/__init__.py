@@ -0,0 +1,6 @@
+"""Benchmarks of the Trello integration against the fake Trello API.
+
+They are skipped by a plain pytest run. Run them with
+``python -m tests.benchmarks`` from the repository root, which prints a
+table of the measurements at the end, or with ``pytest --benchmark``.
+"""
@@ -0,0 +1,7 @@
+"""Run the benchmarks: python -m tests.benchmarks [pytest arguments]."""
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.exit(pytest.main([str(Path(__file__).parent), "--benchmark", "-q", *sys.argv[1:]]))
@@ -0,0 +1,33 @@
+"""Fixtures for the benchmarks."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+REPORT = pytest.StashKey[list[tuple[str, dict[str, Any]]]]()
+
+
+@pytest.fixture
+def report(request: pytest.FixtureRequest):
+    """Return a function recording named measurements for the summary table."""
+    rows = request.config.stash.setdefault(REPORT, [])
+
+    def add(name: str, **values: Any) -> None:
+        rows.append((f"{request.node.name} {name}".strip(), values))
+
+    return add
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    """Print the recorded measurements."""
+    rows = config.stash.get(REPORT, [])
+    if not rows:
+        return
+    terminalreporter.section("Trello benchmarks")
+    for name, values in rows:
+        measured = ", ".join(
+            f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in values.items()
+        )
+        terminalreporter.write_line(f"{name}: {measured}")
@@ -0,0 +1,215 @@
+"""The integration's code paths before the optimizations, for comparison.
+
+Each function keeps the shape and cost of the code it replaces. The fetch
+goes through TrelloApiClient so its requests reach the fake server.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.trello.api import TrelloApiClient
+
+LEGACY_CARD_FIELDS = "id,name,url,closed,due,dueComplete,desc,labels,idMembers,badges"
+
+
+def legacy_card(card: dict[str, Any]) -> dict[str, Any]:
+    """Return the dict the coordinator used to keep for every card."""
+    return {
+        "id": card["id"],
+        "name": card["name"],
+        "url": card.get("url", ""),
+        "closed": card.get("closed", False),
+        "due": card.get("due"),
+        "due_complete": card.get("dueComplete", False),
+        "description": card.get("desc", "")[:512],
+        "labels": [label["name"] for label in card.get("labels", []) if label.get("name")],
+        "members": [
+            member.get("fullName", member.get("username", "Unknown"))
+            for member in card.get("members", [])
+        ],
+        "checklist_items": card.get("badges", {}).get("checkItems", 0),
+        "checklist_items_checked": card.get("badges", {}).get("checkItemsChecked", 0),
+        "attachments": card.get("badges", {}).get("attachments", 0),
+        "comments": card.get("badges", {}).get("comments", 0),
+    }
+
+
+async def legacy_fetch(client: TrelloApiClient, board_ids: list[str]) -> dict[str, Any]:
+    """Fetch boards one after another, with a request per board, its lists and each list."""
+    data: dict[str, Any] = {"boards": {}, "all_boards": []}
+    data["all_boards"] = await client.get(
+        "/members/me/boards", {"filter": "all", "fields": "id,name,url,closed"}
+    )
+    for board_id in board_ids:
+        board = await client.get(f"/boards/{board_id}")
+        lists = await client.get(f"/boards/{board_id}/lists")
+        board_info = {
+            "id": board["id"],
+            "name": board["name"],
+            "url": board.get("url", ""),
+            "closed": board.get("closed", False),
+            "lists": {},
+        }
+        for trello_list in lists:
+            cards = await client.get(
+                f"/lists/{trello_list['id']}/cards",
+                {
+                    "fields": LEGACY_CARD_FIELDS,
+                    "filter": "open",
+                    "members": "true",
+                    "member_fields": "fullName,username",
+                },
+            )
+            card_list = [legacy_card(card) for card in cards]
+            board_info["lists"][trello_list["id"]] = {
+                "id": trello_list["id"],
+                "name": trello_list["name"],
+                "closed": trello_list.get("closed", False),
+                "cards": card_list,
+                "card_count": len(card_list),
+            }
+        board_info["list_count"] = len(
+            [l for l in board_info["lists"].values() if not l["closed"]]
+        )
+        data["boards"][board_id] = board_info
+    return data
+
+
+def legacy_board(payload: dict[str, Any]) -> dict[str, Any]:
+    """Return the dict tree the coordinator used to keep for a nested board snapshot."""
+    members = {member["id"]: member for member in payload.get("members", [])}
+    cards_by_list: dict[str, list[dict[str, Any]]] = {}
+    for card in sorted(payload.get("cards", []), key=lambda c: c.get("pos", 0)):
+        card = {**card, "members": [members[m] for m in card.get("idMembers", []) if m in members]}
+        cards_by_list.setdefault(card["idList"], []).append(legacy_card(card))
+
+    lists = {}
+    for trello_list in sorted(payload.get("lists", []), key=lambda l: l.get("pos", 0)):
+        card_list = cards_by_list.get(trello_list["id"], [])
+        lists[trello_list["id"]] = {
+            "id": trello_list["id"],
+            "name": trello_list["name"],
+            "closed": trello_list.get("closed", False),
+            "cards": card_list,
+            "card_count": len(card_list),
+        }
+    return {
+        "id": payload["id"],
+        "name": payload["name"],
+        "url": payload.get("url", ""),
+        "closed": payload.get("closed", False),
+        "lists": lists,
+        "list_count": len([l for l in lists.values() if not l["closed"]]),
+    }
+
+
+def legacy_account_attributes(data: dict[str, Any], board_ids: list[str]) -> dict[str, Any]:
+    """Return the account sensor attributes, summing every board's cards on each read."""
+    all_boards = data.get("all_boards", [])
+    monitored_board_ids = set(board_ids)
+
+    boards_list = []
+    for board in all_boards:
+        board_id = board["id"]
+        is_monitored = board_id in monitored_board_ids
+        board_info = {
+            "id": board_id,
+            "name": board["name"],
+            "url": board.get("url", ""),
+            "closed": board.get("closed", False),
+            "monitored": is_monitored,
+        }
+        if is_monitored and board_id in data.get("boards", {}):
+            detailed = data["boards"][board_id]
+            board_info.update({
+                "lists": detailed.get("list_count", 0),
+                "total_cards": sum(
+                    list_data.get("card_count", 0)
+                    for list_data in detailed.get("lists", {}).values()
+                    if not list_data.get("closed", False)
+                ),
+            })
+        boards_list.append(board_info)
+
+    boards_list.sort(key=lambda x: x["name"].lower())
+    open_boards = [b for b in boards_list if not b["closed"]]
+    closed_boards = [b for b in boards_list if b["closed"]]
+    return {
+        "all_boards": boards_list,
+        "open_boards": open_boards,
+        "closed_boards": closed_boards,
+        "total_boards": len(all_boards),
+        "total_open": len(open_boards),
+        "total_closed": len(closed_boards),
+        "total_monitored": len([b for b in boards_list if b["monitored"]]),
+        "total_unmonitored": len([b for b in boards_list if not b["monitored"]]),
+        "last_updated": dt_util.now(),
+    }
+
+
+def legacy_board_attributes(board: dict[str, Any]) -> dict[str, Any]:
+    """Return the board sensor attributes, parsing every due date on each read."""
+    now = dt_util.now()
+    total_cards = 0
+    overdue_cards = 0
+    due_soon_cards = 0
+
+    for list_data in board.get("lists", {}).values():
+        if list_data.get("closed", False):
+            continue
+        open_cards = [c for c in list_data.get("cards", []) if not c.get("closed", False)]
+        total_cards += len(open_cards)
+
+        for card in open_cards:
+            if card.get("due") and not card.get("due_complete"):
+                try:
+                    due_date = dt_util.parse_datetime(card["due"])
+                    if due_date is not None:
+                        if due_date < now:
+                            overdue_cards += 1
+                        elif (due_date - now).total_seconds() <= 7 * 86400:
+                            due_soon_cards += 1
+                except (ValueError, TypeError):
+                    pass
+
+    return {
+        "board_id": board.get("id"),
+        "board_url": board.get("url"),
+        "closed": board.get("closed", False),
+        "total_cards": total_cards,
+        "overdue_cards": overdue_cards,
+        "due_soon_cards": due_soon_cards,
+        "lists": [
+            {
+                "id": list_id,
+                "name": list_data.get("name"),
+                "card_count": len([
+                    c for c in list_data.get("cards", [])
+                    if not c.get("closed", False)
+                ]),
+            }
+            for list_id, list_data in board.get("lists", {}).items()
+            if not list_data.get("closed", False)
+        ],
+        "last_updated": dt_util.now(),
+    }
+
+
+def legacy_list_value(list_data: dict[str, Any]) -> int:
+    """Return the list sensor state, filtering the open cards on each read."""
+    return len([c for c in list_data.get("cards", []) if not c.get("closed", False)])
+
+
+def legacy_list_attributes(board: dict[str, Any], list_data: dict[str, Any]) -> dict[str, Any]:
+    """Return the list sensor attributes, filtering the open cards again."""
+    open_cards = [c for c in list_data.get("cards", []) if not c.get("closed", False)]
+    return {
+        "board_id": board.get("id"),
+        "board_name": board.get("name"),
+        "list_id": list_data.get("id"),
+        "closed": list_data.get("closed", False),
+        "cards": open_cards,
+        "last_updated": dt_util.now(),
+    }
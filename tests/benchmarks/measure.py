@@ -0,0 +1,59 @@
+"""Measurement helpers for the benchmarks."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+import tracemalloc
+
+from ..fake_trello import FakeTrello
+
+
+@dataclass
+class Measurement:
+    """Wall time, peak traced memory and requests of a measured block."""
+
+    seconds: float = 0.0
+    peak_bytes: int = 0
+    requests: int = 0
+
+    @property
+    def peak_mib(self) -> float:
+        """Return the peak traced memory in MiB."""
+        return self.peak_bytes / 1024 / 1024
+
+
+@contextmanager
+def measure(fake: FakeTrello | None = None, memory: bool = False) -> Iterator[Measurement]:
+    """Measure a block, counting the requests the fake server received during it.
+
+    Tracing memory slows Python down several times over, so wall times of a
+    block measured with memory=True are not comparable to those without.
+    The fake server runs in the same process, so its allocations count too.
+    """
+    result = Measurement()
+    if fake is not None:
+        fake.reset_counts()
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result.seconds = time.perf_counter() - started
+        if memory:
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if fake is not None:
+            result.requests = fake.total_requests
+
+
+def timed(function, repeat: int) -> float:
+    """Return the fastest of repeat calls of function, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
@@ -0,0 +1,133 @@
+"""CPU benchmark of the per-update sensor cost on a 10k-card workspace."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.trello.const import DOMAIN
+from custom_components.trello.index import build_index
+from custom_components.trello.model import normalize_board
+from custom_components.trello.sensor import (
+    TrelloAccountSensor,
+    TrelloBoardSensor,
+    TrelloListSensor,
+)
+
+from ..fake_trello import FakeTrello
+from .legacy import (
+    legacy_account_attributes,
+    legacy_board,
+    legacy_board_attributes,
+    legacy_list_attributes,
+    legacy_list_value,
+)
+from .measure import timed
+
+pytestmark = pytest.mark.benchmark
+
+# 10 boards of 10 lists of 100 cards
+BOARDS, LISTS, CARDS = 10, 10, 100
+REPEAT = 5
+
+
+@pytest.fixture(scope="module")
+def snapshots() -> dict[str, dict]:
+    """Return the nested snapshots of a 10k-card workspace."""
+    fake = FakeTrello.generate(boards=BOARDS, lists=LISTS, cards=CARDS)
+    return {board_id: fake.board_snapshot(board_id) for board_id in fake.boards}
+
+
+def _all_boards(snapshots: dict[str, dict]) -> list[dict]:
+    return [
+        {key: snapshot[key] for key in ("id", "name", "url", "closed")}
+        for snapshot in snapshots.values()
+    ]
+
+
+def test_sensor_update_cost(snapshots: dict[str, dict], report) -> None:
+    """Compare an update of every sensor before and after the precomputed index.
+
+    Before, every update wrote every sensor, and each sensor walked its cards,
+    parsing every due date on the board sensors. Now the coordinator builds
+    the index once per refresh and only sensors whose fingerprint changed
+    read their state. Each update here changes one card on one board.
+    """
+    board_ids = list(snapshots)
+    all_boards = _all_boards(snapshots)
+    changed_id = board_ids[0]
+    changed = {**snapshots[changed_id], "cards": list(snapshots[changed_id]["cards"])}
+    changed["cards"][0] = {**changed["cards"][0], "name": "Renamed"}
+
+    legacy_data = {
+        "all_boards": all_boards,
+        "boards": {board_id: legacy_board(snapshot) for board_id, snapshot in snapshots.items()},
+    }
+
+    def legacy_update() -> None:
+        legacy_data["boards"][changed_id] = legacy_board(changed)
+        legacy_account_attributes(legacy_data, board_ids)
+        for board in legacy_data["boards"].values():
+            legacy_board_attributes(board)
+            for list_data in board["lists"].values():
+                legacy_list_value(list_data)
+                legacy_list_attributes(board, list_data)
+
+    boards = {board_id: normalize_board(snapshot) for board_id, snapshot in snapshots.items()}
+    versions = [
+        {"all_boards": all_boards, "boards": boards},
+        {"all_boards": all_boards, "boards": {**boards, changed_id: normalize_board(changed)}},
+    ]
+    coordinator = SimpleNamespace(
+        data=versions[0],
+        board_ids=board_ids,
+        index=build_index(versions[0], board_ids),
+        last_update_success=True,
+    )
+    entry = MockConfigEntry(domain=DOMAIN, title="Benchmark")
+    sensors = [TrelloAccountSensor(coordinator, entry)]
+    for board_id, board in boards.items():
+        sensors.append(TrelloBoardSensor(coordinator, entry, board_id))
+        sensors.extend(
+            TrelloListSensor(coordinator, entry, board_id, list_id) for list_id in board.lists
+        )
+    fingerprints = {sensor: sensor._data_fingerprint() for sensor in sensors}
+    written = []
+
+    def read_all() -> None:
+        for sensor in sensors:
+            sensor.native_value
+            sensor.extra_state_attributes
+
+    def index_build() -> None:
+        coordinator.data = versions[len(written) % 2]
+        coordinator.index = build_index(coordinator.data, board_ids)
+        written.append(0)
+
+    def index_update() -> None:
+        index_build()
+        # What each sensor's coordinator update handler does
+        for sensor in sensors:
+            current = sensor._data_fingerprint()
+            if current == fingerprints[sensor]:
+                continue
+            fingerprints[sensor] = current
+            sensor.native_value
+            sensor.extra_state_attributes
+            written[-1] += 1
+
+    legacy_seconds = timed(legacy_update, REPEAT)
+    build_seconds = timed(index_build, REPEAT)
+    read_seconds = timed(read_all, REPEAT)
+    update_seconds = timed(index_update, REPEAT)
+
+    report("legacy update", sensors=len(sensors), seconds=legacy_seconds)
+    report("index build", seconds=build_seconds)
+    report("index reads of every sensor", sensors=len(sensors), seconds=read_seconds)
+    report("index update", written=written[-1], seconds=update_seconds)
+    assert coordinator.index.board_summary(board_ids[1]).total_cards == LISTS * CARDS
+    # Only the list holding the renamed card shows anything that changed
+    assert written[-1] == 1
+    assert read_seconds < legacy_seconds
+    assert update_seconds < legacy_seconds
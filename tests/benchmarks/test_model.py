@@ -0,0 +1,106 @@
+"""Memory benchmark of the card model against the dict tree it replaced."""
+from __future__ import annotations
+
+from datetime import timedelta
+import gc
+import tracemalloc
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.trello import TrelloDataUpdateCoordinator
+from custom_components.trello.api import TrelloApiClient
+from custom_components.trello.model import normalize_board
+
+from ..fake_trello import API_KEY, API_TOKEN, FakeTrello
+from .legacy import legacy_board
+
+pytestmark = pytest.mark.benchmark
+
+WORKSPACES = [
+    pytest.param(10, 10, 100, id="10x10x100"),
+    pytest.param(20, 10, 250, id="20x10x250"),
+]
+
+
+def _retained(build) -> tuple[object, int, int]:
+    """Return what build returned, the bytes it still holds and the peak while building."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+@pytest.mark.parametrize(("boards", "lists", "cards"), WORKSPACES)
+def test_retained_memory(boards: int, lists: int, cards: int, report) -> None:
+    """Compare the memory held for a workspace by the model and by the old dicts.
+
+    Both are built from the same decoded snapshots, so strings taken over
+    from the payload unchanged are shared and not counted on either side.
+    """
+    fake = FakeTrello.generate(boards=boards, lists=lists, cards=cards)
+    snapshots = [fake.board_snapshot(board_id) for board_id in fake.boards]
+
+    legacy, legacy_bytes, legacy_peak = _retained(
+        lambda: [legacy_board(snapshot) for snapshot in snapshots]
+    )
+    model, model_bytes, model_peak = _retained(
+        lambda: [normalize_board(snapshot) for snapshot in snapshots]
+    )
+
+    total = boards * lists * cards
+    report("legacy dicts", cards=total, mib=legacy_bytes / 2**20, peak_mib=legacy_peak / 2**20)
+    report("model", cards=total, mib=model_bytes / 2**20, peak_mib=model_peak / 2**20)
+    report("per card", legacy_bytes=legacy_bytes // total, model_bytes=model_bytes // total)
+    assert len(legacy) == len(model) == boards
+    assert model_bytes < legacy_bytes / 2
+
+
+@pytest.mark.parametrize(
+    "workspace", [pytest.param({"boards": 10, "lists": 10, "cards": 100}, id="10x10x100")]
+)
+async def test_client_cache_memory(hass: HomeAssistant, fake_trello: FakeTrello, report) -> None:
+    """Compare the memory the API client's response cache holds after refreshes with the model's.
+
+    The cache is measured by emptying it after a cold refresh and a refresh
+    from the actions feeds, and counting what that frees.
+    """
+    client = TrelloApiClient(
+        async_get_clientsession(hass), API_KEY, API_TOKEN, base_url=fake_trello.url
+    )
+    coordinator = TrelloDataUpdateCoordinator(
+        hass, client=client, boards=list(fake_trello.boards), update_interval=timedelta(minutes=5)
+    )
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await coordinator.async_refresh()
+        for board_id in fake_trello.boards:
+            fake_trello.update_card(fake_trello.board_cards(board_id)[0], name="Renamed")
+        coordinator.scheduler.poll_all()
+        await coordinator.async_refresh()
+        gc.collect()
+        with_cache, _ = tracemalloc.get_traced_memory()
+        entries = len(client.cache)
+        client.cache._entries.clear()
+        gc.collect()
+        without_cache, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    await coordinator.async_shutdown()
+    assert coordinator.last_update_success
+
+    snapshots = [fake_trello.board_snapshot(board_id) for board_id in fake_trello.boards]
+    _, model_bytes, _ = _retained(lambda: [normalize_board(snapshot) for snapshot in snapshots])
+    cache_bytes = with_cache - without_cache
+    report("client cache", entries=entries, mib=cache_bytes / 2**20)
+    report("model", mib=model_bytes / 2**20)
+    assert cache_bytes < model_bytes / 10
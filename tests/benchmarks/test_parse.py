@@ -0,0 +1,106 @@
+"""Benchmark of event loop blocking while a large board snapshot is decoded."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterator
+import multiprocessing
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.trello.api import TrelloApiClient
+from custom_components.trello.model import BOARD_SNAPSHOT_PARAMS
+
+from ..fake_trello import API_KEY, API_TOKEN, FakeTrello
+
+pytestmark = pytest.mark.benchmark
+
+REPEAT = 5
+WORKSPACE = {"boards": 1, "lists": 10, "cards": 1000, "description_length": 512}
+
+
+def _serve(workspace: dict[str, int], started: multiprocessing.Queue) -> None:
+    """Serve a fake workspace until terminated, reporting its URL and boards."""
+
+    async def serve() -> None:
+        fake = FakeTrello.generate(**workspace)
+        started.put((await fake.start(), list(fake.boards)))
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+@pytest.fixture
+def served_board(socket_enabled: None) -> Iterator[tuple[str, str]]:
+    """Serve one board of 10k cards from another process and return its URL and id.
+
+    Encoding a response, like decoding one, holds the GIL, so a fake server
+    in this process, even on another thread, would stall the loop itself.
+    """
+    context = multiprocessing.get_context("spawn")
+    started = context.Queue()
+    process = context.Process(target=_serve, args=(WORKSPACE, started), daemon=True)
+    process.start()
+    try:
+        url, board_ids = started.get(timeout=60)
+        yield url, board_ids[0]
+    finally:
+        process.terminate()
+        process.join()
+        started.close()
+        started.join_thread()
+
+
+async def _longest_stall(awaitable: Awaitable) -> float:
+    """Return the longest time the loop could not run a 1 ms heartbeat during awaitable."""
+    stalls = [0.0]
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await awaitable
+    finally:
+        done.set()
+        await task
+    return max(stalls)
+
+
+async def _stalls(session, url: str, board_id: str, inline: bool) -> float:
+    """Return the shortest of the longest stalls over a few fetches of the snapshot."""
+    stalls = []
+    for _ in range(REPEAT):
+        # A fresh client each time, so the parse count starts from zero
+        client = TrelloApiClient(session, API_KEY, API_TOKEN, base_url=url)
+        stalls.append(
+            await _longest_stall(client.get(f"/boards/{board_id}", BOARD_SNAPSHOT_PARAMS))
+        )
+        assert client.stats["executor_parses"] == (0 if inline else 1)
+    return min(stalls)
+
+
+async def test_decode_blocking(
+    hass: HomeAssistant, served_board: tuple[str, str], report
+) -> None:
+    """Measure the longest event loop stall while fetching a multi-megabyte snapshot."""
+    url, board_id = served_board
+    session = async_get_clientsession(hass)
+
+    # Inline, every body is decoded on the loop whatever its size
+    with patch("custom_components.trello.api.PARSE_INLINE_MAX_BYTES", 2**40):
+        inline = await _stalls(session, url, board_id, inline=True)
+    executor = await _stalls(session, url, board_id, inline=False)
+
+    report("inline decode", longest_stall_ms=inline * 1000)
+    report("executor decode", longest_stall_ms=executor * 1000)
+    assert executor < inline / 2
@@ -0,0 +1,200 @@
+"""Benchmarks of refreshes and sensor attributes as the workspace grows."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from custom_components.trello import TrelloDataUpdateCoordinator
+from custom_components.trello.api import TrelloApiClient
+from custom_components.trello.const import DEFAULT_PARALLEL_FETCHES, DOMAIN
+from custom_components.trello.sensor import (
+    TrelloAccountSensor,
+    TrelloBoardSensor,
+    TrelloListSensor,
+)
+
+from ..fake_trello import API_KEY, API_TOKEN, FakeTrello
+from .legacy import legacy_fetch
+from .measure import measure, timed
+
+pytestmark = pytest.mark.benchmark
+
+WORKSPACES = [
+    pytest.param({"boards": 10, "lists": 6, "cards": 20}, id="10x6x20"),
+    pytest.param({"boards": 50, "lists": 6, "cards": 20}, id="50x6x20"),
+]
+
+# Round trip added to every request by the fake server
+LATENCY = 0.02
+
+
+async def _new_coordinator(
+    hass: HomeAssistant, fake: FakeTrello, parallel_fetches: int = DEFAULT_PARALLEL_FETCHES
+) -> TrelloDataUpdateCoordinator:
+    """Return a coordinator with a fresh client, so nothing is cached."""
+    client = TrelloApiClient(async_get_clientsession(hass), API_KEY, API_TOKEN, base_url=fake.url)
+    return TrelloDataUpdateCoordinator(
+        hass,
+        client=client,
+        boards=list(fake.boards),
+        update_interval=timedelta(minutes=5),
+        parallel_fetches=parallel_fetches,
+    )
+
+
+@pytest.mark.parametrize("workspace", WORKSPACES)
+async def test_cold_refresh(hass: HomeAssistant, fake_trello: FakeTrello, report) -> None:
+    """Measure a first refresh against one fetching a board at a time, with its memory."""
+    fake_trello.latency = LATENCY
+    boards = len(fake_trello.boards)
+
+    coordinator = await _new_coordinator(hass, fake_trello, parallel_fetches=1)
+    with measure(fake_trello) as sequential:
+        await coordinator.async_refresh()
+    assert len(coordinator.data["boards"]) == boards
+
+    coordinator = await _new_coordinator(hass, fake_trello)
+    with measure(fake_trello) as timing:
+        await coordinator.async_refresh()
+    assert len(coordinator.data["boards"]) == boards
+
+    coordinator = await _new_coordinator(hass, fake_trello)
+    with measure(memory=True) as memory:
+        await coordinator.async_refresh()
+
+    report("sequential refresh", seconds=sequential.seconds, requests=sequential.requests)
+    report(
+        "cold refresh",
+        seconds=timing.seconds,
+        requests=timing.requests,
+        peak_mib=memory.peak_mib,
+    )
+    # One snapshot per board plus the account's boards
+    assert timing.requests == sequential.requests == boards + 1
+    # Four fetches at a time overlap their round trips. Decoding and
+    # normalizing each board still runs on the loop, so the gain is under 4x.
+    assert timing.seconds < sequential.seconds / 1.5
+
+
+@pytest.mark.parametrize(
+    "workspace", [pytest.param({"boards": 10, "lists": 15, "cards": 10}, id="10x15x10")]
+)
+async def test_snapshot_against_legacy_fetch(
+    hass: HomeAssistant, fake_trello: FakeTrello, report
+) -> None:
+    """Compare a first refresh with the old board, lists and per-list cards requests."""
+    fake_trello.latency = LATENCY
+    boards = len(fake_trello.boards)
+    lists = len(fake_trello.board_lists(next(iter(fake_trello.boards))))
+
+    coordinator = await _new_coordinator(hass, fake_trello)
+    with measure(fake_trello) as legacy:
+        await legacy_fetch(coordinator.client, list(fake_trello.boards))
+    coordinator = await _new_coordinator(hass, fake_trello)
+    with measure(fake_trello) as snapshot:
+        await coordinator.async_refresh()
+
+    report("legacy fetch", seconds=legacy.seconds, requests=legacy.requests)
+    report("snapshots", seconds=snapshot.seconds, requests=snapshot.requests)
+    assert legacy.requests == 1 + boards * (2 + lists)
+    assert snapshot.requests == 1 + boards
+    assert snapshot.seconds < legacy.seconds
+
+
+@pytest.mark.parametrize("workspace", WORKSPACES)
+async def test_incremental_refresh(
+    hass: HomeAssistant, fake_trello: FakeTrello, report
+) -> None:
+    """Measure a full refresh after a card changed on every fifth board."""
+    fake_trello.latency = LATENCY
+    coordinator = await _new_coordinator(hass, fake_trello)
+    await coordinator.async_refresh()
+
+    changed = list(fake_trello.boards)[::5]
+    for board_id in changed:
+        fake_trello.update_card(fake_trello.board_cards(board_id)[0], name="Renamed")
+    coordinator.scheduler.poll_all()
+
+    with measure(fake_trello) as timing:
+        await coordinator.async_refresh()
+
+    report("changed boards", seconds=timing.seconds, requests=timing.requests)
+    for board_id in changed:
+        names = {
+            card.name for l in coordinator.data["boards"][board_id].lists.values() for card in l.cards
+        }
+        assert "Renamed" in names
+    # Idle boards are skipped; each changed one reads its actions and one batch
+    assert timing.requests == 1 + 2 * len(changed)
+
+
+@pytest.mark.parametrize("workspace", WORKSPACES)
+async def test_sensor_attributes(
+    hass: HomeAssistant, setup_integration, fake_trello: FakeTrello, report
+) -> None:
+    """Measure computing the state and attributes of every sensor once."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+    ]
+
+    results = {}
+    for sensor_class in (TrelloAccountSensor, TrelloBoardSensor, TrelloListSensor):
+        sensors = [entity for entity in entities if type(entity) is sensor_class]
+        assert sensors
+
+        def compute(sensors=sensors) -> None:
+            for sensor in sensors:
+                sensor.native_value
+                sensor.extra_state_attributes
+
+        results[sensor_class.__name__] = (len(sensors), timed(compute, repeat=5))
+
+    report(
+        "coordinator",
+        refresh_s=coordinator.timings.last("refresh"),
+        index_s=coordinator.timings.last("index"),
+        normalize_s=coordinator.timings.last("normalize"),
+    )
+    for name, (count, seconds) in results.items():
+        report(name, sensors=count, seconds=seconds, per_sensor_us=seconds / count * 1e6)
+    # Attributes come from the index, so even the largest workspace stays well
+    # within a single event loop iteration budget
+    assert sum(seconds for _, seconds in results.values()) < 0.5
+
+
+@pytest.mark.parametrize("workspace", WORKSPACES)
+async def test_refresh_under_faults(
+    hass: HomeAssistant, fake_trello: FakeTrello, report
+) -> None:
+    """Measure a first refresh while Trello rate limits and fails requests."""
+    fake_trello.latency = LATENCY
+    fake_trello.error_rate = 0.1
+    fake_trello.error_status = 503
+    fake_trello.fail_next(429)
+    coordinator = await _new_coordinator(hass, fake_trello)
+
+    with measure(fake_trello) as timing:
+        await coordinator.async_refresh()
+
+    stats = coordinator.client.stats
+    report(
+        "faults",
+        seconds=timing.seconds,
+        requests=timing.requests,
+        retried=stats["requests_retried"],
+        rate_limited=stats["rate_limited"],
+    )
+    assert coordinator.last_update_success
+    # The 429 empties the client's token bucket, so the requests after it are
+    # paced at the rate limit and dominate the wall time
+    assert stats["rate_limited"] == 1
+    # Retries recover every board short of one failing four times in a row
+    assert len(coordinator.data["boards"]) >= len(fake_trello.boards) - 1
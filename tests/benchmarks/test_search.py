@@ -0,0 +1,81 @@
+"""Benchmark of trello.search_cards against a template scanning the sensors."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template
+
+from custom_components.trello.const import (
+    ATTR_DUE,
+    ATTR_MEMBER,
+    DOMAIN,
+    DUE_FILTER_OVERDUE,
+)
+from custom_components.trello.services import SERVICE_SEARCH_CARDS
+
+from ..fake_trello import FakeTrello
+from .measure import timed
+
+pytestmark = pytest.mark.benchmark
+
+MEMBER = "Member 0"
+REPEAT = 5
+
+# How the example dashboards find cards: every list sensor's cards attribute
+TEMPLATE_SCAN = """
+{%- set ns = namespace(cards=[]) -%}
+{%- for list_state in states.sensor if list_state.attributes.cards is defined -%}
+  {%- for card in list_state.attributes.cards -%}
+    {%- if member in card.members and card.due and not card.due_complete
+          and as_datetime(card.due) < now() -%}
+      {%- set ns.cards = ns.cards + [card.id] -%}
+    {%- endif -%}
+  {%- endfor -%}
+{%- endfor -%}
+{{ ns.cards | join(",") }}
+"""
+
+
+async def _search(hass: HomeAssistant) -> list[dict]:
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEARCH_CARDS,
+        {ATTR_MEMBER: MEMBER, ATTR_DUE: DUE_FILTER_OVERDUE},
+        blocking=True,
+        return_response=True,
+    )
+    return response["cards"]
+
+
+@pytest.mark.parametrize(
+    "workspace", [pytest.param({"boards": 10, "lists": 10, "cards": 100}, id="10x10x100")]
+)
+async def test_search_against_template_scan(
+    hass: HomeAssistant, setup_integration, fake_trello: FakeTrello, report
+) -> None:
+    """Compare finding a member's overdue cards with the service and with a template."""
+    template = Template(TEMPLATE_SCAN, hass)
+    scanned = template.async_render({"member": MEMBER}, parse_result=False)
+    scan_seconds = timed(
+        lambda: template.async_render({"member": MEMBER}, parse_result=False), REPEAT
+    )
+
+    # The first search after a refresh builds the index
+    started = time.perf_counter()
+    cards = await _search(hass)
+    first_seconds = time.perf_counter() - started
+    search_seconds = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        await _search(hass)
+        search_seconds = min(search_seconds, time.perf_counter() - started)
+
+    report("template scan", matches=len(cards), seconds=scan_seconds)
+    report("first search", seconds=first_seconds)
+    report("search", seconds=search_seconds)
+    assert cards
+    assert {card["id"] for card in cards} == set(scanned.split(","))
+    assert search_seconds < scan_seconds / 10
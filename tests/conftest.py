@@ -0,0 +1,137 @@
+"""Fixtures for the Trello integration tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from datetime import timedelta
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.trello import TrelloDataUpdateCoordinator
+from custom_components.trello.api import TrelloApiClient
+from custom_components.trello.const import CONF_API_KEY, CONF_API_TOKEN, CONF_BOARDS, DOMAIN
+
+from .fake_trello import API_KEY, API_TOKEN, FakeTrello
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option that runs the benchmarks."""
+    parser.addoption(
+        "--benchmark", action="store_true", default=False, help="run the benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmarks unless they were asked for."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff() -> Iterator[None]:
+    """Keep retry delays short."""
+    with patch("custom_components.trello.api.BACKOFF_BASE", 0.01):
+        yield
+
+
+@pytest.fixture
+def workspace() -> dict[str, Any]:
+    """Return the size of the synthetic workspace, overridden by parametrizing it."""
+    return {"boards": 3, "lists": 4, "cards": 10}
+
+
+@pytest.fixture
+async def fake_trello(
+    workspace: dict[str, Any], socket_enabled: None
+) -> AsyncIterator[FakeTrello]:
+    """Serve a synthetic workspace from a local fake Trello API."""
+    fake = FakeTrello.generate(**workspace)
+    await fake.start()
+    yield fake
+    await fake.stop()
+
+
+@pytest.fixture
+async def client(hass: HomeAssistant, fake_trello: FakeTrello) -> TrelloApiClient:
+    """Return an API client talking to the fake Trello API."""
+    return TrelloApiClient(
+        async_get_clientsession(hass), API_KEY, API_TOKEN, base_url=fake_trello.url
+    )
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, client: TrelloApiClient, fake_trello: FakeTrello
+) -> AsyncIterator[TrelloDataUpdateCoordinator]:
+    """Return a coordinator for every board of the workspace, without a config entry."""
+    coordinator = TrelloDataUpdateCoordinator(
+        hass,
+        client=client,
+        boards=list(fake_trello.boards),
+        update_interval=timedelta(minutes=5),
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+def entry_options() -> dict[str, Any]:
+    """Return the options of the config entry, overridden by parametrizing it."""
+    return {}
+
+
+@pytest.fixture
+def config_entry(
+    hass: HomeAssistant, fake_trello: FakeTrello, entry_options: dict[str, Any]
+) -> MockConfigEntry:
+    """Return a config entry monitoring every board of the workspace."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trello Test",
+        data={
+            CONF_API_KEY: API_KEY,
+            CONF_API_TOKEN: API_TOKEN,
+            CONF_BOARDS: list(fake_trello.boards),
+        },
+        options=entry_options,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def api_base(fake_trello: FakeTrello) -> Iterator[None]:
+    """Point the API clients the integration creates at the fake Trello API."""
+    with patch(
+        "custom_components.trello.api.TrelloApiClient",
+        partial(TrelloApiClient, base_url=fake_trello.url),
+    ):
+        yield
+
+
+@pytest.fixture
+async def setup_integration(
+    hass: HomeAssistant, config_entry: MockConfigEntry, api_base: None
+) -> AsyncIterator[MockConfigEntry]:
+    """Set up the config entry against the fake Trello API and unload it afterwards."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield config_entry
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
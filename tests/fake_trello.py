@@ -0,0 +1,576 @@
+"""A local stand-in for the Trello REST API.
+
+FakeTrello holds a synthetic workspace of boards, lists and cards and serves
+the parts of the Trello API the integration uses from an aiohttp server on
+127.0.0.1. Changes made through the API or through the helper methods are
+recorded as board actions, as Trello records them, so the actions feed and
+webhooks can be exercised. Latency, errors and rate limiting can be injected,
+and every request is counted per route.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from datetime import UTC, datetime, timedelta
+import hashlib
+import itertools
+import json
+import random
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.trello.model import BOARD_SNAPSHOT_PARAMS
+
+API_KEY = "test-key"
+API_TOKEN = "test-token"
+
+MEMBER_ME = {"id": "5f0000000000000000000001", "username": "tester", "fullName": "Test User"}
+
+WORDS = (
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+)
+LABELS = ("Bug", "Feature", "Urgent", "Chore", "Design", "Blocked")
+LIST_NAMES = ("Backlog", "To Do", "Doing", "Review", "Blocked", "Done")
+
+# Position gap Trello leaves between cards
+POSITION_STEP = 16384
+
+
+def _date(value: datetime) -> str:
+    """Format a date the way Trello returns it."""
+    return value.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class FakeTrello:
+    """Synthetic Trello workspace served over HTTP."""
+
+    def __init__(self, seed: int = 0) -> None:
+        """Initialize an empty workspace."""
+        self.random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self.boards: dict[str, dict[str, Any]] = {}
+        self.lists: dict[str, dict[str, Any]] = {}
+        self.cards: dict[str, dict[str, Any]] = {}
+        self.members: dict[str, dict[str, Any]] = {}
+        # Newest first, per board
+        self.actions: dict[str, list[dict[str, Any]]] = {}
+        self.webhooks: dict[str, dict[str, Any]] = {}
+
+        # Fault injection
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.error_status = 500
+        self.retry_after = "0"
+        self._faults: deque[int] = deque()
+        self._path_faults: dict[str, int] = {}
+        self._path_holds: dict[str, asyncio.Event] = {}
+
+        # Requests per route, e.g. "GET /1/boards/{board_id}", and GETs
+        # packed into /batch requests
+        self.requests: Counter[str] = Counter()
+        self.batched: Counter[str] = Counter()
+        self.not_modified = 0
+
+        self.server: TestServer | None = None
+
+    # Workspace generation
+
+    def new_id(self) -> str:
+        """Return a fresh id. Ids sort in creation order, like Trello's."""
+        return f"{next(self._ids):024x}"
+
+    @classmethod
+    def generate(
+        cls,
+        boards: int = 3,
+        lists: int = 4,
+        cards: int = 10,
+        members: int = 8,
+        description_length: int = 80,
+        seed: int = 0,
+    ) -> FakeTrello:
+        """Return a workspace of boards × lists × cards with varied card fields."""
+        fake = cls(seed)
+        for index in range(members):
+            member_id = fake.new_id()
+            fake.members[member_id] = {
+                "id": member_id,
+                "username": f"member{index}",
+                "fullName": f"Member {index}",
+            }
+        for board_index in range(boards):
+            board_id = fake.add_board(f"Board {board_index}")
+            for list_index in range(lists):
+                list_id = fake.add_list(
+                    board_id, LIST_NAMES[list_index % len(LIST_NAMES)], record=False
+                )
+                for card_index in range(cards):
+                    fake.add_card(
+                        list_id,
+                        description_length=description_length,
+                        record=False,
+                        pos=(card_index + 1) * POSITION_STEP,
+                    )
+        return fake
+
+    def add_board(self, name: str) -> str:
+        """Add an open board with every member on it."""
+        board_id = self.new_id()
+        self.boards[board_id] = {
+            "id": board_id,
+            "name": name,
+            "url": f"https://trello.com/b/{board_id[-8:]}",
+            "closed": False,
+            "dateLastActivity": _date(datetime.now(UTC)),
+        }
+        self.actions[board_id] = []
+        return board_id
+
+    def add_list(self, board_id: str, name: str, record: bool = True) -> str:
+        """Add an open list at the right end of a board."""
+        list_id = self.new_id()
+        positions = [l["pos"] for l in self.lists.values() if l["idBoard"] == board_id]
+        self.lists[list_id] = {
+            "id": list_id,
+            "name": name,
+            "closed": False,
+            "pos": max(positions, default=0) + POSITION_STEP,
+            "idBoard": board_id,
+        }
+        if record:
+            self._record(board_id, "createList", list=self._list_ref(list_id))
+        return list_id
+
+    def add_card(
+        self,
+        list_id: str,
+        name: str | None = None,
+        description_length: int = 80,
+        record: bool = True,
+        **fields: Any,
+    ) -> str:
+        """Add an open card at the bottom of a list, with random fields unless given."""
+        board_id = self.lists[list_id]["idBoard"]
+        card_id = self.new_id()
+        rng = self.random
+        now = datetime.now(UTC)
+        due = None
+        if rng.random() < 0.6:
+            due = _date(now + timedelta(hours=rng.uniform(-24 * 14, 24 * 30)))
+        card = {
+            "id": card_id,
+            "name": name or " ".join(rng.choices(WORDS, k=3)).capitalize(),
+            "url": f"https://trello.com/c/{card_id[-8:]}",
+            "closed": False,
+            "due": due,
+            "dueComplete": due is not None and rng.random() < 0.2,
+            "desc": "".join(rng.choices("abcdefghij ", k=description_length)),
+            "labels": [
+                {"id": f"label-{label}", "name": label, "color": "green"}
+                for label in rng.sample(LABELS, rng.randint(0, 2))
+            ],
+            "idMembers": rng.sample(sorted(self.members), min(len(self.members), rng.randint(0, 2))),
+            "badges": {
+                "checkItems": (items := rng.randint(0, 6)),
+                "checkItemsChecked": rng.randint(0, items),
+                "attachments": rng.randint(0, 2),
+                "comments": rng.randint(0, 3),
+            },
+            "idList": list_id,
+            "idBoard": board_id,
+            # Looking up the bottom scans every card, so generated ones bring their own
+            "pos": fields["pos"] if "pos" in fields else self._bottom(list_id),
+            "dateLastActivity": _date(now),
+        }
+        card.update(fields)
+        self.cards[card_id] = card
+        if record:
+            self._record(board_id, "createCard", card=self._card_ref(card_id), list=self._list_ref(list_id))
+        return card_id
+
+    # Changes made by other Trello users
+
+    def update_card(self, card_id: str, **changes: Any) -> dict[str, Any]:
+        """Change card fields, recording an updateCard action with the old values."""
+        card = self.cards[card_id]
+        if changes.get("pos") in ("top", "bottom"):
+            list_id = changes.get("idList", card["idList"])
+            changes["pos"] = self._top(list_id) if changes["pos"] == "top" else self._bottom(list_id)
+        old = {key: card.get(key) for key in changes if card.get(key) != changes[key]}
+        card.update(changes)
+        card["dateLastActivity"] = _date(datetime.now(UTC))
+        data: dict[str, Any] = {"card": self._card_ref(card_id), "old": old}
+        if "idList" in old:
+            data["listBefore"] = self._list_ref(old["idList"])
+            data["listAfter"] = self._list_ref(card["idList"])
+        self._record(card["idBoard"], "updateCard", **data)
+        return card
+
+    def move_card(self, card_id: str, list_id: str, pos: str = "bottom") -> dict[str, Any]:
+        """Move a card to another list of its board."""
+        return self.update_card(card_id, idList=list_id, pos=pos)
+
+    def archive_card(self, card_id: str) -> dict[str, Any]:
+        """Archive a card."""
+        return self.update_card(card_id, closed=True)
+
+    def delete_card(self, card_id: str) -> None:
+        """Delete a card."""
+        card = self.cards.pop(card_id)
+        self._record(card["idBoard"], "deleteCard", card={"id": card_id}, list=self._list_ref(card["idList"]))
+
+    def comment_card(self, card_id: str, text: str) -> None:
+        """Comment on a card."""
+        card = self.cards[card_id]
+        card["badges"]["comments"] += 1
+        self._record(card["idBoard"], "commentCard", card=self._card_ref(card_id), text=text)
+
+    def update_list(self, list_id: str, **changes: Any) -> None:
+        """Rename, archive or restore a list."""
+        trello_list = self.lists[list_id]
+        old = {key: trello_list.get(key) for key in changes}
+        trello_list.update(changes)
+        self._record(trello_list["idBoard"], "updateList", list=self._list_ref(list_id), old=old)
+
+    def rename_board(self, board_id: str, name: str) -> None:
+        """Rename a board."""
+        old = self.boards[board_id]["name"]
+        self.boards[board_id]["name"] = name
+        self._record(board_id, "updateBoard", old={"name": old})
+
+    def board_cards(self, board_id: str, closed: bool = False) -> list[str]:
+        """Return the ids of a board's cards on open lists, open ones unless closed is set."""
+        return [
+            card_id
+            for card_id, card in self.cards.items()
+            if card["idBoard"] == board_id
+            and card["closed"] == closed
+            and not self.lists[card["idList"]]["closed"]
+        ]
+
+    def board_lists(self, board_id: str) -> list[str]:
+        """Return the ids of a board's open lists in board order."""
+        return [
+            list_id
+            for list_id, trello_list in sorted(self.lists.items(), key=lambda item: item[1]["pos"])
+            if trello_list["idBoard"] == board_id and not trello_list["closed"]
+        ]
+
+    def board_snapshot(self, board_id: str) -> dict[str, Any]:
+        """Return the nested snapshot the coordinator requests, without a server."""
+        return self._board_body(
+            board_id, {key: str(value) for key, value in BOARD_SNAPSHOT_PARAMS.items()}
+        )[1]
+
+    def _record(self, board_id: str, action_type: str, **data: Any) -> dict[str, Any]:
+        """Record an action on a board and bump its last activity."""
+        now = _date(datetime.now(UTC))
+        action = {
+            "id": self.new_id(),
+            "type": action_type,
+            "date": now,
+            "data": {"board": self._board_ref(board_id), **data},
+            "memberCreator": {"id": MEMBER_ME["id"], "fullName": MEMBER_ME["fullName"]},
+        }
+        self.actions[board_id].insert(0, action)
+        self.boards[board_id]["dateLastActivity"] = now
+        return action
+
+    def _board_ref(self, board_id: str) -> dict[str, Any]:
+        board = self.boards[board_id]
+        return {"id": board_id, "name": board["name"]}
+
+    def _list_ref(self, list_id: str) -> dict[str, Any]:
+        return {"id": list_id, "name": self.lists[list_id]["name"]}
+
+    def _card_ref(self, card_id: str) -> dict[str, Any]:
+        card = self.cards[card_id]
+        return {"id": card_id, "name": card["name"], "idList": card["idList"]}
+
+    def _positions(self, list_id: str) -> list[float]:
+        return [c["pos"] for c in self.cards.values() if c["idList"] == list_id and not c["closed"]]
+
+    def _top(self, list_id: str) -> float:
+        return min(self._positions(list_id), default=POSITION_STEP * 2) / 2
+
+    def _bottom(self, list_id: str) -> float:
+        return max(self._positions(list_id), default=0) + POSITION_STEP
+
+    # Fault injection
+
+    def fail_next(self, *statuses: int) -> None:
+        """Answer the next requests with the given statuses, one each."""
+        self._faults.extend(statuses)
+
+    def fail_path(self, path: str, status: int | None) -> None:
+        """Answer every request for a path, e.g. /1/boards/<id>, with a status, or stop doing so."""
+        if status is None:
+            self._path_faults.pop(path, None)
+        else:
+            self._path_faults[path] = status
+
+    def hold_path(self, path: str) -> asyncio.Event:
+        """Hold every request for a path until the returned event is set."""
+        return self._path_holds.setdefault(path, asyncio.Event())
+
+    def _fault(self, path: str) -> int | None:
+        """Return the status to fail the current request with, if any."""
+        if path in self._path_faults:
+            return self._path_faults[path]
+        if self._faults:
+            return self._faults.popleft()
+        if self.error_rate and self.random.random() < self.error_rate:
+            return self.error_status
+        return None
+
+    # Request counting
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of HTTP requests received."""
+        return sum(self.requests.values())
+
+    def reset_counts(self) -> None:
+        """Forget the requests counted so far."""
+        self.requests.clear()
+        self.batched.clear()
+        self.not_modified = 0
+
+    # Server
+
+    @property
+    def url(self) -> str:
+        """Return the API base URL to hand to TrelloApiClient."""
+        assert self.server is not None
+        return str(self.server.make_url("/1"))
+
+    async def start(self) -> str:
+        """Start serving on a free local port and return the API base URL."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/1/members/me", self._handle_me)
+        app.router.add_get("/1/members/me/boards", self._handle_my_boards)
+        app.router.add_get("/1/boards/{board_id}", self._handle_board)
+        app.router.add_get("/1/boards/{board_id}/actions", self._handle_actions)
+        app.router.add_get("/1/boards/{board_id}/lists", self._handle_board_lists)
+        app.router.add_get("/1/boards/{board_id}/cards", self._handle_board_cards)
+        app.router.add_get("/1/boards/{board_id}/customFields", self._handle_custom_fields)
+        app.router.add_get("/1/lists/{list_id}/cards", self._handle_list_cards)
+        app.router.add_get("/1/cards/{card_id}", self._handle_card)
+        app.router.add_post("/1/cards", self._handle_create_card)
+        app.router.add_put("/1/cards/{card_id}", self._handle_update_card)
+        app.router.add_get("/1/batch", self._handle_batch)
+        app.router.add_get("/1/tokens/{token}/webhooks", self._handle_webhooks)
+        app.router.add_post("/1/webhooks", self._handle_create_webhook)
+        app.router.add_delete("/1/webhooks/{webhook_id}", self._handle_delete_webhook)
+        self.server = TestServer(app, host="127.0.0.1")
+        await self.server.start_server()
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self.server is not None:
+            await self.server.close()
+            self.server = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Count the request, then apply latency, holds, faults, auth and ETags."""
+        self.requests[f"{request.method} {request.match_info.route.resource.canonical}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if (hold := self._path_holds.get(request.path)) is not None:
+            await hold.wait()
+        if (status := self._fault(request.path)) is not None:
+            headers = {"Retry-After": self.retry_after} if status == 429 else {}
+            return web.json_response({"message": "injected"}, status=status, headers=headers)
+        if request.query.get("key") != API_KEY or request.query.get("token") != API_TOKEN:
+            return web.Response(status=401, text="invalid key")
+
+        response = await handler(request)
+        if request.method == "GET" and isinstance(response, web.Response) and response.status == 200:
+            etag = f'"{hashlib.md5(response.body).hexdigest()}"'
+            if request.headers.get("If-None-Match") == etag:
+                self.not_modified += 1
+                return web.Response(status=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+        return response
+
+    # Resources, shared by the HTTP handlers and /batch
+
+    def _get(self, path: str, query: dict[str, str]) -> tuple[int, Any]:
+        """Return (status, body) of a GET, as /batch evaluates each of its URLs."""
+        parts = path.strip("/").split("/")
+        if parts[:1] == ["cards"] and len(parts) == 2:
+            return self._card_body(parts[1], query)
+        if parts[:1] == ["boards"] and len(parts) == 3 and parts[2] == "customFields":
+            return (200, []) if parts[1] in self.boards else (404, None)
+        if parts[:1] == ["boards"] and len(parts) == 2:
+            return self._board_body(parts[1], query)
+        return 404, None
+
+    def _board_body(self, board_id: str, query: dict[str, str]) -> tuple[int, Any]:
+        """Return a board, with nested lists, cards, members and actions as asked."""
+        board = self.boards.get(board_id)
+        if board is None:
+            return 404, None
+        body = {key: board[key] for key in ("id", "name", "url", "closed")}
+        if "lists" in query:
+            body["lists"] = self._lists(board_id, query["lists"])
+        if "cards" in query:
+            body["cards"] = self._cards(board_id, query["cards"])
+        if "members" in query:
+            body["members"] = list(self.members.values())
+        if "actions" in query:
+            limit = int(query.get("actions_limit", 50))
+            body["actions"] = [{"id": a["id"]} for a in self.actions[board_id][:limit]]
+        return 200, body
+
+    def _lists(self, board_id: str, list_filter: str) -> list[dict[str, Any]]:
+        return [
+            {key: value for key, value in trello_list.items() if key != "idBoard"}
+            for trello_list in self.lists.values()
+            if trello_list["idBoard"] == board_id
+            and (list_filter != "open" or not trello_list["closed"])
+        ]
+
+    def _cards(self, board_id: str, card_filter: str) -> list[dict[str, Any]]:
+        return [
+            card
+            for card in self.cards.values()
+            if card["idBoard"] == board_id and (card_filter != "open" or not card["closed"])
+        ]
+
+    def _card_body(self, card_id: str, query: dict[str, str]) -> tuple[int, Any]:
+        card = self.cards.get(card_id)
+        if card is None:
+            return 404, None
+        body = dict(card)
+        if "checklists" in query:
+            body["checklists"] = []
+        if "customFieldItems" in query:
+            body["customFieldItems"] = []
+        if query.get("actions") == "commentCard":
+            body["actions"] = [
+                action
+                for action in self.actions[card["idBoard"]]
+                if action["type"] == "commentCard" and action["data"]["card"]["id"] == card_id
+            ][: int(query.get("actions_limit", 50))]
+        return 200, body
+
+    # HTTP handlers
+
+    async def _handle_me(self, request: web.Request) -> web.Response:
+        return web.json_response(MEMBER_ME)
+
+    async def _handle_my_boards(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.boards.values()))
+
+    async def _handle_board(self, request: web.Request) -> web.Response:
+        status, body = self._board_body(request.match_info["board_id"], dict(request.query))
+        return web.json_response(body, status=status)
+
+    async def _handle_actions(self, request: web.Request) -> web.Response:
+        board_id = request.match_info["board_id"]
+        if board_id not in self.boards:
+            return web.json_response(None, status=404)
+        since = request.query.get("since")
+        limit = int(request.query.get("limit", 50))
+        actions = [a for a in self.actions[board_id] if since is None or a["id"] > since]
+        return web.json_response(actions[:limit])
+
+    async def _handle_board_lists(self, request: web.Request) -> web.Response:
+        board_id = request.match_info["board_id"]
+        return web.json_response(self._lists(board_id, request.query.get("filter", "all")))
+
+    async def _handle_board_cards(self, request: web.Request) -> web.Response:
+        board_id = request.match_info["board_id"]
+        return web.json_response(self._cards(board_id, request.query.get("filter", "open")))
+
+    async def _handle_custom_fields(self, request: web.Request) -> web.Response:
+        status, body = self._get(f"/boards/{request.match_info['board_id']}/customFields", {})
+        return web.json_response(body, status=status)
+
+    async def _handle_list_cards(self, request: web.Request) -> web.Response:
+        list_id = request.match_info["list_id"]
+        return web.json_response(
+            sorted(
+                (c for c in self.cards.values() if c["idList"] == list_id and not c["closed"]),
+                key=lambda card: card["pos"],
+            )
+        )
+
+    async def _handle_card(self, request: web.Request) -> web.Response:
+        status, body = self._card_body(request.match_info["card_id"], dict(request.query))
+        return web.json_response(body, status=status)
+
+    async def _handle_create_card(self, request: web.Request) -> web.Response:
+        query = request.query
+        if query.get("idList") not in self.lists:
+            return web.json_response({"message": "invalid list"}, status=400)
+        card_id = self.add_card(
+            query["idList"],
+            name=query.get("name", ""),
+            desc=query.get("desc", ""),
+            due=query.get("due"),
+            labels=[],
+            idMembers=[],
+        )
+        if query.get("pos") == "top":
+            self.cards[card_id]["pos"] = self._top(query["idList"])
+        return web.json_response(self.cards[card_id])
+
+    async def _handle_update_card(self, request: web.Request) -> web.Response:
+        card_id = request.match_info["card_id"]
+        if card_id not in self.cards:
+            return web.json_response({"message": "card not found"}, status=404)
+        changes: dict[str, Any] = {}
+        for key, value in request.query.items():
+            if key in ("closed", "dueComplete"):
+                changes[key] = value == "true"
+            elif key in ("name", "desc", "due", "idList", "pos"):
+                changes[key] = value
+        return web.json_response(self.update_card(card_id, **changes))
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        urls = request.query.get("urls", "").split(",")
+        if len(urls) > 10:
+            return web.json_response({"message": "too many urls"}, status=400)
+        results = []
+        for url in urls:
+            split = urlsplit(url)
+            self.batched[split.path.rsplit("/", 1)[0]] += 1
+            status, body = self._get(split.path, dict(parse_qsl(split.query)))
+            if status == 200:
+                results.append({"200": body})
+            else:
+                results.append({"name": "NotFound", "message": "not found", "statusCode": status})
+        return web.json_response(results)
+
+    async def _handle_webhooks(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.webhooks.values()))
+
+    async def _handle_create_webhook(self, request: web.Request) -> web.Response:
+        hook_id = self.new_id()
+        self.webhooks[hook_id] = {
+            "id": hook_id,
+            "callbackURL": request.query["callbackURL"],
+            "idModel": request.query["idModel"],
+            "description": request.query.get("description", ""),
+        }
+        return web.json_response(self.webhooks[hook_id])
+
+    async def _handle_delete_webhook(self, request: web.Request) -> web.Response:
+        if self.webhooks.pop(request.match_info["webhook_id"], None) is None:
+            return web.json_response(None, status=404)
+        return web.json_response({})
+
+    def webhook_payload(self, action: dict[str, Any]) -> bytes:
+        """Return the body Trello delivers to a webhook for a board action."""
+        board_id = action["data"]["board"]["id"]
+        return json.dumps(
+            {"model": self._board_ref(board_id), "action": action}, separators=(",", ":")
+        ).encode()
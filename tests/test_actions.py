@@ -0,0 +1,179 @@
+"""Tests for applying board actions to snapshots instead of refetching boards."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from custom_components.trello import TrelloDataUpdateCoordinator
+from custom_components.trello.model import (
+    ACTIONS_PAGE_LIMIT,
+    BOARD_SNAPSHOT_PARAMS,
+    collect_changes,
+    normalize_board,
+)
+
+from .fake_trello import FakeTrello
+
+SNAPSHOT = "GET /1/boards/{board_id}"
+
+
+def _first_board(fake: FakeTrello) -> str:
+    return next(iter(fake.boards))
+
+
+def _card(fake: FakeTrello, index: int = 0) -> str:
+    return fake.board_cards(_first_board(fake))[index]
+
+
+def test_card_actions_refresh_the_card(fake_trello: FakeTrello) -> None:
+    """Test updates, comments and new cards refresh only the cards involved."""
+    board_id = _first_board(fake_trello)
+    list_id = fake_trello.board_lists(board_id)[0]
+    fake_trello.update_card(_card(fake_trello, 0), name="Renamed")
+    fake_trello.comment_card(_card(fake_trello, 1), "Looks good")
+    new_card = fake_trello.add_card(list_id)
+
+    changes = collect_changes(fake_trello.actions[board_id])
+
+    assert changes.refresh_cards == {_card(fake_trello, 0), _card(fake_trello, 1), new_card}
+    assert not changes.remove_cards
+    assert not changes.refresh_lists
+    assert not changes.needs_full_sync
+    assert changes.last_action_id == fake_trello.actions[board_id][0]["id"]
+
+
+def test_last_card_action_decides_its_fate(fake_trello: FakeTrello) -> None:
+    """Test a card updated then deleted is removed, not refreshed."""
+    board_id = _first_board(fake_trello)
+    card_id = _card(fake_trello)
+    fake_trello.update_card(card_id, name="Renamed")
+    fake_trello.delete_card(card_id)
+
+    changes = collect_changes(fake_trello.actions[board_id])
+
+    assert changes.remove_cards == {card_id}
+    assert not changes.refresh_cards
+
+
+def test_list_actions_refresh_the_lists(fake_trello: FakeTrello) -> None:
+    """Test creating, renaming and archiving lists re-reads the lists."""
+    board_id = _first_board(fake_trello)
+    first, second = fake_trello.board_lists(board_id)[:2]
+    fake_trello.add_list(board_id, "Blocked")
+    fake_trello.update_list(first, name="Inbox")
+    fake_trello.update_list(second, closed=True)
+
+    changes = collect_changes(fake_trello.actions[board_id])
+
+    assert changes.refresh_lists
+    assert not changes.needs_full_sync
+
+
+def test_restored_list_needs_a_full_sync(fake_trello: FakeTrello) -> None:
+    """Test restoring an archived list falls back to a full snapshot."""
+    board_id = _first_board(fake_trello)
+    list_id = fake_trello.board_lists(board_id)[0]
+    fake_trello.update_list(list_id, closed=True)
+    fake_trello.update_list(list_id, closed=False)
+
+    assert collect_changes(fake_trello.actions[board_id]).needs_full_sync
+
+
+def test_board_action_needs_a_full_sync(fake_trello: FakeTrello) -> None:
+    """Test an action that is not about a card or list falls back to a full snapshot."""
+    board_id = _first_board(fake_trello)
+    fake_trello.update_card(_card(fake_trello), name="Renamed")
+    fake_trello.rename_board(board_id, "Roadmap")
+
+    assert collect_changes(fake_trello.actions[board_id]).needs_full_sync
+
+
+def test_full_page_needs_a_full_sync(fake_trello: FakeTrello) -> None:
+    """Test a full page of actions falls back to a full snapshot, as older ones may be missing."""
+    board_id = _first_board(fake_trello)
+    card_id = _card(fake_trello)
+    for number in range(ACTIONS_PAGE_LIMIT):
+        fake_trello.comment_card(card_id, f"Comment {number}")
+
+    assert collect_changes(fake_trello.actions[board_id]).needs_full_sync
+
+
+def _edit_cards(fake: FakeTrello, board_id: str) -> None:
+    cards = fake.board_cards(board_id)
+    fake.update_card(cards[0], name="Renamed", desc="New description")
+    fake.update_card(cards[1], due="2030-01-01T12:00:00.000Z", dueComplete=True)
+    fake.comment_card(cards[2], "Looks good")
+    fake.archive_card(cards[3])
+    fake.delete_card(cards[4])
+    fake.add_card(fake.board_lists(board_id)[1], name="Added")
+
+
+def _move_cards(fake: FakeTrello, board_id: str) -> None:
+    first, second = fake.board_lists(board_id)[:2]
+    cards = [card_id for card_id in fake.board_cards(board_id) if fake.cards[card_id]["idList"] == first]
+    fake.move_card(cards[0], second, pos="top")
+    fake.move_card(cards[1], second, pos="bottom")
+    fake.update_card(cards[-1], pos="top")
+    fake.update_card(cards[2], pos=(fake.cards[cards[4]]["pos"] + fake.cards[cards[5]]["pos"]) / 2)
+
+
+def _change_lists(fake: FakeTrello, board_id: str) -> None:
+    first, second = fake.board_lists(board_id)[:2]
+    fake.update_list(first, name="Inbox")
+    fake.update_list(second, closed=True)
+    list_id = fake.add_list(board_id, "Blocked")
+    fake.add_card(list_id, name="Stuck")
+
+
+def _restore_list(fake: FakeTrello, board_id: str) -> None:
+    list_id = fake.board_lists(board_id)[0]
+    fake.update_list(list_id, closed=True)
+    fake.update_list(list_id, closed=False)
+
+
+def _rename_board(fake: FakeTrello, board_id: str) -> None:
+    fake.update_card(fake.board_cards(board_id)[0], name="Renamed")
+    fake.rename_board(board_id, "Roadmap")
+
+
+@pytest.mark.parametrize(
+    ("mutate", "full_sync"),
+    [
+        pytest.param(_edit_cards, False, id="edit cards"),
+        pytest.param(_move_cards, False, id="move cards"),
+        pytest.param(_change_lists, False, id="change lists"),
+        pytest.param(_restore_list, True, id="restore list"),
+        pytest.param(_rename_board, True, id="rename board"),
+    ],
+)
+async def test_replayed_actions_match_a_snapshot(
+    coordinator: TrelloDataUpdateCoordinator,
+    fake_trello: FakeTrello,
+    mutate: Callable[[FakeTrello, str], None],
+    full_sync: bool,
+) -> None:
+    """Test a board patched from its actions equals a freshly normalized snapshot."""
+    await coordinator.async_refresh()
+    board_id = _first_board(fake_trello)
+    mutate(fake_trello, board_id)
+    fake_trello.reset_counts()
+    coordinator.scheduler.poll_all()
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert (fake_trello.requests[SNAPSHOT] == 1) is full_sync
+    expected = normalize_board(
+        await coordinator.client.get(f"/boards/{board_id}", BOARD_SNAPSHOT_PARAMS)
+    )
+    board = coordinator.data["boards"][board_id]
+    assert board == expected
+    # Equality ignores dict order, so compare the list and card order separately
+    assert [
+        (list_id, [card.id for card in trello_list.cards])
+        for list_id, trello_list in board.lists.items()
+    ] == [
+        (list_id, [card.id for card in trello_list.cards])
+        for list_id, trello_list in expected.lists.items()
+    ]
@@ -0,0 +1,105 @@
+"""Tests for the Trello API client and the clients shared by config entries."""
+from __future__ import annotations
+
+import logging
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import SOURCE_USER, ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.trello.api import TrelloApiClient, TrelloApiError
+from custom_components.trello.const import (
+    CONF_API_KEY,
+    CONF_API_TOKEN,
+    CONF_BOARDS,
+    DATA_CLIENTS,
+    DOMAIN,
+)
+
+from .fake_trello import API_KEY, API_TOKEN, FakeTrello
+
+
+def _add_entry(hass: HomeAssistant, boards: list[str]) -> MockConfigEntry:
+    """Add an entry with the fake's credentials monitoring some boards."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_KEY: API_KEY, CONF_API_TOKEN: API_TOKEN, CONF_BOARDS: boards},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_entries_share_a_client_until_the_last_unloads(
+    hass: HomeAssistant, fake_trello: FakeTrello, api_base: None
+) -> None:
+    """Test entries with the same key and token share a client that goes with the last one."""
+    first_board, second_board = list(fake_trello.boards)[:2]
+    first = _add_entry(hass, [first_board])
+    second = _add_entry(hass, [second_board])
+    # Setting up the integration sets up both entries
+    assert await hass.config_entries.async_setup(first.entry_id)
+    await hass.async_block_till_done()
+    assert second.state is ConfigEntryState.LOADED
+
+    client = hass.data[DOMAIN][first.entry_id].client
+    assert hass.data[DOMAIN][second.entry_id].client is client
+    assert hass.data[DATA_CLIENTS] == {(API_KEY, API_TOKEN): client}
+
+    await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+    assert hass.data[DATA_CLIENTS] == {(API_KEY, API_TOKEN): client}
+
+    await hass.config_entries.async_unload(second.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_CLIENTS not in hass.data
+
+
+async def test_failed_setup_releases_the_client(
+    hass: HomeAssistant, fake_trello: FakeTrello, api_base: None
+) -> None:
+    """Test an entry that is not ready yet leaves no client behind."""
+    fake_trello.fail_path("/1/members/me", 503)
+    entry = _add_entry(hass, list(fake_trello.boards))
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert DATA_CLIENTS not in hass.data
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_config_flow_does_not_cache_clients(
+    hass: HomeAssistant, fake_trello: FakeTrello, api_base: None
+) -> None:
+    """Test checking credentials in the config flow leaves no client behind."""
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_API_KEY: API_KEY, CONF_API_TOKEN: API_TOKEN}
+    )
+
+    assert result["step_id"] == "boards"
+    assert DATA_CLIENTS not in hass.data
+    hass.config_entries.flow.async_abort(result["flow_id"])
+
+
+async def test_errors_and_logs_do_not_show_the_token(
+    client: TrelloApiClient, fake_trello: FakeTrello, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing request on a token path names the path without the token."""
+    fake_trello.fail_path(f"/1/tokens/{API_TOKEN}/webhooks", 503)
+    caplog.set_level(logging.DEBUG, logger="custom_components.trello.api")
+
+    with pytest.raises(TrelloApiError) as err:
+        await client.get(f"/tokens/{API_TOKEN}/webhooks")
+
+    assert str(err.value) == "Trello API returned status 503 for /tokens/{token}/webhooks"
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "custom_components.trello.api"
+    ]
+    assert messages
+    assert all(message.startswith("Retrying GET /tokens/{token}/webhooks") for message in messages)
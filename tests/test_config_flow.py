@@ -0,0 +1,62 @@
+"""Tests for the Trello options flow."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.trello.const import CONF_BOARDS, DOMAIN
+
+from .fake_trello import FakeTrello
+
+ACCOUNT_BOARDS = "GET /1/members/me/boards"
+
+
+async def test_first_save_with_only_boards_changed_does_not_reload(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test a first options save that only changes the boards keeps the entry loaded."""
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    kept = list(fake_trello.boards)[:2]
+    assert not entry.options
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {CONF_BOARDS: kept}
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    # The form filled in every other option with its default
+    assert len(entry.options) > 1
+    reload.assert_not_called()
+    assert hass.data[DOMAIN][entry.entry_id] is coordinator
+    assert coordinator.board_ids == kept
+    assert set(coordinator.data["boards"]) == set(kept)
+
+
+async def test_options_flow_fetches_boards_again_after_an_error(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test a failed board fetch is tried again when the form is shown next."""
+    entry = setup_integration
+    fake_trello.fail_path("/1/members/me/boards", 503)
+    fake_trello.reset_counts()
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["errors"] == {"base": "cannot_connect"}
+
+    fake_trello.fail_path("/1/members/me/boards", None)
+    fake_trello.reset_counts()
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_BOARDS: []}
+    )
+
+    assert result["errors"] == {CONF_BOARDS: "no_boards_selected"}
+    assert fake_trello.requests[ACCOUNT_BOARDS] == 1
+    hass.config_entries.options.async_abort(result["flow_id"])
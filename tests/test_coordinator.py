@@ -0,0 +1,180 @@
+"""Tests for refreshing Trello data against the fake Trello API."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.trello import TrelloDataUpdateCoordinator
+from custom_components.trello.api import TrelloApiError
+from custom_components.trello.const import DOMAIN
+from custom_components.trello.model import normalize_board
+from custom_components.trello.sensor import TrelloSensor
+
+from .fake_trello import FakeTrello
+
+SNAPSHOT = "GET /1/boards/{board_id}"
+ACCOUNT_BOARDS = "GET /1/members/me/boards"
+
+
+async def test_refresh_fetches_one_snapshot_per_board(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test a first refresh costs one request per board plus the account boards."""
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert fake_trello.requests == {ACCOUNT_BOARDS: 1, SNAPSHOT: 3}
+    assert set(coordinator.data["boards"]) == set(fake_trello.boards)
+    for board_id, board in coordinator.data["boards"].items():
+        assert list(board.lists) == fake_trello.board_lists(board_id)
+        assert sum(len(l.cards) for l in board.lists.values()) == 40
+
+
+async def test_refresh_skips_idle_boards(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test boards without new activity are not fetched again."""
+    await coordinator.async_refresh()
+    fake_trello.reset_counts()
+    coordinator.scheduler.poll_all()
+
+    await coordinator.async_refresh()
+
+    assert fake_trello.requests == {ACCOUNT_BOARDS: 1}
+
+
+async def test_refresh_caches_only_the_account_boards(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test snapshots, actions pages and batches are not kept in the response cache."""
+    await coordinator.async_refresh()
+    board_id = next(iter(fake_trello.boards))
+    fake_trello.update_card(fake_trello.board_cards(board_id)[0], name="Renamed")
+    coordinator.scheduler.poll_all()
+    fake_trello.reset_counts()
+
+    await coordinator.async_refresh()
+
+    assert fake_trello.requests == {
+        ACCOUNT_BOARDS: 1, "GET /1/boards/{board_id}/actions": 1, "GET /1/batch": 1
+    }
+    assert {path for path, _ in coordinator.client.cache._entries} == {"/members/me/boards"}
+
+
+async def test_rate_limited_request_is_retried(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test a 429 pauses the client and the request is sent again."""
+    fake_trello.fail_next(429)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert len(coordinator.data["boards"]) == 3
+    assert coordinator.client.stats["rate_limited"] == 1
+    assert coordinator.client.stats["requests_retried"] == 1
+
+
+async def test_failing_board_keeps_the_others(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test a board that keeps failing does not fail the refresh."""
+    failing = next(iter(fake_trello.boards))
+    fake_trello.fail_path(f"/1/boards/{failing}", 503)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert set(coordinator.data["boards"]) == set(fake_trello.boards) - {failing}
+    assert coordinator.client.stats["requests_retried"] == 3
+
+
+async def test_setup_creates_sensors(
+    hass: HomeAssistant, setup_integration, fake_trello: FakeTrello
+) -> None:
+    """Test setting up an entry creates account, board and list sensors."""
+    entry = setup_integration
+    assert entry.state is ConfigEntryState.LOADED
+
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_account")
+    state = hass.states.get(entity_id)
+    assert state.state == "3"
+    assert state.attributes["total_monitored"] == 3
+
+    board_id, board = next(iter(fake_trello.boards.items()))
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_{board_id}")
+    state = hass.states.get(entity_id)
+    assert state.state == "4"
+    assert state.attributes["total_cards"] == 40
+
+    list_id = fake_trello.board_lists(board_id)[0]
+    entity_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{board_id}_{list_id}"
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == "10"
+    assert len(state.attributes["cards"]) == 10
+
+
+async def test_rejected_move_leaves_no_card_flow(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test a move shown before Trello rejected it is not recorded as a card move."""
+    await coordinator.async_refresh()
+    board_id = next(iter(fake_trello.boards))
+    card_id = fake_trello.board_cards(board_id)[0]
+    done_list = fake_trello.board_lists(board_id)[-1]
+    fake_trello.fail_path(f"/1/cards/{card_id}", 400)
+
+    with pytest.raises(TrelloApiError):
+        await coordinator.async_update_card(board_id, card_id, {"idList": done_list})
+
+    done_cards = coordinator.data["boards"][board_id].lists[done_list].cards
+    assert card_id not in {card.id for card in done_cards}
+    assert not coordinator.flow.moves
+    assert coordinator.flow.cycle_time(board_id) is None
+
+
+async def test_confirmed_move_is_recorded_once(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test a move is recorded from Trello's answer, not from the expected result."""
+    await coordinator.async_refresh()
+    board_id = next(iter(fake_trello.boards))
+    card_id = fake_trello.board_cards(board_id)[0]
+    done_list = fake_trello.board_lists(board_id)[-1]
+
+    await coordinator.async_update_card(board_id, card_id, {"idList": done_list})
+
+    assert [(move.card_id, move.to_list) for move in coordinator.flow.moves] == [
+        (card_id, done_list)
+    ]
+
+
+def test_sensors_must_fingerprint_their_data() -> None:
+    """Test a sensor that does not say what data it shows cannot be created."""
+
+    class UnfingerprintedSensor(TrelloSensor):
+        pass
+
+    with pytest.raises(TypeError, match="_data_fingerprint"):
+        UnfingerprintedSensor(None)
+
+
+async def test_large_responses_are_decoded_in_the_executor(
+    coordinator: TrelloDataUpdateCoordinator, fake_trello: FakeTrello
+) -> None:
+    """Test bodies over the inline limit decode to the same data in a worker thread."""
+    with patch("custom_components.trello.api.PARSE_INLINE_MAX_BYTES", 0):
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.client.stats["executor_parses"] == fake_trello.total_requests
+    for board_id, board in coordinator.data["boards"].items():
+        assert board == normalize_board(fake_trello.board_snapshot(board_id))
@@ -0,0 +1,27 @@
+"""Tests for the card flow history."""
+from __future__ import annotations
+
+from custom_components.trello.flow import THROUGHPUT_WINDOW, FlowTracker
+from custom_components.trello.model import normalize_board
+
+from .fake_trello import FakeTrello
+
+WINDOW = THROUGHPUT_WINDOW.total_seconds()
+
+
+def test_reading_throughput_leaves_the_history_alone(fake_trello: FakeTrello) -> None:
+    """Test completions leave the window when the board next changes, not when read."""
+    board_id = next(iter(fake_trello.boards))
+    done_list = fake_trello.board_lists(board_id)[-1]
+    tracker = FlowTracker()
+    tracker.update_board(normalize_board(fake_trello.board_snapshot(board_id)), 0)
+    fake_trello.move_card(fake_trello.board_cards(board_id)[0], done_list)
+
+    assert tracker.update_board(normalize_board(fake_trello.board_snapshot(board_id)), 10) == 1
+    assert tracker.throughput(board_id, 10) == 1
+    assert tracker.throughput(board_id, 10 + WINDOW + 1) == 0
+    assert tracker.throughput(board_id, 10) == 1
+
+    tracker.update_board(normalize_board(fake_trello.board_snapshot(board_id)), 10 + WINDOW + 1)
+    assert tracker.throughput(board_id, 10) == 0
+    assert tracker.cycle_time(board_id) == 10
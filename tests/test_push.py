@@ -0,0 +1,207 @@
+"""Tests for Trello webhook push updates."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.trello.const import (
+    CONF_API_SECRET,
+    CONF_PUSH_UPDATES,
+    DOMAIN,
+    PUSH_RECONCILE_INTERVAL,
+)
+from custom_components.trello.push import SIGNATURE_HEADER, compute_signature
+
+from .fake_trello import FakeTrello
+
+SECRET = "test-secret"
+EXTERNAL_URL = "https://example.com"
+
+
+@pytest.fixture
+def entry_options() -> dict:
+    """Enable push updates."""
+    return {CONF_PUSH_UPDATES: True, CONF_API_SECRET: SECRET}
+
+
+@pytest.fixture
+async def push_entry(hass: HomeAssistant, config_entry: MockConfigEntry, api_base: None):
+    """Set up an entry with push updates behind an external URL."""
+    await hass.config.async_update(external_url=EXTERNAL_URL)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield config_entry
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def _card_names(hass: HomeAssistant, entry: MockConfigEntry, board_id: str) -> set[str]:
+    """Return the names of the open cards the coordinator holds for a board."""
+    board = hass.data[DOMAIN][entry.entry_id].data["boards"][board_id]
+    return {card.name for trello_list in board.lists.values() for card in trello_list.cards}
+
+
+async def _wait_for(condition: Callable[[], bool]) -> None:
+    """Let the loop run until a condition holds."""
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def _deliver(client, entry: MockConfigEntry, body: bytes, signature: str | None = None):
+    """Post a webhook delivery, signed for the entry's callback URL unless given."""
+    path = f"/api/webhook/{entry.data[CONF_WEBHOOK_ID]}"
+    if signature is None:
+        signature = compute_signature(SECRET, body, f"{EXTERNAL_URL}{path}")
+    return await client.post(path, data=body, headers={SIGNATURE_HEADER: signature})
+
+
+def test_compute_signature() -> None:
+    """Test the signature matches HMAC-SHA1 of body and callback URL, base64 encoded."""
+    assert (
+        compute_signature(
+            "secret", b'{"action":{"id":"1"}}', "https://example.com/api/webhook/abc"
+        )
+        == "xZp1BO57Iif5UXV9HtofCVx3axc="
+    )
+
+
+async def test_setup_registers_a_webhook_per_board(
+    push_entry: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test every monitored board gets a webhook for the entry's callback URL."""
+    callback_url = f"{EXTERNAL_URL}/api/webhook/{push_entry.data[CONF_WEBHOOK_ID]}"
+    assert {hook["idModel"] for hook in fake_trello.webhooks.values()} == set(fake_trello.boards)
+    assert {hook["callbackURL"] for hook in fake_trello.webhooks.values()} == {callback_url}
+
+
+async def test_signed_delivery_patches_the_board(
+    hass: HomeAssistant, push_entry: MockConfigEntry, fake_trello: FakeTrello, hass_client_no_auth
+) -> None:
+    """Test a signed delivery applies the action without a board snapshot."""
+    client = await hass_client_no_auth()
+    board_id = next(iter(fake_trello.boards))
+    card_id = fake_trello.board_cards(board_id)[0]
+    fake_trello.update_card(card_id, name="Pushed name")
+    fake_trello.reset_counts()
+
+    response = await _deliver(
+        client, push_entry, fake_trello.webhook_payload(fake_trello.actions[board_id][0])
+    )
+    await hass.async_block_till_done()
+
+    assert response.status == 200
+    assert "Pushed name" in _card_names(hass, push_entry, board_id)
+    assert fake_trello.requests == {"GET /1/batch": 1}
+
+
+async def test_delivery_with_a_bad_signature_is_rejected(
+    hass: HomeAssistant, push_entry: MockConfigEntry, fake_trello: FakeTrello, hass_client_no_auth
+) -> None:
+    """Test a delivery signed with the wrong secret is ignored."""
+    client = await hass_client_no_auth()
+    board_id = next(iter(fake_trello.boards))
+    fake_trello.update_card(fake_trello.board_cards(board_id)[0], name="Forged name")
+    fake_trello.reset_counts()
+
+    response = await _deliver(
+        client,
+        push_entry,
+        fake_trello.webhook_payload(fake_trello.actions[board_id][0]),
+        signature=compute_signature("wrong", b"", ""),
+    )
+    await hass.async_block_till_done()
+
+    assert response.status == 401
+    assert "Forged name" not in _card_names(hass, push_entry, board_id)
+    assert fake_trello.total_requests == 0
+
+
+async def test_malformed_delivery_is_rejected(
+    hass: HomeAssistant, push_entry: MockConfigEntry, hass_client_no_auth
+) -> None:
+    """Test a correctly signed delivery without an action is refused."""
+    client = await hass_client_no_auth()
+
+    response = await _deliver(client, push_entry, b'{"model": {}}')
+
+    assert response.status == 400
+
+
+async def test_head_request_is_accepted(
+    hass: HomeAssistant, push_entry: MockConfigEntry, hass_client_no_auth
+) -> None:
+    """Test the HEAD request Trello sends before creating a webhook succeeds."""
+    client = await hass_client_no_auth()
+
+    response = await client.head(f"/api/webhook/{push_entry.data[CONF_WEBHOOK_ID]}")
+
+    assert response.status == 200
+
+
+async def test_deliveries_do_not_postpone_reconciliation(
+    hass: HomeAssistant, push_entry: MockConfigEntry, fake_trello: FakeTrello, hass_client_no_auth
+) -> None:
+    """Test deliveries leave the reconciliation poll where it was scheduled."""
+    coordinator = hass.data[DOMAIN][push_entry.entry_id]
+    client = await hass_client_no_auth()
+    board_id = next(iter(fake_trello.boards))
+    card_id = fake_trello.board_cards(board_id)[0]
+    scheduled = coordinator._unsub_refresh
+    assert scheduled is not None
+    fake_trello.reset_counts()
+
+    for number in range(3):
+        fake_trello.update_card(card_id, name=f"Pushed {number}")
+        await _deliver(
+            client, push_entry, fake_trello.webhook_payload(fake_trello.actions[board_id][0])
+        )
+        await hass.async_block_till_done()
+
+    assert "Pushed 2" in _card_names(hass, push_entry, board_id)
+    assert coordinator._unsub_refresh is scheduled
+    assert fake_trello.requests["GET /1/members/me/boards"] == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + PUSH_RECONCILE_INTERVAL)
+    await hass.async_block_till_done()
+
+    assert fake_trello.requests["GET /1/members/me/boards"] == 1
+
+
+async def test_push_during_a_refresh_is_kept(
+    hass: HomeAssistant, push_entry: MockConfigEntry, fake_trello: FakeTrello, hass_client_no_auth
+) -> None:
+    """Test a board pushed while other boards are still fetching survives the refresh."""
+    coordinator = hass.data[DOMAIN][push_entry.entry_id]
+    client = await hass_client_no_auth()
+    slow_board, pushed_board, _ = fake_trello.boards
+    card_id = fake_trello.board_cards(pushed_board)[0]
+    fake_trello.reset_counts()
+    release = fake_trello.hold_path(f"/1/boards/{slow_board}/actions")
+
+    hass.async_create_task(coordinator.async_request_full_refresh())
+    # Every board's actions feed was read, and only the slow board's is held
+    await _wait_for(lambda: fake_trello.requests["GET /1/boards/{board_id}/actions"] == 3)
+    fake_trello.update_card(card_id, name="Pushed name")
+    await _deliver(
+        client, push_entry, fake_trello.webhook_payload(fake_trello.actions[pushed_board][0])
+    )
+    await _wait_for(lambda: "Pushed name" in _card_names(hass, push_entry, pushed_board))
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert "Pushed name" in _card_names(hass, push_entry, pushed_board)
+    # The next refresh takes the pushed board from a full snapshot
+    fake_trello.reset_counts()
+    await coordinator.async_refresh()
+    assert "Pushed name" in _card_names(hass, push_entry, pushed_board)
+    assert fake_trello.requests["GET /1/boards/{board_id}"] == 1
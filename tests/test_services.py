@@ -0,0 +1,109 @@
+"""Tests for the Trello services."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.trello.const import (
+    ATTR_BOARD_ID,
+    ATTR_LIST_NAME,
+    DEFAULT_REFRESH_COOLDOWN,
+    DOMAIN,
+)
+from custom_components.trello.services import SERVICE_REFRESH, SERVICE_SEARCH_CARDS
+
+from .fake_trello import FakeTrello
+
+ACCOUNT_BOARDS = "GET /1/members/me/boards"
+BOARD_ACTIONS = "GET /1/boards/{board_id}/actions"
+
+
+async def _refresh(hass: HomeAssistant, times: int, **data) -> None:
+    """Call the refresh service several times at once."""
+    await asyncio.gather(
+        *(
+            hass.services.async_call(DOMAIN, SERVICE_REFRESH, data, blocking=True)
+            for _ in range(times)
+        )
+    )
+    await hass.async_block_till_done()
+
+
+async def test_rapid_refresh_calls_share_one_fetch(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test calls made while a refresh runs do not start another one."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    fake_trello.reset_counts()
+
+    with patch.object(
+        coordinator, "_async_update_data", wraps=coordinator._async_update_data
+    ) as update:
+        await _refresh(hass, 20)
+
+    # The client would also merge identical requests in flight, so count refreshes
+    assert update.call_count == 1
+    assert fake_trello.requests[ACCOUNT_BOARDS] == 1
+
+
+async def test_refresh_during_cooldown_runs_once_after_it(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test calls made during the cooldown are folded into one follow-up refresh."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    await _refresh(hass, 1)
+
+    with patch.object(
+        coordinator, "_async_update_data", wraps=coordinator._async_update_data
+    ) as update:
+        await _refresh(hass, 20)
+        assert update.call_count == 0
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_REFRESH_COOLDOWN + 1)
+        )
+        await hass.async_block_till_done()
+
+    assert update.call_count == 1
+
+
+async def test_rapid_board_refresh_calls_share_one_sync(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test refreshing one board several times at once syncs it once."""
+    board_id = next(iter(fake_trello.boards))
+    fake_trello.reset_counts()
+
+    await _refresh(hass, 20, **{ATTR_BOARD_ID: board_id})
+
+    assert fake_trello.requests == {BOARD_ACTIONS: 1}
+
+
+async def test_search_cards_follows_data_changes(
+    hass: HomeAssistant, setup_integration: MockConfigEntry, fake_trello: FakeTrello
+) -> None:
+    """Test the search index built by one search is rebuilt once the data changed."""
+    board_id = next(iter(fake_trello.boards))
+    list_id = fake_trello.board_lists(board_id)[0]
+
+    async def search() -> set[str]:
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SEARCH_CARDS,
+            {ATTR_LIST_NAME: fake_trello.lists[list_id]["name"], ATTR_BOARD_ID: board_id},
+            blocking=True,
+            return_response=True,
+        )
+        return {card["name"] for card in response["cards"]}
+
+    assert "Added" not in await search()
+    fake_trello.add_card(list_id, name="Added")
+    await _refresh(hass, 1, **{ATTR_BOARD_ID: board_id})
+
+    assert "Added" in await search()